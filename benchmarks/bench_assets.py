@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Brand asset size benchmark for panel_siemens_ix.
+
+Compares the bytes of the original logos and favicon with the optimized
+assets built by ``panel_siemens_ix.assets``, including what each page carries
+inline, and fails (exit code 1) when an asset is outdated or exceeds its
+byte-size budget.
+
+Run with:
+    python benchmarks/bench_assets.py
+"""
+
+import base64
+import sys
+
+from panel_siemens_ix.assets import (
+    ASSET_SOURCES,
+    SIZE_BUDGETS,
+    STATIC_DIR,
+    asset_path,
+    check_assets,
+    svg_data_uri,
+)
+
+
+def _base64_uri_size(path) -> int:
+    """Size of the base64 data URI pmui embeds for a file path."""
+    return len("data:image/svg+xml;base64,") + len(base64.b64encode(path.read_bytes()))
+
+
+def main() -> int:
+    """Print original and optimized sizes, returning 1 on a budget failure."""
+    print(f"{'asset':<18} {'original':>9} {'optimized':>10} {'budget':>7}")
+    for name, (source, _, _) in ASSET_SOURCES.items():
+        original = (STATIC_DIR / source).stat().st_size
+        optimized = asset_path(name).stat().st_size
+        print(f"{name:<18} {original:>9} {optimized:>10} {SIZE_BUDGETS[name]:>7}")
+
+    # Logos and favicon used to be embedded as base64 data URIs in every page
+    before = sum(
+        _base64_uri_size(STATIC_DIR / ASSET_SOURCES[name][0])
+        for name in ("logo-light", "logo-dark", "favicon")
+    )
+    # Now only the logos are inlined, the favicon is a cached request
+    after = sum(len(svg_data_uri(name)) for name in ("logo-light", "logo-dark"))
+    print(f"\nInline bytes per page: {before} -> {after} ({after / before:.0%})")
+
+    problems = check_assets()
+    for problem in problems:
+        print(f"Regression: {problem}", file=sys.stderr)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
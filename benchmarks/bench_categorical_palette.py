@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark large categorical palettes from ``get_categorical_palette``.
+
+Compares the previous extension beyond the 17 chart colors (hue rotations of
+three base colors) with the maximin OKLab selection used today, reporting the
+build time, the warm (memoized) call time and the minimum pairwise OKLab
+distance. Fails (exit code 1) when a palette has duplicate colors or a
+minimum pairwise distance below ``--min-distance``.
+
+Run with:
+    python benchmarks/bench_categorical_palette.py
+    python benchmarks/bench_categorical_palette.py --min-distance 0.05
+"""
+
+import argparse
+import sys
+import time
+import timeit
+
+from panel_siemens_ix.categorical import min_pairwise_distance
+from panel_siemens_ix.colors import (
+    _categorical_palette,
+    _generate_palette,
+    get_categorical_palette,
+    get_colors,
+)
+
+SIZES = (20, 40, 100, 200)
+
+
+def _legacy_palette(dark_theme: bool, n_colors: int):
+    """Previous extension beyond the chart colors, kept for comparison."""
+    colors = get_colors("dark" if dark_theme else "light")
+    palette = list(get_categorical_palette(dark_theme=dark_theme, n_colors=17))
+    if dark_theme:
+        bases = [colors.primary["main"], colors.chart["1"], colors.chart["4"]]
+    else:
+        bases = [colors.primary["main"], colors.chart["4"], colors.chart["7"]]
+    needed = n_colors - len(palette)
+    per_base = max(1, needed // len(bases))
+    generated = []
+    for base in bases:
+        if len(generated) < needed:
+            n_gen = min(per_base, needed - len(generated))
+            generated.extend(_generate_palette(base, n_colors=n_gen + 1)[1:n_gen + 1])
+    return (palette + generated[:needed])[:n_colors]
+
+
+def main() -> int:
+    """Run the benchmark, returning a non-zero exit code on regression."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--min-distance",
+        type=float,
+        default=0.05,
+        help="Required minimum pairwise OKLab distance",
+    )
+    args = parser.parse_args()
+
+    failures = []
+    header = f"{'mode':<6}{'n':>5}{'legacy min':>12}{'min dist':>10}{'build ms':>10}{'warm us':>9}"
+    print(header)
+    for dark_theme in (False, True):
+        mode = "dark" if dark_theme else "light"
+        for n in SIZES:
+            legacy = _legacy_palette(dark_theme, n)
+            _categorical_palette.cache_clear()
+            start = time.perf_counter()
+            palette = get_categorical_palette(dark_theme=dark_theme, n_colors=n)
+            build_ms = (time.perf_counter() - start) * 1000
+            warm_us = min(timeit.repeat(
+                lambda: get_categorical_palette(dark_theme=dark_theme, n_colors=n),
+                number=1000,
+                repeat=5,
+            )) * 1000
+            distance = min_pairwise_distance(palette)
+            print(
+                f"{mode:<6}{n:>5}{min_pairwise_distance(legacy):>12.3f}"
+                f"{distance:>10.3f}{build_ms:>10.1f}{warm_us:>9.1f}"
+            )
+            if len(palette) != n or len(set(palette)) != n:
+                failures.append(f"{mode} n={n} has {len(set(palette))} unique colors")
+            if distance < args.min_distance:
+                failures.append(
+                    f"{mode} n={n} minimum distance {distance:.3f} "
+                    f"(required {args.min_distance:.3f})"
+                )
+
+    for failure in failures:
+        print(f"Regression: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Benchmark palette lookups through ``get_colors``.
+
+Compares the previous behaviour (a fresh palette dataclass per call) with the
+interned, process-wide palettes returned by ``get_colors`` today.
+
+Run with:
+    python benchmarks/bench_get_colors.py
+"""
+
+import timeit
+
+from panel_siemens_ix.colors import (
+    SiemensIXDarkColors,
+    SiemensIXLightColors,
+    get_colors,
+)
+
+
+def _fresh_palette(mode: str = "light"):
+    """Previous ``get_colors`` implementation, kept for comparison."""
+    if mode not in ["light", "dark"]:
+        raise ValueError("Mode must be either 'light' or 'dark'")
+    return SiemensIXDarkColors() if mode == "dark" else SiemensIXLightColors()
+
+
+def _calls_per_second(func, number: int = 200_000, repeat: int = 5) -> float:
+    """Return the best observed calls/sec for ``func``."""
+    best = min(timeit.repeat(func, number=number, repeat=repeat))
+    return number / best
+
+
+def main():
+    """Run the benchmark and print calls/sec before and after."""
+    results = {
+        "before (fresh dataclass)": _calls_per_second(lambda: _fresh_palette("dark")),
+        "after (interned palette)": _calls_per_second(lambda: get_colors("dark")),
+    }
+    for name, rate in results.items():
+        print(f"{name:<28} {rate:>14,.0f} calls/sec")
+
+    speedup = results["after (interned palette)"] / results["before (fresh dataclass)"]
+    print(f"\nSpeedup: {speedup:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Import-time benchmark for panel_siemens_ix.
+
+Runs ``python -X importtime`` in fresh interpreters and fails (exit code 1)
+when importing the color modules pulls in Panel, panel_material_ui or NumPy,
+or when the cumulative import time exceeds its budget.
+
+Run with:
+    python benchmarks/bench_import.py
+    python benchmarks/bench_import.py --budget-ms 100
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+from typing import Dict, Tuple
+
+# Modules that must import without loading any of the heavy dependencies
+LIGHTWEIGHT_MODULES = ("panel_siemens_ix", "panel_siemens_ix.colors")
+HEAVY_DEPENDENCIES = ("panel", "panel_material_ui", "bokeh", "numpy")
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def import_times(module: str, repeat: int = 5) -> Tuple[float, Dict[str, int]]:
+    """
+    Measure the cumulative import time of ``module``.
+
+    Returns the best cumulative time in milliseconds over ``repeat`` fresh
+    interpreters, together with the ``-X importtime`` cumulative timings
+    (microseconds) of every module imported by the fastest run.
+    """
+    best_ms, best_modules = float("inf"), {}
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        modules = {}
+        for line in result.stderr.splitlines():
+            match = _IMPORTTIME_LINE.match(line)
+            if match:
+                modules[match.group(4)] = int(match.group(2))
+        top_level = module.split(".")[0]
+        total_ms = sum(
+            us for name, us in modules.items() if name == top_level
+        ) / 1000
+        if module != top_level:
+            total_ms = max(total_ms, modules.get(module, 0) / 1000)
+        if total_ms < best_ms:
+            best_ms, best_modules = total_ms, modules
+    return best_ms, best_modules
+
+
+def main() -> int:
+    """Run the benchmark, returning a non-zero exit code on regression."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=50.0,
+        help="Maximum cumulative import time per module in milliseconds",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    failures = []
+    for module in LIGHTWEIGHT_MODULES:
+        total_ms, modules = import_times(module, repeat=args.repeat)
+        heavy = sorted(
+            dep for dep in HEAVY_DEPENDENCIES if dep in modules
+        )
+        status = "ok"
+        if heavy:
+            status = "FAIL"
+            failures.append(f"{module} imports {', '.join(heavy)}")
+        if total_ms > args.budget_ms:
+            status = "FAIL"
+            failures.append(
+                f"{module} took {total_ms:.1f} ms (budget {args.budget_ms:.1f} ms)"
+            )
+        print(f"{module:<28} {total_ms:>8.1f} ms  {status}")
+
+    for failure in failures:
+        print(f"Regression: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
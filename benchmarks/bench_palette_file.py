@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Benchmark palette startup with and without the memory-mapped palette file.
+
+Each measurement runs in a fresh interpreter, like a newly started worker,
+and times building both packed palettes and the default continuous colormaps
+(``get_continuous_cmap`` and ``get_colormap`` sizes, sRGB and OKLab) after
+NumPy has been imported. Fails (exit code 1) when the shipped palette file is
+missing or outdated, in which case every worker falls back to computing.
+
+Run with:
+    python benchmarks/bench_palette_file.py
+    python benchmarks/bench_palette_file.py --runs 20
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+from panel_siemens_ix.palette_file import check_palette_file
+
+_STARTUP = """
+import time
+from pathlib import Path
+import numpy
+import panel_siemens_ix.palette_file as palette_file
+if {disable}:
+    palette_file.PALETTE_FILE = Path("/nonexistent")
+from panel_siemens_ix.colors import get_continuous_cmap, get_packed_colors
+start = time.perf_counter()
+for mode in ("light", "dark"):
+    get_packed_colors(mode).rgba
+for dark_theme in (False, True):
+    for space in ("srgb", "oklab"):
+        for n_colors in (128, 256):
+            get_continuous_cmap(dark_theme, n_colors, space, as_array=True)
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+def _startup_ms(disable: bool) -> float:
+    result = subprocess.run(
+        [sys.executable, "-c", _STARTUP.format(disable=disable)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(result.stdout)
+
+
+def main() -> int:
+    """Run the benchmark, returning a non-zero exit code on regression."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=10, help="Interpreters per variant")
+    args = parser.parse_args()
+
+    print(f"{'variant':<16}{'median ms':>11}{'min ms':>9}")
+    for label, disable in (("computed", True), ("palette file", False)):
+        times = [_startup_ms(disable) for _ in range(args.runs)]
+        print(f"{label:<16}{statistics.median(times):>11.2f}{min(times):>9.2f}")
+
+    problems = check_palette_file()
+    for problem in problems:
+        print(f"Regression: {problem}", file=sys.stderr)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Benchmark the resident memory of the time series dashboard's sensor data.
+
+Each variant runs in a fresh interpreter. It builds one year of minutely
+readings (by default) and the dashboard's rollup store, then touches every
+value, and reports the growth of resident memory (anonymous and file-backed,
+after returning freed heap memory to the OS) and of the peak RSS, which
+includes temporaries, over the interpreter after its imports:
+
+* float64: the original layout of ``generate_sensor_data``,
+* compact: float32 block and int64 epoch timestamps (``compact=True``),
+* compact, mmap: the compact layout saved with ``save_frame`` and
+  memory-mapped with ``load_frame``, whose pages are file-backed and shared
+  by all processes on the host.
+
+Reads ``/proc/self/status``, so it needs Linux.
+
+Run with:
+    python benchmarks/bench_sensor_memory.py
+    python benchmarks/bench_sensor_memory.py --days 90 --frequency 10s
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+EXAMPLES_DIR = Path(__file__).parent.parent / "examples" / "advanced"
+
+_MEASURE = """
+import ctypes, json, sys
+sys.path.insert(0, {examples!r})
+import numpy as np
+import pandas as pd
+from sensor_data import generate_sensor_data
+from timeseries_engine import RollupStore, load_frame
+
+def status():
+    # Return freed heap memory to the OS, so that only live data is counted
+    try:
+        ctypes.CDLL("libc.so.6").malloc_trim(0)
+    except (OSError, AttributeError):
+        pass
+    fields = {{}}
+    with open("/proc/self/status") as f:
+        for line in f:
+            key, _, value = line.partition(":")
+            if key in ("VmRSS", "VmHWM", "RssAnon", "RssFile"):
+                fields[key] = int(value.split()[0]) * 1024
+    return fields
+
+before = status()
+if {path!r}:
+    data = load_frame({path!r})
+else:
+    data = generate_sensor_data(days={days}, frequency={frequency!r}, compact={compact})
+store = RollupStore(data)
+# Touch every value, as the dashboard eventually does
+checksum = sum(float(np.nansum(data[c].to_numpy())) for c in store.columns)
+after = status()
+print(json.dumps({{
+    "rows": len(data),
+    "frame": int(data.memory_usage(deep=True).sum()),
+    "rss": after["VmRSS"] - before["VmRSS"],
+    "anon": after["RssAnon"] - before["RssAnon"],
+    "file": after["RssFile"] - before["RssFile"],
+    "peak": after["VmHWM"] - before["VmRSS"],
+}}))
+"""
+
+
+def _measure(days: int, frequency: str, compact: bool = False, path: str = "") -> dict:
+    code = _MEASURE.format(
+        examples=str(EXAMPLES_DIR), days=days, frequency=frequency, compact=compact, path=path
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def main() -> int:
+    """Run the benchmark and print the memory of every variant."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--days", type=int, default=365, help="Days of readings")
+    parser.add_argument("--frequency", default="min", help="Sampling frequency (pandas alias)")
+    args = parser.parse_args()
+
+    if not Path("/proc/self/status").exists():
+        print("This benchmark needs /proc/self/status (Linux)", file=sys.stderr)
+        return 1
+
+    sys.path.insert(0, str(EXAMPLES_DIR))
+    from sensor_data import generate_sensor_data
+    from timeseries_engine import save_frame
+
+    with tempfile.TemporaryDirectory() as tmp:
+        save_frame(generate_sensor_data(args.days, args.frequency, compact=True), tmp)
+        results = {
+            "float64": _measure(args.days, args.frequency),
+            "compact": _measure(args.days, args.frequency, compact=True),
+            "compact, mmap": _measure(args.days, args.frequency, path=tmp),
+        }
+
+    rows = next(iter(results.values()))["rows"]
+    print(f"{rows} rows ({args.days} days, frequency {args.frequency!r})\n")
+    print(f"{'variant':<16}{'frame MB':>10}{'RSS MB':>9}{'anon MB':>9}{'file MB':>9}{'peak MB':>9}")
+    for label, r in results.items():
+        print(
+            f"{label:<16}{r['frame'] / 2**20:>10.1f}{r['rss'] / 2**20:>9.1f}"
+            f"{r['anon'] / 2**20:>9.1f}{r['file'] / 2**20:>9.1f}{r['peak'] / 2**20:>9.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+Startup and palette benchmark suite, saved to JSON to track regressions.
+
+Benchmarks are written in the asv style: classes whose ``time_*`` methods are
+timed in-process (after an untimed ``setup``), with ``params``/``param_names``
+expanding them over a parameter grid, and whose ``timeraw_*`` methods return
+code, or ``(code, setup)``, timed in fresh interpreters, for cold imports and
+the first ``configure()`` of a process. The suite covers:
+
+* cold import of the package and of ``panel_siemens_ix.colors``,
+* the first ``configure()`` in a process, with and without its imports,
+  and warm ``configure()`` calls (what every session pays),
+* pages created with the configured defaults or from ``get_context()``,
+* ``create_theme``, cold and memoized, with and without overrides,
+* ``get_categorical_palette`` and ``get_continuous_cmap`` across sizes,
+  cold (caches cleared) and warm.
+
+Results (best and median seconds per call) are written to
+``benchmarks/results/<version>-<commit>.json``. With ``--compare`` the run
+fails (exit code 1) when a benchmark's median is slower than in the given
+results file by more than ``--threshold``.
+
+Run with:
+    python benchmarks/bench_suite.py
+    python benchmarks/bench_suite.py -k Palette --quick
+    python benchmarks/bench_suite.py --compare benchmarks/results/0.1.0-abc1234.json
+"""
+
+import argparse
+import datetime
+import itertools
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import panel_siemens_ix
+from panel_siemens_ix import (
+    clear_palette_caches,
+    configure,
+    create_theme,
+    get_categorical_palette,
+    get_context,
+    get_continuous_cmap,
+)
+from panel_siemens_ix.theme import _base_theme, _derived_theme
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+_OVERRIDES = {"palette": {"primary": {"main": "#ff0000"}}}
+
+
+class ImportSuite:
+    """Cold imports, each in a fresh interpreter."""
+
+    def timeraw_import_package(self):
+        return "import panel_siemens_ix"
+
+    def timeraw_import_colors(self):
+        return "import panel_siemens_ix.colors"
+
+
+class ConfigureSuite:
+    """What ``configure()`` costs per process and per session."""
+
+    def timeraw_first_configure(self):
+        # Panel and panel_material_ui already imported, as in a served app
+        return (
+            "panel_siemens_ix.configure()",
+            "import panel, panel_material_ui, panel_siemens_ix",
+        )
+
+    def timeraw_first_configure_with_imports(self):
+        return "import panel_siemens_ix; panel_siemens_ix.configure()"
+
+    def setup(self):
+        configure()
+        self.context = get_context()
+
+    def time_warm_configure(self):
+        configure()
+
+    def time_page_from_defaults(self):
+        import panel_material_ui as pmui
+
+        pmui.Page(title="Benchmark")
+
+    def time_page_from_context(self):
+        self.context.page(title="Benchmark")
+
+
+class ThemeSuite:
+    """``create_theme``, cold and memoized."""
+
+    params = [["light", "dark"]]
+    param_names = ["mode"]
+
+    def setup(self, mode):
+        create_theme(mode)
+        create_theme(mode, _OVERRIDES)
+
+    def time_create_theme_cold(self, mode):
+        _base_theme.cache_clear()
+        create_theme(mode)
+
+    def time_create_theme_warm(self, mode):
+        create_theme(mode)
+
+    def time_create_theme_overrides_cold(self, mode):
+        _derived_theme.cache_clear()
+        create_theme(mode, _OVERRIDES)
+
+    def time_create_theme_overrides_warm(self, mode):
+        create_theme(mode, _OVERRIDES)
+
+
+class CategoricalPaletteSuite:
+    """``get_categorical_palette`` across sizes."""
+
+    params = [[False, True], [5, 17, 40, 100, 200]]
+    param_names = ["dark_theme", "n_colors"]
+
+    def setup(self, dark_theme, n_colors):
+        get_categorical_palette(dark_theme=dark_theme, n_colors=n_colors)
+
+    def time_cold(self, dark_theme, n_colors):
+        clear_palette_caches()
+        get_categorical_palette(dark_theme=dark_theme, n_colors=n_colors)
+
+    def time_warm(self, dark_theme, n_colors):
+        get_categorical_palette(dark_theme=dark_theme, n_colors=n_colors)
+
+
+class ContinuousCmapSuite:
+    """``get_continuous_cmap`` across sizes and color spaces."""
+
+    params = [[16, 128, 256, 1024], ["srgb", "oklab"]]
+    param_names = ["n_colors", "space"]
+
+    def setup(self, n_colors, space):
+        get_continuous_cmap(n_colors=n_colors, space=space)
+
+    def time_cold(self, n_colors, space):
+        clear_palette_caches()
+        get_continuous_cmap(n_colors=n_colors, space=space)
+
+    def time_warm(self, n_colors, space):
+        get_continuous_cmap(n_colors=n_colors, space=space)
+
+
+SUITES = (
+    ImportSuite,
+    ConfigureSuite,
+    ThemeSuite,
+    CategoricalPaletteSuite,
+    ContinuousCmapSuite,
+)
+
+_TIMERAW = """
+import time
+{setup}
+start = time.perf_counter()
+{code}
+print(time.perf_counter() - start)
+"""
+
+
+def _timeraw(code: str, setup: str, repeat: int) -> List[float]:
+    """Time ``code`` after ``setup`` in ``repeat`` fresh interpreters."""
+    times = []
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-c", _TIMERAW.format(setup=setup, code=code)],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        times.append(float(result.stdout.splitlines()[-1]))
+    return times
+
+
+def _time(func: Callable[[], Any], repeat: int, min_time: float) -> List[float]:
+    """Seconds per call of ``func`` for ``repeat`` batches of at least ``min_time``."""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or number >= 1 << 20:
+            break
+        number *= 2 if elapsed <= 0 else max(2, min(10, int(min_time / elapsed) + 1))
+    times = [elapsed / number]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        times.append((time.perf_counter() - start) / number)
+    return times
+
+
+def iter_benchmarks() -> Iterator[Tuple[str, type, str, Dict[str, Any]]]:
+    """Yield ``(name, suite, method, params)`` for every benchmark."""
+    for suite in SUITES:
+        grid = list(itertools.product(*getattr(suite, "params", [])))
+        names = getattr(suite, "param_names", [])
+        for method in sorted(vars(suite)):
+            if not method.startswith(("time_", "timeraw_")):
+                continue
+            for values in grid:
+                params = dict(zip(names, values))
+                label = ", ".join(f"{k}={v!r}" for k, v in params.items())
+                name = f"{suite.__name__}.{method}" + (f"({label})" if label else "")
+                yield name, suite, method, params
+
+
+def run(pattern: str = "", repeat: int = 5, min_time: float = 0.02) -> Dict[str, Dict]:
+    """
+    Run the benchmarks whose name contains ``pattern``.
+
+    Returns:
+        Mapping of benchmark names to their parameters and timings in seconds
+    """
+    results = {}
+    for name, suite, method, params in iter_benchmarks():
+        if pattern not in name:
+            continue
+        instance = suite()
+        if method.startswith("timeraw_"):
+            raw = getattr(instance, method)(*params.values())
+            code, setup = raw if isinstance(raw, tuple) else (raw, "")
+            times = _timeraw(code, setup, repeat)
+        else:
+            if hasattr(instance, "setup"):
+                instance.setup(*params.values())
+            bound = getattr(instance, method)
+            times = _time(lambda: bound(*params.values()), repeat, min_time)
+        results[name] = {
+            "params": params,
+            "min": min(times),
+            "median": statistics.median(times),
+            "repeat": repeat,
+        }
+        print(f"{name:<72} {results[name]['median'] * 1e6:>12.1f} us")
+    return results
+
+
+def _commit() -> Optional[str]:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], threshold: float) -> List[str]:
+    """Benchmarks whose median is ``threshold`` times slower than the baseline."""
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        ratio = result["median"] / baseline[name]["median"]
+        if ratio > threshold:
+            regressions.append(f"{name} is {ratio:.2f}x slower")
+    return regressions
+
+
+def main() -> int:
+    """Run the suite and save the results, returning 1 on regressions."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-k", "--pattern", default="", help="Only run benchmarks containing this")
+    parser.add_argument("-o", "--output", type=Path, help="Results file to write")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--quick", action="store_true", help="Single short repeat per benchmark")
+    parser.add_argument("--compare", type=Path, help="Previous results file to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.5,
+        help="Slowdown factor of the median counted as a regression",
+    )
+    args = parser.parse_args()
+
+    repeat, min_time = (1, 0.005) if args.quick else (args.repeat, 0.02)
+    results = run(args.pattern, repeat=repeat, min_time=min_time)
+
+    commit = _commit()
+    output = args.output or RESULTS_DIR / f"{panel_siemens_ix.__version__}-{commit or 'local'}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    document = {
+        "version": panel_siemens_ix.__version__,
+        "commit": commit,
+        "date": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+        "unit": "seconds",
+        "results": results,
+    }
+    output.write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+    print(f"\nResults written to {output}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))["results"]
+        regressions = compare(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f"Regression: {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,127 +1,439 @@
 #!/usr/bin/env python3
 """
-Extract color variables from SCSS files and convert to Python dictionary.
+Compile the Siemens iX SCSS color tokens to JSON.
+
+The iX theme files (``colors_light.scss``, ``colors_dark.scss``) declare
+about 1150 ``--theme-*`` custom properties each, most of them as ``var()``
+references to other tokens. The compiler
+
+* tokenizes each file as a stream of characters, in fixed-size chunks,
+  tracking comments, strings, parentheses and nested selector blocks,
+* resolves ``var()`` references, including fallbacks, in dependency order
+  through a graph of the tokens, failing on cycles and reporting unknown
+  references (kept verbatim, as a browser would see them),
+* normalizes ``rgb()``/``rgba()`` values to hex, like the rest of the tokens,
+* writes the resolved tokens of all modes to ``ix_tokens.json``, plus the
+  ``theme-color-*`` subset per mode as ``colors_<mode>_dict.json``,
+* records the hashes of its inputs, so running it again without changes
+  is a no-op.
+
+It is a development tool working on this directory of the repository; the
+outputs are reference data for maintaining the palettes in
+``panel_siemens_ix.colors``, which are not generated from them. ``--check``
+instead verifies that every palette color matches its iX token, so the
+hand-maintained palettes cannot drift from the SCSS sources unnoticed.
+
+Compile with:
+    python colors/extract_colors.py colors/colors_light.scss colors/colors_dark.scss
+    python colors/extract_colors.py --force   # rebuild even if nothing changed
+    python colors/extract_colors.py --strict  # fail on unknown references
+    python colors/extract_colors.py --check   # compare the palettes with the tokens
 """
 
-import re
+import argparse
+import hashlib
 import json
-from typing import Dict, Union, Tuple
-
-def hex_to_rgba(hex_color: str) -> str:
-    """Convert hex color to rgba format."""
-    hex_color = hex_color.lstrip('#')
-    
-    # Handle 3-digit hex
-    if len(hex_color) == 3:
-        hex_color = ''.join([c*2 for c in hex_color])
-    
-    # Handle 4-digit hex (with alpha)
-    if len(hex_color) == 4:
-        hex_color = ''.join([c*2 for c in hex_color])
-    
-    # Handle 6-digit hex
-    if len(hex_color) == 6:
-        r = int(hex_color[0:2], 16)
-        g = int(hex_color[2:4], 16)
-        b = int(hex_color[4:6], 16)
-        return f"rgba({r}, {g}, {b}, 1)"
-    
-    # Handle 8-digit hex (with alpha)
-    if len(hex_color) == 8:
-        r = int(hex_color[0:2], 16)
-        g = int(hex_color[2:4], 16)
-        b = int(hex_color[4:6], 16)
-        a = int(hex_color[6:8], 16) / 255
-        return f"rgba({r}, {g}, {b}, {a:.2f})"
-    
-    return hex_color
-
-def rgba_to_hex(rgba_str: str) -> str:
-    """Convert rgba color to hex format."""
-    rgba_match = re.match(r'rgba?\(([^)]+)\)', rgba_str)
-    if not rgba_match:
-        return rgba_str
-    
-    values = rgba_match.group(1).split(',')
-    values = [v.strip() for v in values]
-    
-    r = int(values[0])
-    g = int(values[1])
-    b = int(values[2])
-    
-    if len(values) == 4:
-        a = float(values[3])
-        if a == 1:
-            return f"#{r:02x}{g:02x}{b:02x}"
-        else:
-            alpha_hex = int(a * 255)
-            return f"#{r:02x}{g:02x}{b:02x}{alpha_hex:02x}"
-    
-    return f"#{r:02x}{g:02x}{b:02x}"
-
-def parse_color_value(color_str: str) -> str:
-    """Parse color value and return in appropriate format."""
-    color_str = color_str.strip()
-    
-    # Handle rgba format
-    if color_str.startswith('rgba('):
-        return rgba_to_hex(color_str)
-    
-    # Handle hex format
-    if color_str.startswith('#'):
-        return color_str
-    
-    # Handle var() references - return as-is
-    if color_str.startswith('var('):
-        return color_str
-    
-    return color_str
-
-def extract_colors_from_scss(file_path: str) -> Dict[str, str]:
-    """Extract color variables from SCSS file."""
-    colors = {}
-    
-    with open(file_path, 'r') as f:
-        content = f.read()
-    
-    # Find all CSS custom properties with --theme-color- prefix
-    pattern = r'--theme-color-([^:]+):\s*([^;]+);'
-    matches = re.findall(pattern, content)
-    
-    for name, value in matches:
-        # Remove the prefix and clean the name
-        clean_name = name.strip()
-        clean_value = parse_color_value(value)
-        
-        # Skip if it's a var() reference
-        if clean_value.startswith('var('):
-            continue
-            
-        colors[clean_name] = clean_value
-    
-    return colors
-
-def main():
-    """Main function to extract colors from colors_light.scss."""
-    scss_file = 'css/colors_light.scss'
-    
+import re
+import sys
+from graphlib import CycleError, TopologicalSorter
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from panel_siemens_ix.conversion import parse_color, to_hex
+
+COLORS_DIR = Path(__file__).parent
+DEFAULT_INPUTS = (COLORS_DIR / "colors_light.scss", COLORS_DIR / "colors_dark.scss")
+JSON_PATH = COLORS_DIR / "ix_tokens.json"
+
+CHUNK_SIZE = 8192
+COLOR_PREFIX = "theme-color-"
+
+_VAR = re.compile(r"var\(\s*--([\w-]+)\s*(?:,\s*([^()]*(?:\([^()]*\))?[^()]*))?\)")
+_COLOR_FUNCTION = re.compile(r"^rgba?\([^()]*\)$")
+_MODE_SELECTOR = re.compile(r"\.theme-[\w-]*?(light|dark)\b")
+
+# Palette keys named differently from their iX tokens
+_TEXT_TOKENS = {
+    "primary": "std-text",
+    "secondary": "soft-text",
+    "disabled": "weak-text",
+    "hint": "soft-text",
+}
+_BACKGROUND_TOKENS = {"default": "1", "paper": "2", "surface": "3"}
+_GROUP_TOKENS = {"error": "alarm"}
+
+# Palette colors without an iX token: contrast colors of the dynamic and
+# secondary groups, and the chart colors, which are reordered and retuned
+# for contrast between neighboring series
+UNCHECKED = {("dynamic", "contrast"), ("secondary", "contrast")}
+UNCHECKED_GROUPS = {"chart"}
+
+
+class Declaration(NamedTuple):
+    """A ``name: value`` declaration with its enclosing selectors."""
+
+    selectors: Tuple[str, ...]
+    name: str
+    value: str
+    line: int
+
+
+def _read_chunks(path: Path, size: int = CHUNK_SIZE) -> Iterator[str]:
+    with open(path, encoding="utf-8") as f:
+        while chunk := f.read(size):
+            yield chunk
+
+
+def iter_declarations(chunks: Iterable[str]) -> Iterator[Declaration]:
+    """
+    Tokenize SCSS text into declarations, one chunk at a time.
+
+    Comments (``/* */`` and ``//``) are skipped, and ``;``, ``{`` and ``}``
+    inside strings or parentheses do not end a declaration, so values such
+    as ``url(data:...;...)`` stay intact.
+
+    Args:
+        chunks: SCSS text in pieces of any size
+
+    Yields:
+        Declarations in source order
+    """
+    selectors: List[str] = []
+    buffer: List[str] = []
+    line, start_line = 1, 1
+    quote: Optional[str] = None
+    comment: Optional[str] = None
+    depth = 0
+    previous = ""
+
+    def flush() -> Optional[Declaration]:
+        text = "".join(buffer).strip()
+        buffer.clear()
+        if ":" not in text:
+            return None
+        name, value = text.split(":", 1)
+        return Declaration(tuple(selectors), name.strip(), value.strip(), start_line)
+
+    for chunk in chunks:
+        for char in chunk:
+            if char == "\n":
+                line += 1
+            if comment == "block":
+                if previous == "*" and char == "/":
+                    comment, char = None, ""
+            elif comment == "line":
+                if char == "\n":
+                    comment = None
+            elif quote:
+                buffer.append(char)
+                if char == quote and previous != "\\":
+                    quote = None
+            elif previous == "/" and char in "*/" and not depth:
+                buffer.pop()
+                comment, char = ("block" if char == "*" else "line"), ""
+            elif char in "\"'":
+                quote = char
+                buffer.append(char)
+            elif char == "(":
+                depth += 1
+                buffer.append(char)
+            elif char == ")":
+                depth = max(depth - 1, 0)
+                buffer.append(char)
+            elif char == "{" and not depth:
+                selectors.append("".join(buffer).strip())
+                buffer.clear()
+            elif char in ";}" and not depth:
+                declaration = flush()
+                if declaration is not None:
+                    yield declaration
+                if char == "}" and selectors:
+                    selectors.pop()
+            else:
+                if not buffer and not char.isspace():
+                    start_line = line
+                buffer.append(char)
+            previous = char
+
+
+def _references(value: str) -> List[str]:
+    return [match.group(1) for match in _VAR.finditer(value)]
+
+
+def resolve_tokens(tokens: Dict[str, str]) -> Tuple[Dict[str, str], List[str]]:
+    """
+    Resolve ``var()`` references between tokens.
+
+    Tokens are substituted in topological order of their dependency graph,
+    so every reference is resolved exactly once, whatever the chain length.
+
+    Args:
+        tokens: Raw values by token name (without the leading ``--``)
+
+    Returns:
+        The resolved tokens and a list of problems (unknown references
+        without fallback). References that cannot be resolved are kept as-is.
+
+    Raises:
+        ValueError: If the references contain a cycle
+    """
+    graph = {
+        name: {ref for ref in _references(value) if ref in tokens}
+        for name, value in tokens.items()
+    }
+    try:
+        order = list(TopologicalSorter(graph).static_order())
+    except CycleError as e:
+        cycle = " -> ".join(f"--{name}" for name in e.args[1])
+        raise ValueError(f"Cyclic var() references: {cycle}") from None
+
+    resolved: Dict[str, str] = {}
+    problems: List[str] = []
+
+    def substitute(match: "re.Match[str]", owner: str) -> str:
+        ref, fallback = match.group(1), match.group(2)
+        if ref in resolved:
+            return resolved[ref]
+        if fallback is not None:
+            return _VAR.sub(lambda m: substitute(m, owner), fallback.strip())
+        problems.append(f"--{owner} references unknown --{ref}")
+        return match.group(0)
+
+    for name in order:
+        resolved[name] = _VAR.sub(lambda m: substitute(m, name), tokens[name])
+    return {name: resolved[name] for name in tokens}, problems
+
+
+def _mode(path: Path, declarations: Sequence[Declaration]) -> str:
+    """Theme mode from the selectors of a file, or else from its name."""
+    for declaration in declarations:
+        for selector in declaration.selectors:
+            match = _MODE_SELECTOR.search(selector)
+            if match:
+                return match.group(1)
+    for mode in ("light", "dark"):
+        if mode in path.stem:
+            return mode
+    raise ValueError(f"Cannot determine the theme mode of {path}")
+
+
+def compile_tokens(paths: Sequence[Path]) -> Tuple[Dict[str, Dict[str, str]], List[str]]:
+    """
+    Compile SCSS token files into resolved tokens per mode.
+
+    Args:
+        paths: SCSS files, one per mode
+
+    Returns:
+        ``{mode: {token: value}}``, with ``rgb()``/``rgba()`` colors as hex,
+        and the problems found while resolving
+    """
+    modes: Dict[str, Dict[str, str]] = {}
+    problems: List[str] = []
+    for path in map(Path, paths):
+        declarations = [
+            d for d in iter_declarations(_read_chunks(path)) if d.name.startswith("--")
+        ]
+        mode = _mode(path, declarations)
+        raw = {d.name[2:]: d.value for d in declarations}
+        resolved, mode_problems = resolve_tokens(raw)
+        modes[mode] = {
+            name: to_hex(value) if _COLOR_FUNCTION.match(value) else value
+            for name, value in resolved.items()
+        }
+        problems.extend(f"{path.name}: {problem}" for problem in mode_problems)
+    return modes, problems
+
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(1 << 16):
+            digest.update(chunk)
+    return digest.hexdigest()[:16]
+
+
+def input_hashes(paths: Sequence[Path]) -> Dict[str, str]:
+    """Hashes of the input files and of the compiler itself."""
+    hashes = {Path(path).name: _hash_file(Path(path)) for path in paths}
+    hashes["compiler"] = _hash_file(Path(__file__))
+    return hashes
+
+
+def _recorded_hashes(json_path: Path) -> Optional[Dict[str, str]]:
     try:
-        colors = extract_colors_from_scss(scss_file)
-        
-        # Convert to JSON and print
-        print(json.dumps(colors, indent=2))
-        
-        # Also save to file
-        with open('colors_light_dict.json', 'w') as f:
-            json.dump(colors, f, indent=2)
-        
-        print(f"\nExtracted {len(colors)} color variables from {scss_file}")
-        print("Saved to colors_light_dict.json")
-        
+        return json.loads(json_path.read_text(encoding="utf-8"))["source_hashes"]
+    except (FileNotFoundError, KeyError, ValueError):
+        return None
+
+
+def build_tokens(
+    paths: Sequence[Path] = DEFAULT_INPUTS,
+    json_path: Path = JSON_PATH,
+    force: bool = False,
+    strict: bool = False,
+) -> Tuple[bool, List[str]]:
+    """
+    Compile the SCSS files unless their hashes match the previous build.
+
+    Args:
+        paths: SCSS files, one per mode
+        json_path: Generated JSON file; ``colors_<mode>_dict.json`` files
+            with the ``theme-color-*`` subset are written next to it
+        force: Rebuild even if the inputs are unchanged
+        strict: Fail on ``var()`` references to unknown tokens
+
+    Returns:
+        Whether the outputs were rebuilt, and the unknown references found
+
+    Raises:
+        ValueError: On cyclic references, or unknown ones if ``strict``
+    """
+    paths = [Path(path) for path in paths]
+    json_path = Path(json_path)
+    hashes = input_hashes(paths)
+    if not force and _recorded_hashes(json_path) == hashes:
+        return False, []
+
+    tokens, problems = compile_tokens(paths)
+    if problems and strict:
+        raise ValueError("Unresolved var() references:\n" + "\n".join(problems))
+
+    for mode, values in tokens.items():
+        colors = {
+            name[len(COLOR_PREFIX):]: value
+            for name, value in values.items()
+            if name.startswith(COLOR_PREFIX)
+        }
+        (json_path.parent / f"colors_{mode}_dict.json").write_text(
+            json.dumps(colors, indent=2) + "\n", encoding="utf-8"
+        )
+    # Written last, so an interrupted build is redone on the next run
+    json_path.write_text(
+        json.dumps({"source_hashes": hashes, "tokens": tokens}, indent=2) + "\n",
+        encoding="utf-8",
+    )
+    return True, problems
+
+
+def palette_token(group: str, key: str) -> str:
+    """
+    Name of the iX token of a palette color.
+
+    Args:
+        group: Color group of the palette, e.g. ``"primary"`` or ``"text"``
+        key: Color within the group, e.g. ``"hover"``
+
+    Returns:
+        Token name without the leading ``--``, e.g. ``"theme-color-primary--hover"``
+    """
+    if group == "chart":
+        return f"theme-chart-{key}"
+    if group == "text":
+        return COLOR_PREFIX + _TEXT_TOKENS[key]
+    if group == "background":
+        return COLOR_PREFIX + _BACKGROUND_TOKENS[key]
+    if group == "border":
+        return f"{COLOR_PREFIX}{key}-bdr"
+    if group in ("component", "shadow"):
+        return f"{COLOR_PREFIX}{group}-{key}"
+    group = _GROUP_TOKENS.get(group, group)
+    return f"{COLOR_PREFIX}{group}" if key == "main" else f"{COLOR_PREFIX}{group}--{key}"
+
+
+def _same_color(a: str, b: str) -> bool:
+    """Equal colors, allowing for the rounding of alpha to a hex byte."""
+    (*rgb_a, alpha_a), (*rgb_b, alpha_b) = parse_color(a), parse_color(b)
+    return rgb_a == rgb_b and abs(alpha_a - alpha_b) <= 1 / 255 + 1e-9
+
+
+def check_palettes(
+    paths: Sequence[Path] = DEFAULT_INPUTS, json_path: Path = JSON_PATH
+) -> List[str]:
+    """
+    Compare the palettes of ``panel_siemens_ix.colors`` with the compiled tokens.
+
+    Args:
+        paths: SCSS files the tokens were compiled from
+        json_path: Compiled JSON file
+
+    Returns:
+        List of problems, empty if the tokens are up to date and every
+        checked palette color matches its token
+    """
+    from panel_siemens_ix.colors import get_colors
+
+    json_path = Path(json_path)
+    try:
+        compiled = json.loads(json_path.read_text(encoding="utf-8"))
     except FileNotFoundError:
-        print(f"Error: {scss_file} not found")
-    except Exception as e:
-        print(f"Error processing file: {e}")
+        return [f"{json_path.name} is missing"]
+    problems = []
+    if compiled.get("source_hashes") != input_hashes([Path(path) for path in paths]):
+        problems.append(f"{json_path.name} is outdated")
+
+    for mode, tokens in compiled["tokens"].items():
+        for group, colors in get_colors(mode).to_dict().items():
+            if group in UNCHECKED_GROUPS:
+                continue
+            for key, value in colors.items():
+                if (group, key) in UNCHECKED:
+                    continue
+                name = palette_token(group, key)
+                if name not in tokens:
+                    problems.append(f"{mode}: {group}.{key} has no token --{name}")
+                elif not _same_color(value, tokens[name]):
+                    problems.append(
+                        f"{mode}: {group}.{key} is {value}, --{name} is {tokens[name]}"
+                    )
+    return problems
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Compile the SCSS token files given on the command line."""
+    parser = argparse.ArgumentParser(description="Compile Siemens iX SCSS color tokens.")
+    parser.add_argument(
+        "inputs",
+        nargs="*",
+        type=Path,
+        default=list(DEFAULT_INPUTS),
+        help="SCSS files, one per theme mode (default: colors_{light,dark}.scss)",
+    )
+    parser.add_argument("--json", type=Path, default=JSON_PATH)
+    parser.add_argument(
+        "--force", action="store_true", help="Rebuild even if the inputs are unchanged"
+    )
+    parser.add_argument(
+        "--strict", action="store_true", help="Fail on references to unknown tokens"
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Exit with status 1 if the palettes differ from the compiled tokens",
+    )
+    args = parser.parse_args(argv)
+
+    if args.check:
+        problems = check_palettes(args.inputs, args.json)
+        for problem in problems:
+            print(problem, file=sys.stderr)
+        return 1 if problems else 0
+
+    try:
+        rebuilt, problems = build_tokens(
+            args.inputs, args.json, force=args.force, strict=args.strict
+        )
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    for problem in problems:
+        print(f"Warning: {problem}", file=sys.stderr)
+    if rebuilt:
+        print(f"Wrote {args.json}")
+    else:
+        print("Up to date, inputs unchanged")
+    return 0
+
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,168 @@
+"""
+Environmental Sensor Data for the Siemens iX Time Series Dashboard
+
+Synthetic plant sensor readings used by ``time_series_dashboard.py``:
+
+- ``generate_sensor_data``: historical readings with daily cycles, trends
+  and noise, optionally in the compact columnar layout (int64 epoch
+  timestamps and one contiguous float32 block, see ``timeseries_engine``)
+- ``generate_live_readings``: the next readings of a live stream
+
+Like ``timeseries_engine`` it only needs NumPy and pandas.
+"""
+
+import datetime
+from typing import Iterator, Tuple
+
+import numpy as np
+import pandas as pd
+
+from timeseries_engine import compact_frame
+
+# Sensor columns, in the order they are generated
+SENSORS = ('temperature_c', 'humidity_pct', 'pressure_hpa', 'co2_ppm', 'light_lux', 'sound_db')
+
+# Simulated sampling interval of the live stream
+LIVE_INTERVAL = datetime.timedelta(minutes=1)
+
+# Random walk step and bounds of the simulated live readings per sensor
+LIVE_SIMULATION = {
+    'temperature_c': (0.2, -20, 50),
+    'humidity_pct': (0.5, 10, 90),
+    'pressure_hpa': (1.0, 950, 1050),
+    'co2_ppm': (5.0, 300, 2000),
+    'light_lux': (20.0, 0, 2000),
+    'sound_db': (2.0, 20, 80),
+}
+
+
+def _sensor_columns(n_points: int) -> Iterator[Tuple[str, np.ndarray]]:
+    """Yield the readings of every sensor, one float64 column at a time."""
+    # Base values for different sensors
+    base_temp = 20  # Celsius
+    base_humidity = 50  # Percentage
+    base_pressure = 1013  # hPa
+    base_co2 = 400  # ppm
+
+    # Phase of the daily cycle, shared by all sensors
+    daily = 2 * np.pi * np.arange(n_points, dtype=np.float64) / 24
+
+    # Temperature with daily cycle and seasonal trend
+    temperature = 5 * np.sin(daily)  # Daily cycle
+    temperature += 2 * np.sin(daily / 30)  # Monthly trend
+    temperature += np.random.normal(0, 1, n_points)
+    temperature += base_temp
+    yield 'temperature_c', temperature
+
+    # Humidity with inverse relationship to temperature and daily cycle
+    humidity = base_humidity - 0.5 * (temperature - base_temp)
+    del temperature
+    humidity += 10 * np.cos(daily)
+    humidity += np.random.normal(0, 2, n_points)
+    yield 'humidity_pct', np.clip(humidity, 10, 90, out=humidity)  # Realistic bounds
+    del humidity
+
+    # Pressure with slow variations
+    pressure = 10 * np.sin(daily / 7)  # Weekly trend
+    pressure += np.random.normal(0, 5, n_points)
+    pressure += base_pressure
+    yield 'pressure_hpa', pressure
+    del pressure
+
+    # CO2 with gradual increase and daily variations
+    co2 = np.linspace(0, 20, n_points)  # Gradual increase
+    co2 += 50 * np.sin(daily)
+    co2 += np.random.normal(0, 10, n_points)
+    co2 += base_co2
+    yield 'co2_ppm', np.clip(co2, 300, 2000, out=co2)  # Realistic bounds
+    del co2
+
+    # Light intensity (lux) with strong daily cycle
+    light = 500 + 500 * np.sin(daily - np.pi/2)
+    light += np.random.normal(0, 50, n_points)
+    yield 'light_lux', np.maximum(0, light, out=light)  # No negative light
+    del light
+
+    # Sound level (dB) with random variations around base
+    sound = 10 * np.random.normal(0, 1, n_points)
+    sound += 45  # dB
+    yield 'sound_db', np.clip(sound, 20, 80, out=sound)  # Realistic bounds
+
+
+def generate_sensor_data(days: int = 30, frequency: str = 'h', compact: bool = False) -> pd.DataFrame:
+    """
+    Generate realistic environmental sensor data for demonstration.
+
+    Parameters
+    ----------
+    days : int, optional
+        Number of days of data to generate (default is 30)
+    frequency : str, optional
+        Frequency of data points ('h' for hourly, 'min' for minutely, etc.)
+    compact : bool, optional
+        If True, store the readings as float32 in one contiguous block and
+        the timestamps as int64 epoch nanoseconds, roughly halving the memory
+        of the frame (default is False)
+
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame with timestamp and sensor readings
+    """
+    # Create date range
+    end_date = datetime.datetime.now()
+    start_date = end_date - datetime.timedelta(days=days)
+    dates = pd.date_range(start=start_date, end=end_date, freq=frequency)
+
+    # Initialize random seed for reproducibility
+    np.random.seed(42)
+
+    # Create realistic time series with trends, seasonality and noise
+    n_points = len(dates)
+
+    if not compact:
+        data = {'timestamp': dates}
+        for name, values in _sensor_columns(n_points):
+            data[name] = np.round(values, 2)
+        return pd.DataFrame(data)
+
+    # Fill the float32 block column by column, so only one float64 column
+    # (plus the shared phase) is alive at a time
+    block = np.empty((n_points, len(SENSORS)), dtype=np.float32, order='F')
+    for i, (name, values) in enumerate(_sensor_columns(n_points)):
+        block[:, i] = np.round(values, 2, out=values)
+    return compact_frame(dates.as_unit('ns').asi8, block, SENSORS)
+
+
+def generate_live_readings(
+    last: pd.Series,
+    n: int = 1,
+    interval: datetime.timedelta = LIVE_INTERVAL,
+    rng: np.random.Generator = None
+) -> pd.DataFrame:
+    """
+    Simulate the next readings of the plant sensors.
+
+    Parameters
+    ----------
+    last : pd.Series
+        The latest reading, with timestamp and sensor values
+    n : int, optional
+        Number of readings to generate (default is 1)
+    interval : datetime.timedelta, optional
+        Time between readings
+    rng : np.random.Generator, optional
+        Random generator
+
+    Returns
+    -------
+    pd.DataFrame
+        The new readings, a random walk continuing from ``last``
+    """
+    rng = rng or np.random.default_rng()
+    steps = np.arange(1, n + 1)
+    data = {'timestamp': pd.Timestamp(last['timestamp']) + steps * pd.Timedelta(interval)}
+    for column, (step, low, high) in LIVE_SIMULATION.items():
+        walk = last[column] + np.cumsum(rng.normal(0, step, n))
+        data[column] = np.round(np.clip(walk, low, high), 2)
+    return pd.DataFrame(data)
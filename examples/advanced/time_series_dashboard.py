@@ -2,8 +2,10 @@
 Siemens iX Time Series Analytics Dashboard
 
 This advanced example demonstrates a comprehensive data analytics dashboard featuring:
-- Realistic sample dataset generation (environmental sensor readings)
-- Interactive time series visualizations using hvPlot
+- Realistic sample dataset generation (environmental sensor readings, see
+  ``sensor_data.py``), stored in a compact float32 columnar layout
+- Interactive time series visualizations using hvPlot, downsampled to the
+  plot width (LTTB or min-max) and refined on zoom
 - Parameter-driven architecture with pn.viewable.Viewer
 - Material UI components with Siemens iX theming
 - Dynamic exploration and analysis capabilities
@@ -11,9 +13,14 @@ This advanced example demonstrates a comprehensive data analytics dashboard feat
 Features:
 - Realistic time series data generation for environmental sensors
 - Interactive visualizations with hvPlot
-- Dynamic parameter controls for filtering and aggregation
-- KPI cards showing current, min, max, and average values
+- Dynamic parameter controls for filtering and aggregation, answered from
+  precomputed rollups (see ``timeseries_engine.py``)
+- KPI cards showing current, min, max, and average values, read from
+  running window statistics updated per appended sample
 - Data table with recent readings
+- Live mode streaming simulated plant readings through a ring buffer into
+  the plot (HoloViews ``Buffer``), the table (``Tabulator.stream``) and
+  the KPI cards
 - Responsive Material UI design with Siemens iX theming
 
 Run with:
@@ -28,92 +35,42 @@ import param
 import pandas as pd
 import numpy as np
 import datetime
+import holoviews as hv
 import hvplot.pandas  # noqa
 from panel_siemens_ix import configure
+from sensor_data import generate_live_readings, generate_sensor_data
+from timeseries_engine import (
+    AGGREGATIONS, DOWNSAMPLING, FREQUENCIES, RingBuffer, RollingStats, RollupStore,
+    downsample
+)
 
+# Points drawn when the plot width is not known yet
+DEFAULT_PLOT_WIDTH = 1000
 
-# Generate realistic time series sensor data
-def generate_sensor_data(days: int = 30, frequency: str = 'H') -> pd.DataFrame:
+# Rows shown in the data table
+TABLE_ROWS = 10
+
+# Live mode: rows kept in the ring buffer and update period of the stream
+LIVE_CAPACITY = 2000
+LIVE_PERIOD_MS = 1000
+
+
+@pn.cache
+def load_sensor_store(days: int = 30) -> RollupStore:
     """
-    Generate realistic environmental sensor data for demonstration.
-    
+    Generate the (compact) sensor data and precompute its rollups, once per process.
+
     Parameters
     ----------
     days : int, optional
         Number of days of data to generate (default is 30)
-    frequency : str, optional
-        Frequency of data points ('H' for hourly, 'T' for minutely, etc.)
-        
+
     Returns
     -------
-    pd.DataFrame
-        DataFrame with timestamp and sensor readings
+    RollupStore
+        Store shared by all sessions
     """
-    # Create date range
-    end_date = datetime.datetime.now()
-    start_date = end_date - datetime.timedelta(days=days)
-    dates = pd.date_range(start=start_date, end=end_date, freq=frequency)
-    
-    # Initialize random seed for reproducibility
-    np.random.seed(42)
-    
-    # Base values for different sensors
-    base_temp = 20  # Celsius
-    base_humidity = 50  # Percentage
-    base_pressure = 1013  # hPa
-    base_co2 = 400  # ppm
-    
-    # Create realistic time series with trends, seasonality and noise
-    n_points = len(dates)
-    
-    # Temperature with daily cycle and seasonal trend
-    daily_temp_variation = 5 * np.sin(2 * np.pi * np.arange(n_points) / 24)  # Daily cycle
-    seasonal_temp_trend = 2 * np.sin(2 * np.pi * np.arange(n_points) / (24 * 30))  # Monthly trend
-    temp_noise = np.random.normal(0, 1, n_points)
-    temperature = base_temp + daily_temp_variation + seasonal_temp_trend + temp_noise
-    
-    # Humidity with inverse relationship to temperature and daily cycle
-    humidity_base = base_humidity - 0.5 * (temperature - base_temp)
-    daily_humidity_variation = 10 * np.cos(2 * np.pi * np.arange(n_points) / 24)
-    humidity_noise = np.random.normal(0, 2, n_points)
-    humidity = humidity_base + daily_humidity_variation + humidity_noise
-    humidity = np.clip(humidity, 10, 90)  # Realistic bounds
-    
-    # Pressure with slow variations
-    pressure_trend = 10 * np.sin(2 * np.pi * np.arange(n_points) / (24 * 7))  # Weekly trend
-    pressure_noise = np.random.normal(0, 5, n_points)
-    pressure = base_pressure + pressure_trend + pressure_noise
-    
-    # CO2 with gradual increase and daily variations
-    co2_trend = np.linspace(0, 20, n_points)  # Gradual increase
-    daily_co2_variation = 50 * np.sin(2 * np.pi * np.arange(n_points) / 24)
-    co2_noise = np.random.normal(0, 10, n_points)
-    co2 = base_co2 + co2_trend + daily_co2_variation + co2_noise
-    co2 = np.clip(co2, 300, 2000)  # Realistic bounds
-    
-    # Light intensity (lux) with strong daily cycle
-    light_base = 500 + 500 * np.sin(2 * np.pi * np.arange(n_points) / 24 - np.pi/2)
-    light_noise = np.random.normal(0, 50, n_points)
-    light = np.maximum(0, light_base + light_noise)  # No negative light
-    
-    # Sound level (dB) with random variations around base
-    sound_base = 45  # dB
-    sound_variation = 10 * np.random.normal(0, 1, n_points)
-    sound = sound_base + sound_variation
-    sound = np.clip(sound, 20, 80)  # Realistic bounds
-    
-    # Create DataFrame
-    data = pd.DataFrame({
-        'timestamp': dates,
-        'temperature_c': np.round(temperature, 2),
-        'humidity_pct': np.round(humidity, 2),
-        'pressure_hpa': np.round(pressure, 2),
-        'co2_ppm': np.round(co2, 2),
-        'light_lux': np.round(light, 2),
-        'sound_db': np.round(sound, 2)
-    })
-    
-    return data
+    return RollupStore(generate_sensor_data(days=days, compact=True))
 
 
 class TimeSeriesDashboard(pn.viewable.Viewer):
@@ -134,7 +91,7 @@ class TimeSeriesDashboard(pn.viewable.Viewer):
     )
     
     frequency = param.Selector(
-        default='H', objects=['H', '2H', '6H', 'D'],
+        default='h', objects=list(FREQUENCIES),
         doc="Data aggregation frequency"
     )
     
@@ -146,20 +103,54 @@ class TimeSeriesDashboard(pn.viewable.Viewer):
     
     aggregation = param.Selector(
         default='mean',
-        objects=['mean', 'median', 'min', 'max', 'std'],
+        objects=list(AGGREGATIONS),
         doc="Aggregation method for downsampling"
     )
     
+    downsampling = param.Selector(
+        default='lttb', objects=list(DOWNSAMPLING),
+        doc="Downsampling of the plotted window to the plot width"
+    )
+    
     color = param.Color(
         default='#1976d2',
         doc="Color for the primary visualization"
     )
     
+    live = param.Boolean(
+        default=False,
+        doc="Stream live sensor readings"
+    )
+    
+    kpis = param.Dict(
+        default={}, precedence=-1,
+        doc="Current, min, max, mean and std of every metric over the selected window"
+    )
+    
     def __init__(self, **params):
         super().__init__(**params)
         
-        # Generate initial dataset
-        self.data = generate_sensor_data(days=30)
+        # Shared dataset with precomputed rollups
+        self.store = load_sensor_store(days=30)
+        self.data = self.store.data
+        
+        # Live stream, continuing from the latest stored reading
+        self._rng = np.random.default_rng()
+        self._ring = RingBuffer(self.data.dtypes.to_dict(), LIVE_CAPACITY)
+        self._ring.append(self.data.tail(1))
+        self._live_buffer = hv.streams.Buffer(
+            self._ring.to_frame(), length=LIVE_CAPACITY, index=False
+        )
+        self._live_table = pn.widgets.Tabulator(
+            self._format_table(self.data.tail(TABLE_ROWS)),
+            pagination='local',
+            page_size=TABLE_ROWS,
+            sizing_mode="stretch_width"
+        )
+        self._live_callback = None
+        
+        # Running statistics of every metric over the selected window
+        self._reset_stats()
         
         # Configure sizing mode
         with pn.config.set(sizing_mode="stretch_width"):
@@ -217,6 +208,17 @@ class TimeSeriesDashboard(pn.viewable.Viewer):
             styles={"margin": "10px 0"}
         )
         
+        downsampling_widget = pmui.Select.from_param(
+            self.param.downsampling,
+            name="Downsampling",
+            styles={"margin": "10px 0"}
+        )
+        
+        live_widget = pmui.Switch.from_param(
+            self.param.live,
+            name="Live Stream"
+        )
+        
         color_widget = pmui.ColorPicker.from_param(
             self.param.color,
             name="Chart Color",
@@ -229,7 +231,9 @@ class TimeSeriesDashboard(pn.viewable.Viewer):
             frequency_widget,
             metric_widget,
             aggregation_widget,
+            downsampling_widget,
             color_widget,
+            live_widget,
             pmui.Alert(
                 object="💡 Adjust parameters to explore different aspects of the data",
                 alert_type="info",
@@ -269,46 +273,34 @@ class TimeSeriesDashboard(pn.viewable.Viewer):
             styles={"marginBottom": "20px"}
         )
     
-    # KPI value methods
-    @param.depends("metric", "days")
+    # KPI value methods, all reading the shared running statistics
+    @param.depends("metric", "kpis")
     def current_value(self):
         """Get current value for the selected metric."""
-        filtered_data = self.filtered_data
-        if len(filtered_data) > 0:
-            value = filtered_data[self.metric].iloc[-1]
-            unit = self._get_unit_for_metric(self.metric)
-            return f"{value:.2f} {unit}"
-        return "N/A"
-    
-    @param.depends("metric", "days")
+        return self._format_kpi("current")
+    
+    @param.depends("metric", "kpis")
     def min_value(self):
         """Get minimum value for the selected metric."""
-        filtered_data = self.filtered_data
-        if len(filtered_data) > 0:
-            value = filtered_data[self.metric].min()
-            unit = self._get_unit_for_metric(self.metric)
-            return f"{value:.2f} {unit}"
-        return "N/A"
-    
-    @param.depends("metric", "days")
+        return self._format_kpi("min")
+    
+    @param.depends("metric", "kpis")
     def max_value(self):
         """Get maximum value for the selected metric."""
-        filtered_data = self.filtered_data
-        if len(filtered_data) > 0:
-            value = filtered_data[self.metric].max()
-            unit = self._get_unit_for_metric(self.metric)
-            return f"{value:.2f} {unit}"
-        return "N/A"
-    
-    @param.depends("metric", "days")
+        return self._format_kpi("max")
+    
+    @param.depends("metric", "kpis")
     def avg_value(self):
         """Get average value for the selected metric."""
-        filtered_data = self.filtered_data
-        if len(filtered_data) > 0:
-            value = filtered_data[self.metric].mean()
-            unit = self._get_unit_for_metric(self.metric)
-            return f"{value:.2f} {unit}"
-        return "N/A"
+        return self._format_kpi("mean")
+    
+    def _format_kpi(self, statistic):
+        """Format a window statistic of the selected metric."""
+        stats = self.kpis.get(self.metric)
+        if not stats or not stats["count"]:
+            return "N/A"
+        unit = self._get_unit_for_metric(self.metric)
+        return f"{stats[statistic]:.2f} {unit}"
     
     def _create_chart_section(self):
         """Create the main chart section."""
@@ -340,77 +332,90 @@ class TimeSeriesDashboard(pn.viewable.Viewer):
     
     @property
     def filtered_data(self):
-        """Get filtered data based on selected time range."""
-        end_date = self.data['timestamp'].max()
+        """Get filtered data based on selected time range (a slice, not a copy)."""
         # Get parameter value safely
         days = getattr(self, 'days', 7)
         if not isinstance(days, (int, float)):
             days = 7
-        start_date = end_date - datetime.timedelta(days=int(days))
-        return self.data[self.data['timestamp'] >= start_date].copy()
+        return self.store.last(datetime.timedelta(days=int(days)))
     
-    @param.depends("metric", "frequency", "aggregation", "days", "color")
+    @param.depends("metric", "frequency", "aggregation", "days", "downsampling", "color", "live")
     def time_series_plot(self):
         """Generate interactive time series plot."""
-        # Get filtered data
-        data = self.filtered_data
-        
-        if len(data) == 0:
-            return pmui.Alert(
-                object="No data available for the selected time range",
-                alert_type="warning"
-            )
-        
         # Get parameter values safely
         metric = getattr(self, 'metric', 'temperature_c')
-        frequency = getattr(self, 'frequency', 'H')
+        frequency = getattr(self, 'frequency', 'h')
         aggregation = getattr(self, 'aggregation', 'mean')
         color = getattr(self, 'color', '#1976d2')
+        days = getattr(self, 'days', 7)
         
         # Ensure string values
         metric = str(metric) if metric is not None else 'temperature_c'
-        frequency = str(frequency) if frequency is not None else 'H'
+        frequency = str(frequency) if frequency is not None else 'h'
         aggregation = str(aggregation) if aggregation is not None else 'mean'
         color = str(color) if color is not None else '#1976d2'
         
-        # Resample data if needed
-        if frequency != 'H':
-            resampled = data.set_index('timestamp').resample(frequency)
-            if aggregation == 'mean':
-                data = resampled.mean().reset_index()
-            elif aggregation == 'median':
-                data = resampled.median().reset_index()
-            elif aggregation == 'min':
-                data = resampled.min().reset_index()
-            elif aggregation == 'max':
-                data = resampled.max().reset_index()
-            elif aggregation == 'std':
-                data = resampled.std().reset_index()
+        if self.live:
+            return self._live_plot(metric, color)
+        
+        # Slice the precomputed rollup instead of resampling the window
+        data = self.store.last(
+            datetime.timedelta(days=int(days)), frequency=frequency, aggregation=aggregation
+        )
+        
+        if len(data) == 0:
+            return pmui.Alert(
+                object="No data available for the selected time range",
+                alert_type="warning"
+            )
         
         # Create plot
         unit = self._get_unit_for_metric(metric)
         title = f"{metric.replace('_', ' ').title()} ({unit})"
+        window_start = data['timestamp'].iloc[0]
+        method = self.downsampling
         
-        plot = data.hvplot(
-            x='timestamp',
-            y=metric,
-            kind='line',
-            color=color,
-            title=title,
-            xlabel='Time',
-            ylabel=unit,
-            responsive=True,
-            min_height=300
-        )
+        def plot_window(x_range=None, y_range=None, width=None, height=None, scale=1.0):
+            """Plot the visible part of the window, downsampled to the plot width."""
+            visible = data
+            if x_range is not None:
+                # Zoomed or panned: slice the visible range of the selected
+                # frequency's rollup; downsampling then sets the resolution
+                visible = self.store.window(
+                    max(pd.Timestamp(x_range[0]), window_start), x_range[1],
+                    frequency=frequency, aggregation=aggregation
+                )
+            times = visible['timestamp'].to_numpy()
+            index = downsample(
+                times, visible[metric].to_numpy(), width or DEFAULT_PLOT_WIDTH, method
+            )
+            return visible.iloc[index].hvplot(
+                x='timestamp',
+                y=metric,
+                kind='line',
+                color=color,
+                title=title,
+                xlabel='Time',
+                ylabel=unit,
+                responsive=True,
+                min_height=300
+            )
+        
+        # Re-run the downsampling when the user zooms or the plot is resized
+        plot = hv.DynamicMap(plot_window, streams=[hv.streams.RangeXY(), hv.streams.PlotSize()])
         
         # Convert to Panel pane and wrap in Material UI Paper
         pane = pn.pane.HoloViews(plot, sizing_mode="stretch_width")
         return pmui.Paper(pane, sizing_mode="stretch_width")
     
-    @param.depends("days")
+    @param.depends("days", "live")
     def data_table(self):
         """Display recent data in a table."""
-        data = self.filtered_data.tail(10)  # Show last 10 records
+        if self.live:
+            # Receives the new rows via .stream() on every update
+            return self._live_table
+        
+        data = self.filtered_data.tail(TABLE_ROWS)  # Show last records
         
         if len(data) == 0:
             return pmui.Alert(
@@ -418,20 +423,87 @@ class TimeSeriesDashboard(pn.viewable.Viewer):
                 alert_type="warning"
             )
         
-        # Format timestamp
-        data = data.copy()
-        data['timestamp'] = data['timestamp'].dt.strftime('%Y-%m-%d %H:%M')
-        
         # Create table
         table = pn.widgets.Tabulator(
-            data,
+            self._format_table(data),
             pagination='local',
-            page_size=10,
+            page_size=TABLE_ROWS,
             sizing_mode="stretch_width"
         )
         
         return table
     
+    @staticmethod
+    def _format_table(data):
+        """Copy rows for the table, with formatted timestamps and values."""
+        data = data.copy()
+        data['timestamp'] = data['timestamp'].dt.strftime('%Y-%m-%d %H:%M')
+        # Compact float32 readings would be shown with float32 rounding noise
+        values = data.columns.drop('timestamp')
+        data[values] = data[values].astype('float64').round(2)
+        return data
+    
+    def _live_plot(self, metric, color):
+        """Plot the live stream; the Buffer pushes only new rows to the browser."""
+        unit = self._get_unit_for_metric(metric)
+        title = f"{metric.replace('_', ' ').title()} ({unit}) - Live"
+        plot = hv.DynamicMap(
+            lambda data: hv.Curve(data, 'timestamp', metric),
+            streams=[self._live_buffer]
+        )
+        return pmui.Paper(
+            pn.pane.HoloViews(
+                plot.opts(
+                    color=color,
+                    title=title,
+                    xlabel='Time',
+                    ylabel=unit,
+                    responsive=True,
+                    min_height=300
+                ),
+                sizing_mode="stretch_width"
+            ),
+            sizing_mode="stretch_width"
+        )
+    
+    @param.depends("live", watch=True)
+    def _toggle_live(self):
+        """Start or stop the periodic stream updates."""
+        if self.live and self._live_callback is None:
+            self._live_callback = pn.state.add_periodic_callback(
+                self._stream_update, period=LIVE_PERIOD_MS
+            )
+        elif not self.live and self._live_callback is not None:
+            self._live_callback.stop()
+            self._live_callback = None
+    
+    def _stream_update(self):
+        """Append the next readings and push them to all views as deltas."""
+        last = pd.Series({name: self._ring.last(name) for name in self._ring.columns})
+        rows = generate_live_readings(last, rng=self._rng)
+        self._ring.append(rows)
+        self._update_stats(rows)
+        self._live_buffer.send(rows)
+        self._live_table.stream(self._format_table(rows), rollover=TABLE_ROWS)
+    
+    @param.depends("days", watch=True)
+    def _reset_stats(self):
+        """Rebuild the window statistics, once per change of the time range."""
+        window = datetime.timedelta(days=int(self.days))
+        self._stats = {column: RollingStats(window) for column in self.store.columns}
+        self._update_stats(self.filtered_data)
+        if self._ring.total > 1:
+            # Readings streamed after the stored data
+            live = self._ring.to_frame()
+            self._update_stats(live[live['timestamp'] > self.store.end])
+    
+    def _update_stats(self, rows):
+        """Append rows to the statistics of every metric and publish them."""
+        times = rows['timestamp'].to_numpy()
+        for column, stats in self._stats.items():
+            stats.extend(times, rows[column].to_numpy())
+        self.kpis = {column: stats.snapshot() for column, stats in self._stats.items()}
+    
     def _get_unit_for_metric(self, metric):
         """Get unit for a given metric."""
         units = {
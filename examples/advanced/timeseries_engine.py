@@ -0,0 +1,685 @@
+"""
+Time Series Engine for the Siemens iX Time Series Dashboard
+
+Reusable, NumPy/pandas-only building blocks behind
+``time_series_dashboard.py``:
+
+- ``RollupStore``: rollups of a sensor frame for every resampling frequency
+  and aggregation, computed once, kept sorted by time and queried by time
+  window with ``searchsorted`` slicing, so changing a widget costs
+  O(log n + window) instead of a scan and copy of the full frame
+- ``downsample``: LTTB and min-max downsampling to a number of pixel
+  buckets, so the points sent to the browser are bounded by the plot width
+  instead of the size of the data
+- ``RingBuffer``: preallocated NumPy columns holding the latest rows of a
+  live stream, appended to in O(rows) without reallocating
+- ``RollingStats``: current, min, max, mean and standard deviation over a
+  sliding time window, updated in O(1) amortized per appended sample
+- ``compact_frame``/``save_frame``/``load_frame``: a compact columnar layout
+  (int64 epoch timestamps plus one contiguous float32 block) wrapped by a
+  DataFrame without copying, persisted as ``.npy`` files that are
+  memory-mapped on load
+
+The module has no Panel dependency and can be used on its own:
+
+    from sensor_data import generate_sensor_data
+
+    store = RollupStore(generate_sensor_data(days=30, compact=True))
+    store.last(pd.Timedelta(days=7), frequency="6h", aggregation="max")
+"""
+
+import json
+from collections import deque
+from pathlib import Path
+from typing import Dict, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Aggregations offered by the dashboard, as pandas resampler methods
+AGGREGATIONS = ("mean", "median", "min", "max", "std")
+
+# Resampling frequencies offered by the dashboard (pandas offset aliases)
+FREQUENCIES = ("h", "2h", "6h", "D", "W")
+
+# Downsampling methods of ``downsample``
+DOWNSAMPLING = ("lttb", "minmax", "none")
+
+# Candidates per output point kept by the min-max preselection of LTTB
+LTTB_PRESELECTION = 4
+
+
+def compact_frame(
+    times: np.ndarray,
+    values: np.ndarray,
+    columns: Sequence[str],
+    time_column: str = "timestamp",
+) -> pd.DataFrame:
+    """
+    Wrap compact columnar data in a DataFrame without copying.
+
+    Parameters
+    ----------
+    times : np.ndarray
+        int64 epoch timestamps in nanoseconds
+    values : np.ndarray
+        ``(rows, columns)`` block, Fortran ordered so every column is
+        contiguous; pandas keeps it as a single block
+    columns : sequence of str
+        Names of the value columns
+    time_column : str, optional
+        Name of the timestamp column
+
+    Returns
+    -------
+    pd.DataFrame
+        Frame whose columns are views of ``times`` and ``values``
+    """
+    frame = pd.DataFrame(values, columns=list(columns), copy=False)
+    frame.insert(0, time_column, pd.Series(times.view("datetime64[ns]"), copy=False))
+    return frame
+
+
+def save_frame(data: pd.DataFrame, path, time_column: str = "timestamp") -> None:
+    """
+    Persist a frame in the compact columnar layout.
+
+    Writes ``timestamps.npy`` (int64 epoch nanoseconds), ``values.npy``
+    (Fortran-ordered float32 block) and ``columns.json`` into ``path``.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        Frame with a timestamp column and numeric value columns
+    path : str or Path
+        Directory to write, created if missing
+    time_column : str, optional
+        Name of the timestamp column
+    """
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    columns = [c for c in data.columns if c != time_column]
+    times = data[time_column].to_numpy().astype("datetime64[ns]").view(np.int64)
+    np.save(path / "timestamps.npy", times)
+    np.save(path / "values.npy", np.asfortranarray(data[columns].to_numpy(dtype=np.float32)))
+    (path / "columns.json").write_text(
+        json.dumps({"time_column": time_column, "columns": columns}), encoding="utf-8"
+    )
+
+
+def load_frame(path, mmap: bool = True) -> pd.DataFrame:
+    """
+    Load a frame written by :func:`save_frame`.
+
+    Parameters
+    ----------
+    path : str or Path
+        Directory written by ``save_frame``
+    mmap : bool, optional
+        If True, memory-map the (read-only) arrays instead of reading them,
+        so only the pages that are used become resident and processes
+        share them through the page cache
+
+    Returns
+    -------
+    pd.DataFrame
+        Frame whose columns are views of the loaded arrays
+    """
+    path = Path(path)
+    spec = json.loads((path / "columns.json").read_text(encoding="utf-8"))
+    mode = "r" if mmap else None
+    times = np.load(path / "timestamps.npy", mmap_mode=mode)
+    values = np.load(path / "values.npy", mmap_mode=mode)
+    return compact_frame(times, values, spec["columns"], spec["time_column"])
+
+
+def _frequency_span(frequency: str) -> pd.Timedelta:
+    """Length of one period of a pandas offset alias."""
+    offset = pd.tseries.frequencies.to_offset(frequency)
+    try:
+        return pd.Timedelta(offset.nanos)
+    except ValueError:
+        # Anchored offsets ('W' is 'W-SUN') measured from a period start, so
+        # the distance to the epoch's next anchor does not shorten them
+        origin = offset.rollback(pd.Timestamp(0))
+        return (origin + offset) - origin
+
+
+class RollupStore:
+    """
+    Multi-resolution, read-only store of a time series frame.
+
+    For every frequency and aggregation, the resampled frame is computed once
+    at construction. Frequencies not coarser than the sampling interval of the
+    data are served from the raw frame itself. All frames are sorted by time,
+    and window queries return slices of them (views under pandas
+    Copy-on-Write), never copies.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        Frame with a timestamp column and numeric value columns
+    frequencies : sequence of str, optional
+        Resampling frequencies to precompute (pandas offset aliases)
+    aggregations : sequence of str, optional
+        Aggregations to precompute, names of pandas resampler methods
+    time_column : str, optional
+        Name of the timestamp column
+    """
+
+    def __init__(
+        self,
+        data: pd.DataFrame,
+        frequencies: Sequence[str] = FREQUENCIES,
+        aggregations: Sequence[str] = AGGREGATIONS,
+        time_column: str = "timestamp",
+    ):
+        if not data[time_column].is_monotonic_increasing:
+            data = data.sort_values(time_column, ignore_index=True)
+        self.time_column = time_column
+        self.frequencies = tuple(frequencies)
+        self.aggregations = tuple(aggregations)
+        self.columns = [c for c in data.columns if c != time_column]
+        self.data = data
+        self._times = data[time_column].to_numpy()
+
+        # Sampling interval of the raw data; coarser frequencies get rollups
+        steps = np.diff(self._times[: 1024])
+        self.interval = pd.Timedelta(np.median(steps)) if len(steps) else pd.Timedelta(0)
+
+        self._rollups: Dict[Tuple[str, str], pd.DataFrame] = {}
+        self._rollup_times: Dict[str, np.ndarray] = {}
+        indexed = data.set_index(time_column)
+        for frequency in self.frequencies:
+            if _frequency_span(frequency) <= self.interval:
+                continue
+            resampled = indexed.resample(frequency)
+            for aggregation in self.aggregations:
+                frame = getattr(resampled, aggregation)().reset_index()
+                self._rollups[frequency, aggregation] = frame
+            self._rollup_times[frequency] = frame[time_column].to_numpy()
+
+    def __len__(self) -> int:
+        return len(self._times)
+
+    @property
+    def start(self) -> pd.Timestamp:
+        """Timestamp of the first sample."""
+        return pd.Timestamp(self._times[0])
+
+    @property
+    def end(self) -> pd.Timestamp:
+        """Timestamp of the last sample."""
+        return pd.Timestamp(self._times[-1])
+
+    def frame(
+        self, frequency: Optional[str] = None, aggregation: str = "mean"
+    ) -> Tuple[pd.DataFrame, np.ndarray]:
+        """
+        Get a full resolution and its sorted timestamps.
+
+        Parameters
+        ----------
+        frequency : str, optional
+            Resampling frequency, None for the raw data
+        aggregation : str, optional
+            Aggregation of the rollup, ignored for the raw data
+
+        Returns
+        -------
+        tuple of (pd.DataFrame, np.ndarray)
+            The (shared, not to be modified) frame and its timestamps
+        """
+        if frequency is None or frequency not in self._rollup_times:
+            if frequency is not None and frequency not in self.frequencies:
+                raise ValueError(f"Frequency {frequency!r} is not precomputed")
+            return self.data, self._times
+        if aggregation not in self.aggregations:
+            raise ValueError(f"Aggregation {aggregation!r} is not precomputed")
+        return self._rollups[frequency, aggregation], self._rollup_times[frequency]
+
+    def window(
+        self,
+        start=None,
+        end=None,
+        frequency: Optional[str] = None,
+        aggregation: str = "mean",
+    ) -> pd.DataFrame:
+        """
+        Get the rows with ``start <= timestamp <= end``.
+
+        Rollup rows are those of every period overlapping the window,
+        including the period ``start`` falls into, which begins before it.
+        They aggregate their whole period.
+
+        Parameters
+        ----------
+        start, end : timestamp-like, optional
+            Window bounds, None for unbounded
+        frequency : str, optional
+            Resampling frequency, None for the raw data
+        aggregation : str, optional
+            Aggregation of the rollup
+
+        Returns
+        -------
+        pd.DataFrame
+            Slice of the stored frame
+        """
+        frame, times = self.frame(frequency, aggregation)
+        if start is None:
+            lo = 0
+        elif times is self._times:
+            lo = times.searchsorted(_as_time(start, times), "left")
+        else:
+            # Rollup rows are labelled by their period start
+            lo = max(times.searchsorted(_as_time(start, times), "right") - 1, 0)
+        hi = len(times) if end is None else times.searchsorted(_as_time(end, times), "right")
+        return frame.iloc[lo:hi]
+
+    def last(
+        self,
+        duration: pd.Timedelta,
+        frequency: Optional[str] = None,
+        aggregation: str = "mean",
+    ) -> pd.DataFrame:
+        """
+        Get the rows of the trailing ``duration`` up to the last sample.
+
+        Parameters
+        ----------
+        duration : pd.Timedelta
+            Length of the window
+        frequency : str, optional
+            Resampling frequency, None for the raw data
+        aggregation : str, optional
+            Aggregation of the rollup
+
+        Returns
+        -------
+        pd.DataFrame
+            Slice of the stored frame
+        """
+        if not len(self):
+            return self.data
+        return self.window(self.end - duration, None, frequency, aggregation)
+
+
+def _as_time(value, times: np.ndarray) -> np.datetime64:
+    """Convert a timestamp-like to the datetime64 unit of ``times``."""
+    return pd.Timestamp(value).to_datetime64().astype(times.dtype)
+
+
+def _as_numeric(x: np.ndarray) -> np.ndarray:
+    """Float offsets from the first value, for datetime or numeric ``x``."""
+    if x.dtype.kind == "M":
+        x = x.view(np.int64)
+    return (x - x[0]).astype(np.float64)
+
+
+def _bucket_starts(x: np.ndarray, n_buckets: int) -> np.ndarray:
+    """Start index of every non-empty one of ``n_buckets`` equal-width x buckets."""
+    edges = np.linspace(x[0], x[-1], n_buckets + 1)[1:-1]
+    return np.unique(np.concatenate(([0], x.searchsorted(edges, "left"))))
+
+
+def _first_match(y: np.ndarray, starts: np.ndarray, reduce: np.ufunc) -> np.ndarray:
+    """Index of the first ``reduce`` extremum (NaN ignored) of every bucket."""
+    values = reduce.reduceat(y, starts)
+    counts = np.diff(np.append(starts, len(y)))
+    hits = np.flatnonzero(y == np.repeat(values, counts))
+    if not len(hits):
+        return starts
+    position = hits.searchsorted(starts)
+    candidates = hits[np.minimum(position, len(hits) - 1)]
+    ends = starts + counts
+    # Buckets without a match (all NaN) keep their first point
+    valid = (position < len(hits)) & (candidates < ends)
+    return np.where(valid, candidates, starts)
+
+
+def minmax_indices(x: np.ndarray, y: np.ndarray, n_buckets: int) -> np.ndarray:
+    """
+    Select the minimum and maximum of ``y`` in equal-width buckets of ``x``.
+
+    Keeps the visual envelope of the data (every spike survives) with at most
+    ``2 * n_buckets`` points, plus the first and the last point.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Sorted x values (numeric or datetime64)
+    y : np.ndarray
+        Values
+    n_buckets : int
+        Number of buckets, usually the plot width in pixels
+
+    Returns
+    -------
+    np.ndarray
+        Sorted indices of the selected points
+    """
+    n = len(x)
+    if n <= 2 * n_buckets or n_buckets < 1:
+        return np.arange(n)
+    y = np.asarray(y, dtype=np.float64)
+    starts = _bucket_starts(_as_numeric(x), n_buckets)
+    selected = np.concatenate((
+        [0, n - 1],
+        _first_match(y, starts, np.fmin),
+        _first_match(y, starts, np.fmax),
+    ))
+    return np.unique(selected)
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Select ``n_out`` points with Largest-Triangle-Three-Buckets.
+
+    The points are split into ``n_out - 2`` buckets between the first and
+    the last point. From every bucket the point forming the largest triangle
+    with the previously selected point and the mean of the next bucket is
+    kept, which preserves the shape of the line. Large inputs are first
+    reduced to ``LTTB_PRESELECTION * n_out`` candidates with
+    :func:`minmax_indices` (MinMaxLTTB), so the cost is a vectorized O(n)
+    pass plus a loop over the output points.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Sorted x values (numeric or datetime64)
+    y : np.ndarray
+        Values
+    n_out : int
+        Number of points to keep, usually the plot width in pixels
+
+    Returns
+    -------
+    np.ndarray
+        Sorted indices of the selected points
+    """
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+    candidates = None
+    if n > 2 * LTTB_PRESELECTION * n_out:
+        candidates = minmax_indices(x, y, LTTB_PRESELECTION * n_out // 2)
+        x, y = x[candidates], y[candidates]
+        n = len(x)
+        if n <= n_out:
+            return candidates
+    x = _as_numeric(x)
+    y = np.asarray(y, dtype=np.float64)
+
+    # Buckets of (nearly) equal counts between the fixed first and last point
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    starts = edges[:-1]
+    counts = np.diff(edges)
+    finite = np.isfinite(y)
+    y_filled = np.where(finite, y, 0.0)
+    # Mean of the following bucket (the last point for the last bucket)
+    mean_x = np.append(np.add.reduceat(x[1 : n - 1], starts - 1) / counts, x[-1])[1:]
+    sums = np.add.reduceat(y_filled[1 : n - 1], starts - 1)
+    valid = np.add.reduceat(finite[1 : n - 1].astype(np.intp), starts - 1)
+    mean_y = np.append(sums / np.maximum(valid, 1), y[-1])[1:]
+
+    selected = np.empty(n_out, dtype=np.intp)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i, (lo, hi) in enumerate(zip(starts, edges[1:])):
+        ax, ay = x[a], y[a]
+        area = np.abs(
+            (ax - mean_x[i]) * (y[lo:hi] - ay) - (ax - x[lo:hi]) * (mean_y[i] - ay)
+        )
+        a = lo + int(np.argmax(np.nan_to_num(area, nan=-1.0)))
+        selected[i + 1] = a
+    return selected if candidates is None else candidates[selected]
+
+
+def downsample(x: np.ndarray, y: np.ndarray, n_out: int, method: str = "lttb") -> np.ndarray:
+    """
+    Select the points of a line to draw with ``n_out`` pixels.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Sorted x values (numeric or datetime64)
+    y : np.ndarray
+        Values
+    n_out : int
+        Plot width in pixels
+    method : str, optional
+        'lttb' (at most ``n_out`` points, shape preserving), 'minmax' (at most
+        ``2 * n_out`` points, envelope preserving) or 'none'
+
+    Returns
+    -------
+    np.ndarray
+        Sorted indices of the selected points
+    """
+    if method == "lttb":
+        return lttb_indices(x, y, n_out)
+    if method == "minmax":
+        return minmax_indices(x, y, n_out)
+    if method == "none":
+        return np.arange(len(x))
+    raise ValueError(f"Downsampling method must be one of {DOWNSAMPLING}")
+
+
+class RingBuffer:
+    """
+    Fixed-capacity buffer of the latest rows of a stream, stored column-wise.
+
+    Every column is one NumPy array preallocated to ``capacity`` rows. Appending
+    writes the new rows in place, overwriting the oldest ones, so memory stays
+    constant and an append costs O(rows appended).
+
+    Parameters
+    ----------
+    dtypes : mapping of str to dtype
+        Column names and their dtypes, e.g. ``frame.dtypes.to_dict()``
+    capacity : int
+        Number of rows kept
+    """
+
+    def __init__(self, dtypes: Mapping[str, np.dtype], capacity: int):
+        if capacity < 1:
+            raise ValueError("Capacity must be at least 1")
+        self.capacity = capacity
+        self.columns = {name: np.empty(capacity, dtype=dtype) for name, dtype in dtypes.items()}
+        self._start = 0
+        self._size = 0
+        # Rows appended over the lifetime of the buffer
+        self.total = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, rows: pd.DataFrame) -> None:
+        """
+        Append rows, dropping the oldest ones beyond the capacity.
+
+        Parameters
+        ----------
+        rows : pd.DataFrame
+            Rows with (at least) the buffer's columns
+        """
+        n = len(rows)
+        self.total += n
+        if n >= self.capacity:
+            rows, n = rows.iloc[n - self.capacity :], self.capacity
+        end = (self._start + self._size) % self.capacity
+        # The rows wrap around the end of the arrays at most once
+        first = min(n, self.capacity - end)
+        for name, column in self.columns.items():
+            values = rows[name].to_numpy()
+            column[end : end + first] = values[:first]
+            column[: n - first] = values[first:]
+        overflow = max(0, self._size + n - self.capacity)
+        self._start = (self._start + overflow) % self.capacity
+        self._size = min(self._size + n, self.capacity)
+
+    def column(self, name: str) -> np.ndarray:
+        """Values of a column, oldest first (a copy if the buffer wrapped)."""
+        column = self.columns[name]
+        end = self._start + self._size
+        if end <= self.capacity:
+            return column[self._start : end]
+        return np.concatenate((column[self._start :], column[: end - self.capacity]))
+
+    def last(self, name: str):
+        """Latest value of a column."""
+        if not self._size:
+            raise IndexError("The buffer is empty")
+        return self.columns[name][(self._start + self._size - 1) % self.capacity]
+
+    def to_frame(self) -> pd.DataFrame:
+        """The buffered rows as a new frame, oldest first."""
+        return pd.DataFrame({name: self.column(name) for name in self.columns})
+
+
+class RollingStats:
+    """
+    Running statistics of a series over a sliding time window.
+
+    Samples are appended in time order; those older than ``window`` before
+    the newest sample leave the window. The minimum and maximum are kept in
+    monotonic deques, the mean and standard deviation with Welford's
+    algorithm (combined per batch as by Chan et al.), and leaving samples are
+    subtracted again, so appending costs O(1) amortized per sample and
+    reading all statistics O(1). NaN samples are ignored.
+
+    Parameters
+    ----------
+    window : timedelta-like, optional
+        Length of the window, None to keep all samples
+    """
+
+    def __init__(self, window=None):
+        self.window = None if window is None else pd.Timedelta(window).to_timedelta64()
+        # Samples in the window, as (times, values) batches
+        self._batches = deque()
+        # (time, value) of the samples smaller (larger) than all later ones
+        self._min = deque()
+        self._max = deque()
+        self.count = 0
+        self.mean = np.nan
+        self._m2 = 0.0
+        self.current = np.nan
+
+    def extend(self, times: np.ndarray, values: np.ndarray) -> None:
+        """
+        Append samples, newer than those appended before.
+
+        Parameters
+        ----------
+        times : np.ndarray
+            Sorted datetime64 timestamps
+        values : np.ndarray
+            Values of the samples
+        """
+        if not len(times):
+            return
+        values = np.asarray(values, dtype=np.float64)
+        cutoff = None
+        if self.window is not None:
+            # Samples that are out of the window already are never added
+            cutoff = times[-1] - self.window
+            first = times.searchsorted(cutoff, "left")
+            times, values = times[first:], values[first:]
+        finite = np.isfinite(values)
+        if not finite.all():
+            times, values = times[finite], values[finite]
+        if len(values):
+            self._add(times, values)
+        if cutoff is not None:
+            self._evict(cutoff)
+
+    def append(self, time, value: float) -> None:
+        """Append a single sample."""
+        self.extend(np.array([time], dtype="datetime64[ns]"), np.array([value]))
+
+    def _add(self, times: np.ndarray, values: np.ndarray) -> None:
+        n = len(values)
+        mean = values.mean()
+        m2 = float(np.square(values - mean).sum())
+        if self.count:
+            total = self.count + n
+            delta = mean - self.mean
+            self._m2 += m2 + delta * delta * self.count * n / total
+            self.mean += delta * n / total
+            self.count = total
+        else:
+            self.count, self.mean, self._m2 = n, mean, m2
+        self._batches.append((times, values))
+        self.current = values[-1]
+
+        # A sample stays a min (max) candidate while no smaller (larger)
+        # sample follows it
+        later_min = np.append(np.minimum.accumulate(values[::-1])[::-1][1:], np.inf)
+        later_max = np.append(np.maximum.accumulate(values[::-1])[::-1][1:], -np.inf)
+        low, high = values.min(), values.max()
+        while self._min and self._min[-1][1] >= low:
+            self._min.pop()
+        while self._max and self._max[-1][1] <= high:
+            self._max.pop()
+        keep = values < later_min
+        self._min.extend(zip(times[keep], values[keep]))
+        keep = values > later_max
+        self._max.extend(zip(times[keep], values[keep]))
+
+    def _remove(self, values: np.ndarray) -> None:
+        n = len(values)
+        if n >= self.count:
+            self.count, self.mean, self._m2 = 0, np.nan, 0.0
+            return
+        mean = values.mean()
+        m2 = float(np.square(values - mean).sum())
+        rest = self.count - n
+        rest_mean = (self.count * self.mean - n * mean) / rest
+        delta = mean - rest_mean
+        self._m2 = max(self._m2 - m2 - delta * delta * rest * n / self.count, 0.0)
+        self.mean, self.count = rest_mean, rest
+
+    def _evict(self, cutoff: np.datetime64) -> None:
+        """Remove the samples older than ``cutoff``."""
+        while self._batches:
+            times, values = self._batches[0]
+            if times[-1] >= cutoff:
+                first = times.searchsorted(cutoff, "left")
+                if first:
+                    self._remove(values[:first])
+                    self._batches[0] = (times[first:], values[first:])
+                break
+            self._remove(values)
+            self._batches.popleft()
+        while self._min and self._min[0][0] < cutoff:
+            self._min.popleft()
+        while self._max and self._max[0][0] < cutoff:
+            self._max.popleft()
+
+    @property
+    def min(self) -> float:
+        """Minimum of the window."""
+        return self._min[0][1] if self._min else np.nan
+
+    @property
+    def max(self) -> float:
+        """Maximum of the window."""
+        return self._max[0][1] if self._max else np.nan
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation of the window."""
+        return float(np.sqrt(self._m2 / (self.count - 1))) if self.count > 1 else np.nan
+
+    def snapshot(self) -> Dict[str, float]:
+        """All statistics at once: current, min, max, mean, std and count."""
+        return {
+            "current": self.current,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.mean,
+            "std": self.std,
+            "count": self.count,
+        }
@@ -3,7 +3,9 @@ Theme Switching with Siemens iX
 
 This example demonstrates how to implement light/dark theme switching using 
 the Material UI ThemeToggle component with Siemens iX themes. It showcases
-how colors, components, and layouts adapt seamlessly between themes.
+how colors, components, and layouts adapt seamlessly between themes, and
+how custom styles follow the toggle through the ``--ix-*`` CSS variables
+without any server round trip.
 
 Run with:
     panel serve theme_switching.py --dev --show
@@ -14,8 +16,8 @@ Or:
 import panel as pn
 import panel_material_ui as pmui
 import param
-from panel_siemens_ix.theme import siemens_ix_light_theme, siemens_ix_dark_theme
-from panel_siemens_ix.colors import get_colors
+from panel_siemens_ix import configure, get_context
+from panel_siemens_ix.bundle import css_var
 
 
 class ThemeSwitchingDemo(pn.viewable.Viewer):
@@ -52,6 +54,9 @@ class ThemeSwitchingDemo(pn.viewable.Viewer):
         
         # Color demonstration section
         self._color_demo = self._create_color_demo()
+
+        # CSS variable demonstration
+        self._variables_demo = self._create_variables_demo()
         
         # Typography demonstration
         self._typography_demo = self._create_typography_demo()
@@ -93,6 +98,46 @@ class ThemeSwitchingDemo(pn.viewable.Viewer):
             styles={"padding": "20px", "marginBottom": "20px"}
         )
     
+    def _create_variables_demo(self):
+        """Create CSS variable demonstration."""
+
+        def create_swatch(name):
+            """Helper to create a swatch styled only with CSS variables."""
+            return pmui.Paper(
+                pmui.Typography(f"--ix-{name}", variant="caption", styles={"fontFamily": "monospace"}),
+                elevation=0,
+                styles={
+                    "backgroundColor": css_var(name),
+                    "color": css_var(f"{name}-contrast"),
+                    "padding": "12px",
+                    "margin": "4px",
+                    "borderRadius": "4px",
+                    "textAlign": "center"
+                }
+            )
+
+        swatches = [create_swatch(f"categorical-{i}") for i in range(1, 7)]
+
+        # The gradient is a CSS variable as well
+        gradient = pn.pane.HTML(
+            f'''<div style="height: 32px; border-radius: 4px;
+            border: 1px solid {css_var('border', 'std')};
+            background: {css_var('cmap-gradient')}"></div>'''
+        )
+
+        return pmui.Card(
+            pmui.Typography("CSS Variables", variant="h6", styles={"marginBottom": "15px"}),
+            pmui.Typography(
+                "These swatches are styled with var(--ix-*) references. The theme stylesheet "
+                "defines them for both modes, so the browser repaints them on toggle:",
+                variant="body2",
+                styles={"marginBottom": "15px"}
+            ),
+            pmui.Row(*swatches, styles={"flexWrap": "wrap"}),
+            gradient,
+            styles={"padding": "20px", "marginBottom": "20px"}
+        )
+
     def _create_typography_demo(self):
         """Create typography demonstration."""
         return pmui.Card(
@@ -233,6 +278,7 @@ class ThemeSwitchingDemo(pn.viewable.Viewer):
         self._layout = pmui.Container(
             header,
             self._color_demo,
+            self._variables_demo,
             self._typography_demo, 
             self._component_demo,
             self._controls_demo,
@@ -253,14 +299,10 @@ class ThemeSwitchingDemo(pn.viewable.Viewer):
         """
         instance = cls(**params)
         
-        # Create Page with both theme configurations
-        page = pmui.Page(
+        # DO create the Page from the session context, which provides the
+        # theme configuration and CSS variables for both modes
+        page = get_context().page(
             title="Theme Switching - Siemens iX",
-            # DO provide theme configuration for both modes
-            theme_config={
-                "light": siemens_ix_light_theme,
-                "dark": siemens_ix_dark_theme
-            },
             main=[instance],
             sidebar=[
                 pmui.Typography("Theme Information", variant="h6"),
@@ -294,6 +336,9 @@ class ThemeSwitchingDemo(pn.viewable.Viewer):
 # Enable Panel extensions
 pn.extension()
 
+# Apply Siemens iX configuration
+configure()
+
 
 # DO provide a method to serve the app with `python`
 if __name__ == "__main__":
@@ -6,7 +6,8 @@ for data visualization with hvPlot and Plotly. It showcases:
 
 - Continuous colormaps for sequential data
 - Categorical palettes for discrete categories
-- Theme-optimized colors for light and dark modes
+- Theme-optimized colors for light and dark modes, switched in the
+  browser through the ``--ix-*`` CSS variables of the theme bundle
 - Integration patterns with popular plotting libraries
 
 Run with:
@@ -24,13 +25,14 @@ import datetime
 from typing import List
 
 # Import Siemens iX components
-from panel_siemens_ix import configure
-from panel_siemens_ix.theme import siemens_ix_light_theme, siemens_ix_dark_theme
+from panel_siemens_ix import configure, get_context
+from panel_siemens_ix.bundle import css_var
 from panel_siemens_ix.colors import (
-    get_colors,
     get_continuous_cmap,
     get_categorical_palette,
 )
+from panel_siemens_ix.contrast import best_contrast
+from panel_siemens_ix.plotting import PLOTLY_TEMPLATES
 
 # Try to import plotting libraries
 try:
@@ -178,7 +180,7 @@ class ChartColorsDemo(pn.viewable.Viewer):
     current_theme = param.Selector(
         default="light",
         objects=["light", "dark"],
-        doc="Current theme mode"
+        doc="Theme mode of the page, for the charts and swatches rendered server-side"
     )
     chart_library = param.Selector(
         default="hvplot",
@@ -204,25 +206,25 @@ class ChartColorsDemo(pn.viewable.Viewer):
         doc="Show categorical palette examples"
     )
 
-    def __init__(self, **params):
-        super().__init__(**params)
+    @param.depends('n_categories', 'show_continuous', 'show_categorical', 'current_theme')
+    def palettes_panel(self):
+        """Create the palette swatches of the colormap and the chart palette."""
+        palettes = []
 
-        # Initialize the theme
-        self._update_theme()
+        # Continuous colormap demo
+        if self.show_continuous:
+            palettes.extend(self._create_continuous_demo())
+
+        # Categorical palette demo
+        if self.show_categorical:
+            palettes.extend(self._create_categorical_demo())
 
-    @param.depends('current_theme', watch=True)
-    def _update_theme(self):
-        """Update the theme when changed."""
-        # Set the default theme configuration
-        pmui.Page.param.theme_config.default = dict(
-            light=siemens_ix_light_theme,
-            dark=siemens_ix_dark_theme
+        return pn.GridBox(
+            *palettes,
+            ncols=1
         )
-        # Note: The actual theme switching is handled by the Page component
-        # This method could be used to trigger updates if needed
 
-    @param.depends('chart_library', 'chart_type', 'n_categories',
-                   'show_continuous', 'show_categorical', 'current_theme')
+    @param.depends('chart_library', 'chart_type', 'n_categories', 'current_theme')
     def charts_panel(self):
         """Create the main charts display panel."""
         charts = []
@@ -236,14 +238,6 @@ class ChartColorsDemo(pn.viewable.Viewer):
             )
         )
 
-        # Continuous colormap demo
-        if self.show_continuous:
-            charts.extend(self._create_continuous_demo())
-
-        # Categorical palette demo
-        if self.show_categorical:
-            charts.extend(self._create_categorical_demo())
-
         # Specific chart type demos
         if self.chart_type == "line":
             charts.extend(self._create_line_charts())
@@ -273,23 +267,14 @@ class ChartColorsDemo(pn.viewable.Viewer):
             )
         )
 
-        # Get current colors
-        colors = get_colors(self.current_theme)
-
-        # Create a simple gradient visualization
-        n_colors = 128
-        cmap = get_continuous_cmap(
-            dark_theme=(self.current_theme == "dark"),
-            n_colors=n_colors
-        )
-
-        # Create gradient visualization
+        # The gradient and stops are CSS variables of the theme bundle, so
+        # the browser repaints them on theme toggle without a server trip
         gradient_html = f"""
         <div style="
             width: 100%;
             height: 40px;
-            background: linear-gradient(to right, {', '.join(cmap[::max(1, n_colors//20)])});
-            border: 1px solid {colors.border['std']};
+            background: {css_var('cmap-gradient')};
+            border: 1px solid {css_var('border', 'std')};
             border-radius: 4px;
             margin-bottom: 10px;
         "></div>
@@ -299,14 +284,14 @@ class ChartColorsDemo(pn.viewable.Viewer):
 
         # Add color samples
         color_samples = []
-        for i in [0, n_colors//4, n_colors//2, 3*n_colors//4, n_colors-1]:
+        for stop in ("start", "mid", "end"):
             color_samples.append(
                 pmui.Paper(
-                    pmui.Typography(cmap[i], variant="caption", styles={"fontFamily": "monospace"}),
+                    pmui.Typography(f"--ix-cmap-{stop}", variant="caption", styles={"fontFamily": "monospace"}),
                     elevation=0,
                     styles={
-                        "backgroundColor": cmap[i],
-                        "color": "white" if self.current_theme == "dark" else "black",
+                        "backgroundColor": css_var(f"cmap-{stop}"),
+                        "color": css_var("text", "primary"),
                         "padding": "8px",
                         "borderRadius": "4px",
                         "textAlign": "center"
@@ -315,7 +300,7 @@ class ChartColorsDemo(pn.viewable.Viewer):
             )
 
         components.append(
-            pn.GridBox(*color_samples, ncols=5)
+            pn.GridBox(*color_samples, ncols=3)
         )
 
         return components
@@ -332,19 +317,19 @@ class ChartColorsDemo(pn.viewable.Viewer):
             )
         )
 
-        # Get palette
+        # Create color swatches of the palette the charts use. Palettes of
+        # fewer than 17 colors are a selection of the --ix-categorical-<i>
+        # variables, so these are rendered for the current theme instead
         palette = get_categorical_palette(
             dark_theme=(self.current_theme == "dark"),
             n_colors=self.n_categories
         )
-
-        # Create color swatches
         swatches = []
-        for i, color in enumerate(palette):
+        for i, (color, text) in enumerate(zip(palette, best_contrast(palette)), start=1):
             swatches.append(
                 pmui.Paper(
                     pmui.Typography(
-                        f"{i+1}",
+                        f"{i}",
                         variant="body2",
                         styles={"fontWeight": "bold"}
                     ),
@@ -356,7 +341,7 @@ class ChartColorsDemo(pn.viewable.Viewer):
                     elevation=0,
                     styles={
                         "backgroundColor": color,
-                        "color": self._get_text_color(color),
+                        "color": text,
                         "padding": "12px",
                         "borderRadius": "4px",
                         "textAlign": "center",
@@ -405,7 +390,6 @@ class ChartColorsDemo(pn.viewable.Viewer):
         if self.chart_library in ["plotly", "both"] and _PLOTLY_AVAILABLE:
             # Plotly line chart
             fig = go.Figure()
-            colors = get_colors(self.current_theme)
 
             for i, series in enumerate(data['series'].unique()):
                 series_data = data[data['series'] == series]
@@ -424,9 +408,7 @@ class ChartColorsDemo(pn.viewable.Viewer):
             fig.update_layout(
                 height=300,
                 showlegend=True,
-                plot_bgcolor=colors.background['paper'],
-                paper_bgcolor=colors.background['default'],
-                font=dict(color=colors.text['primary'])
+                template=PLOTLY_TEMPLATES[self.current_theme]
             )
 
             components.append(pn.pane.Plotly(fig))
@@ -474,7 +456,6 @@ class ChartColorsDemo(pn.viewable.Viewer):
                 dark_theme=(self.current_theme == "dark"),
                 n_colors=self.n_categories
             )
-            colors = get_colors(self.current_theme)
 
             fig = px.scatter(
                 data,
@@ -487,9 +468,7 @@ class ChartColorsDemo(pn.viewable.Viewer):
             )
 
             fig.update_layout(
-                plot_bgcolor=colors.background['paper'],
-                paper_bgcolor=colors.background['default'],
-                font=dict(color=colors.text['primary'])
+                template=PLOTLY_TEMPLATES[self.current_theme]
             )
 
             components.append(pn.pane.Plotly(fig))
@@ -534,7 +513,6 @@ class ChartColorsDemo(pn.viewable.Viewer):
                 dark_theme=(self.current_theme == "dark"),
                 n_colors=self.n_categories
             )
-            colors = get_colors(self.current_theme)
 
             fig = px.bar(
                 data,
@@ -546,9 +524,7 @@ class ChartColorsDemo(pn.viewable.Viewer):
             )
 
             fig.update_layout(
-                plot_bgcolor=colors.background['paper'],
-                paper_bgcolor=colors.background['default'],
-                font=dict(color=colors.text['primary']),
+                template=PLOTLY_TEMPLATES[self.current_theme],
                 showlegend=False
             )
 
@@ -588,27 +564,15 @@ class ChartColorsDemo(pn.viewable.Viewer):
 
         if self.chart_library in ["plotly", "both"] and _PLOTLY_AVAILABLE:
             # Plotly heatmap
-            cmap = get_continuous_cmap(dark_theme=(self.current_theme == "dark"))
-            colors = get_colors(self.current_theme)
-
-            # Create custom colorscale for Plotly
-            colorscale = []
-            step = len(cmap) // 10
-            for i in range(0, len(cmap), step):
-                colorscale.append([i / len(cmap), cmap[i]])
-            colorscale.append([1.0, cmap[-1]])
-
+            # The Siemens iX template supplies the sequential colorscale
             fig = go.Figure(data=go.Heatmap(
                 z=data.pivot(index='row', columns='col', values='value').values,
-                colorscale=colorscale,
                 showscale=True
             ))
 
             fig.update_layout(
                 height=400,
-                plot_bgcolor=colors.background['paper'],
-                paper_bgcolor=colors.background['default'],
-                font=dict(color=colors.text['primary'])
+                template=PLOTLY_TEMPLATES[self.current_theme]
             )
 
             components.append(pn.pane.Plotly(fig))
@@ -657,7 +621,6 @@ class ChartColorsDemo(pn.viewable.Viewer):
                 dark_theme=(self.current_theme == "dark"),
                 n_colors=3
             )
-            colors = get_colors(self.current_theme)
 
             fig = go.Figure()
 
@@ -675,33 +638,19 @@ class ChartColorsDemo(pn.viewable.Viewer):
 
             fig.update_layout(
                 height=300,
-                plot_bgcolor=colors.background['paper'],
-                paper_bgcolor=colors.background['default'],
-                font=dict(color=colors.text['primary'])
+                template=PLOTLY_TEMPLATES[self.current_theme]
             )
 
             components.append(pn.pane.Plotly(fig))
 
         return components
 
-    def _get_text_color(self, bg_color: str) -> str:
-        """Determine if white or black text has better contrast."""
-        # Simple luminance calculation
-        bg_color = bg_color.lstrip('#')
-        r, g, b = tuple(int(bg_color[i:i+2], 16) for i in (0, 2, 4))
-        luminance = (0.299 * r + 0.587 * g + 0.114 * b) / 255
-        return 'white' if luminance < 0.5 else 'black'
-
     def controls_panel(self):
         """Create the controls panel."""
         controls = [
             pmui.Typography("Chart Controls", variant="h6", styles={"marginBottom": "15px"}),
 
             pmui.Column(
-                pmui.Select.from_param(
-                    self.param.current_theme,
-                    label="Theme"
-                ),
                 pmui.Select.from_param(
                     self.param.chart_library,
                     label="Chart Library"
@@ -795,10 +744,33 @@ fig = px.bar(
                       """# Configure Siemens iX theme
 from panel_siemens_ix import configure
 
-configure()
+configure(plotting=True)
 
-# Colors adapt automatically to theme
-colors = get_colors("dark" if pn.state.theme == "dark" else "light")""",
+# Bokeh/HoloViews plots follow the page theme; Plotly
+# and Altair use the registered light or dark variant
+fig.update_layout(template=PLOTLY_TEMPLATES["dark"])""",
+                      variant="body2",
+                      styles={"fontFamily": "monospace", "fontSize": "12px"}
+                  )
+              ),
+              styles={"marginBottom": "10px"}
+          ),
+
+          pmui.Card(
+              pmui.Column(
+                  pmui.Typography("Styling with CSS Variables", variant="subtitle1", styles={"marginBottom": "10px"}),
+                  pmui.Typography(
+                      """# Reference theme colors as CSS variables;
+# the theme toggle repaints them in the browser
+from panel_siemens_ix.bundle import css_var
+
+pmui.Paper(styles={
+    "backgroundColor": css_var("categorical-1"),
+    "color": css_var("categorical-1-contrast"),
+})
+pn.pane.HTML(
+    f'<div style="background: {css_var("cmap-gradient")}">'
+)""",
                       variant="body2",
                       styles={"fontFamily": "monospace", "fontSize": "12px"}
                   )
@@ -836,6 +808,7 @@ colors = get_colors("dark" if pn.state.theme == "dark" else "light")""",
         )
 
         main_content = pmui.Paper(
+            self.palettes_panel,
             self.charts_panel,
             elevation=1,
             styles={"padding": "20px"}
@@ -857,25 +830,29 @@ colors = get_colors("dark" if pn.state.theme == "dark" else "light")""",
         """Create a servable app with theme switching capabilities."""
         instance = cls(**params)
 
-        # Create Page with both theme configurations
-        page = pmui.Page(
+        # The themed page loads the bundle stylesheet with the CSS variables
+        # of both modes, so the palette swatches switch in the browser
+        page = get_context().page(
             title="Siemens iX Chart Colors Demo",
-            theme_config={
-                "light": siemens_ix_light_theme,
-                "dark": siemens_ix_dark_theme
-            },
             main=[instance],
             theme_toggle=True
         )
 
+        # Only the charts rendered server-side follow the theme toggle
+        page.param.watch(
+            lambda event: setattr(instance, "current_theme", "dark" if event.new else "light"),
+            "dark_theme"
+        )
+        instance.current_theme = "dark" if page.dark_theme else "light"
+
         return page
 
 
 # Configure Panel extensions
 pn.extension()
 
-# Apply Siemens iX configuration
-configure(with_logo=True)
+# Apply Siemens iX configuration, including the plotting themes
+configure(with_logo=True, plotting=True)
 
 
 # Create and serve the demo
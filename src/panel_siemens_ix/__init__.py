@@ -2,99 +2,191 @@
 Panel Siemens iX - Material-UI theme based on Siemens iX design system
 """
 
-import panel as pn
-import panel_material_ui as pmui
+import importlib
+import threading
 from pathlib import Path
+from typing import List, Optional
 
-# Import theme functionality
+# Import theme functionality. Panel, panel_material_ui, NumPy and the
+# prebuilt theme dicts are only loaded when first needed.
 from .theme import (
     create_theme,
-    siemens_ix_light_theme,
-    siemens_ix_dark_theme,
+    merge_theme,
+    theme_diff,
     SiemensIXDarkColors,
 )
 from .colors import (
     SiemensIXLightColors,
     get_colors,
+    get_packed_colors,
     get_continuous_cmap,
+    get_colormap,
     get_categorical_palette,
+    palette_cache_info,
+    clear_palette_caches,
 )
+from .context import DISCONNECT_NOTIFICATION, SiemensIXContext, get_context
 
 __version__ = "0.1.0"
 
 # Custom notification message
-_DISCONNECT_NOTIFICATION: str = """The connection to the server was lost. Please refresh to \
-reconnect."""
+_DISCONNECT_NOTIFICATION: str = DISCONNECT_NOTIFICATION
 
 FAVICON_PATH = str(Path(__file__).parent / "static/sie-favicon_intranet.ico")
 LOGO_LIGHT_PATH = str(Path(__file__).parent / "static/sie-logo-black-rgb.svg")
 LOGO_DARK_PATH = str(Path(__file__).parent / "static/sie-logo-white-rgb.svg")
 
+# Attributes resolved on first access (PEP 562), mapped to their module
+_LAZY_ATTRIBUTES = {
+    "siemens_ix_light_theme": ".theme",
+    "siemens_ix_dark_theme": ".theme",
+    "SiemensIXColormap": ".colormap",
+    "PackedPalette": ".packed",
+}
 
-def _configure_session() -> None:
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(_LAZY_ATTRIBUTES[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _configure_session(context: SiemensIXContext) -> None:
     """
     Configure Panel session-specific settings.
 
     This includes disconnect notifications and other session-level configurations.
     """
-    pn.config.disconnect_notification = _DISCONNECT_NOTIFICATION
+    context.apply_session()
+
 
+# Context whose defaults are currently set on pmui.Page, and the stylesheets
+# pmui.Page had before the first one was applied
+_APPLIED_CONTEXT: Optional[SiemensIXContext] = None
+_BASE_STYLESHEETS: Optional[List[str]] = None
+_CONFIGURE_LOCK = threading.Lock()
 
-@pn.cache
-def _configure_general(with_logo: bool = True) -> None:
+
+def _configure_general(context: SiemensIXContext) -> None:
     """
     Configure general theme settings for Panel Material UI components.
 
     This includes theme configuration, CSS, fonts, logos, and component defaults.
+    The defaults are replaced by those of ``context`` unless it is the context
+    applied last, so configuring with other options later takes effect.
     """
-    # Page configuration
-    pmui.Page.param.theme_config.default = dict(
-        light=siemens_ix_light_theme, dark=siemens_ix_dark_theme
-    )
-    pmui.Page.param.sx.default = {
-        "&.mui-dark .title": {"color": get_colors("dark").text["primary"]},
-        "&.mui-light .title": {"color": get_colors("light").text["primary"]},
-        "& .title": {"fontSize": "1.em", "fontWeight":550}
-    }
-
-    # Brand assets configuration
-    if with_logo:
-        pmui.Page.param.logo.default = {"light": LOGO_LIGHT_PATH, "dark": LOGO_DARK_PATH}
-    else:
-        pmui.Page.param.logo.default = None
-    pmui.Page.favicon = FAVICON_PATH
-    # pmui.Page.meta.apple_touch_icon = ""  # Intentionally left empty
-
-    # Component-specific configurations
-    # pmui.Button.param.disable_elevation.default = True
-
-
-def configure(with_logo: bool = True) -> None:
+    global _APPLIED_CONTEXT, _BASE_STYLESHEETS
+    if context is _APPLIED_CONTEXT:
+        return
+    with _CONFIGURE_LOCK:
+        if context is _APPLIED_CONTEXT:
+            return
+        import panel_material_ui as pmui
+        from panel_material_ui.template.base import Meta
+
+        # Page configuration, with the stylesheets rebuilt from those
+        # pmui.Page had before, so each context's are added only once
+        if _BASE_STYLESHEETS is None:
+            _BASE_STYLESHEETS = list(pmui.Page.param.stylesheets.default or [])
+        pmui.Page.param.theme_config.default = dict(context.theme_config)
+        pmui.Page.param.stylesheets.default = _BASE_STYLESHEETS + list(context.stylesheets)
+        pmui.Page.param.sx.default = context.sx
+
+        # Brand assets configuration: minified logos inlined as SVG data URIs,
+        # favicon and touch icon served under content-hashed, cacheable URLs
+        pmui.Page.param.logo.default = context.logo
+        pmui.Page.favicon = context.favicon
+        Meta.param.apple_touch_icon.default = context.apple_touch_icon
+
+        # Component-specific configurations
+        # pmui.Button.param.disable_elevation.default = True
+        _APPLIED_CONTEXT = context
+
+
+def configure(
+    with_logo: bool = True,
+    theme_bundle: bool = False,
+    plotting: bool = False,
+    plotting_mode: str = "light",
+) -> SiemensIXContext:
     """
     Configure the complete theme for the application.
 
     This is the main entry point for applying the Orbitron brand theme
-    to a Panel Material UI application.
+    to a Panel Material UI application. It sets the defaults of
+    ``pmui.Page`` process-wide; when several apps with different options
+    share one server process, create pages from :func:`get_context`
+    instead, which leaves class defaults untouched.
+
+    Parameters
+    ----------
+    with_logo : bool, default=True
+        If True, show the Siemens logo in the page header.
+    theme_bundle : bool, default=False
+        If True, page styles are loaded from the precompiled,
+        content-hashed stylesheet in ``static/`` (see
+        :mod:`panel_siemens_ix.bundle`), which browsers cache long-term,
+        instead of being sent with every session. The stylesheet is always
+        loaded for its ``--ix-*`` CSS variables of both modes, which switch
+        with the theme toggle in the browser (see ``bundle.css_var``).
+    plotting : bool, default=False
+        If True, register Siemens iX Bokeh themes, Plotly templates, Altair
+        themes and HoloViews defaults once per process (see
+        :mod:`panel_siemens_ix.plotting`), so charts need no per-chart
+        styling.
+    plotting_mode : str, default="light"
+        Mode ('light' or 'dark') of the Plotly template, Altair theme and
+        HoloViews defaults used by charts that do not select one, e.g.
+        'dark' for apps using the dark theme. Bokeh themes always follow
+        the page's theme.
+
+    Returns
+    -------
+    SiemensIXContext
+        The shared configuration context for these options.
 
     Examples
     --------
     >>> from brand.mui import configure
     >>> configure()
     >>> app = pmui.Page(title="My Orbitron App")
+
+    Without touching ``pmui.Page`` defaults, once per session:
+
+    >>> page = get_context(with_logo=False).page(title="My Orbitron App")
     """
-    _configure_general(with_logo=with_logo)
-    _configure_session()
+    context = get_context(with_logo=with_logo, theme_bundle=theme_bundle)
+    _configure_general(context)
+    _configure_session(context)
+    if plotting:
+        from .plotting import register_plotting
+
+        register_plotting(default_mode=plotting_mode)
+    return context
 
 
 __all__ = [
     "configure",
+    "get_context",
+    "SiemensIXContext",
     "__version__",
     "create_theme",
+    "merge_theme",
+    "theme_diff",
     "get_colors",
+    "get_packed_colors",
+    "PackedPalette",
     "siemens_ix_light_theme",
     "siemens_ix_dark_theme",
     "SiemensIXDarkColors",
     "SiemensIXLightColors",
     "get_continuous_cmap",
+    "get_colormap",
+    "SiemensIXColormap",
     "get_categorical_palette",
+    "palette_cache_info",
+    "clear_palette_caches",
 ]
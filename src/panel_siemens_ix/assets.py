@@ -0,0 +1,386 @@
+"""
+Optimized brand assets for the Siemens iX theme.
+
+Builds minified, content-hashed copies of the Siemens logos and a compact
+multi-resolution favicon into the package's ``static/`` directory and checks
+them against byte-size budgets. At runtime the logos are inlined into the page
+as percent-encoded SVG data URIs, while the favicon and touch icon are served
+by Panel's component resource handler under URLs carrying the content hash
+(``?v=<hash>``), which the browser may cache indefinitely.
+
+Rebuild the assets after changing the source images with:
+    python -m panel_siemens_ix.assets
+
+Verify the shipped assets are current and within budget with:
+    python -m panel_siemens_ix.assets --check
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import re
+import sys
+from functools import cache
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+from urllib.parse import quote
+
+STATIC_DIR = Path(__file__).parent / "static"
+MANIFEST_PATH = STATIC_DIR / "siemens-ix-assets.manifest.json"
+
+# Asset name -> (source file in static/, output stem, output extension)
+ASSET_SOURCES: Dict[str, Tuple[str, str, str]] = {
+    "logo-light": ("sie-logo-black-rgb.svg", "sie-logo-black-rgb", "svg"),
+    "logo-dark": ("sie-logo-white-rgb.svg", "sie-logo-white-rgb", "svg"),
+    "logo-petrol": ("sie-logo-petrol-rgb.svg", "sie-logo-petrol-rgb", "svg"),
+    "favicon": ("sie-favicon_intranet.ico", "sie-favicon", "ico"),
+    "apple-touch-icon": ("sie-favicon_intranet.ico", "sie-apple-touch-icon", "png"),
+}
+
+# Maximum size in bytes of each generated asset
+SIZE_BUDGETS: Dict[str, int] = {
+    "logo-light": 2048,
+    "logo-dark": 2048,
+    "logo-petrol": 2048,
+    "favicon": 4096,
+    "apple-touch-icon": 8192,
+}
+
+FAVICON_SIZES: Tuple[int, ...] = (16, 32, 48)
+APPLE_TOUCH_ICON_SIZE = 180
+
+_XML_PROLOG = re.compile(r"<\?xml.*?\?>|<!DOCTYPE.*?>|<!--.*?-->", re.S)
+_SVG_TAG = re.compile(r"<svg\b[^>]*>", re.S)
+_ROOT_ATTRIBUTES = re.compile(r'\s(?:version|id|x|y|xml:space|style)="[^"]*"')
+_NUMBER = re.compile(r"-?(?:\d+\.\d*|\.\d+|\d+)(?:[eE][-+]?\d+)?")
+_PATH_DATA = re.compile(r'\s(d|points)="([^"]*)"')
+_SHAPE_STYLE = re.compile(r'(<(?:path|polygon|rect|circle|ellipse)\b[^>]*?)\sstyle="([^"]*)"')
+_HEX_SHORTHAND = re.compile(r"#([0-9a-fA-F])\1([0-9a-fA-F])\2([0-9a-fA-F])\3\b")
+# Presentation properties that child elements inherit from the root
+_INHERITED_PROPERTIES = frozenset(
+    ("fill", "fill-rule", "fill-opacity", "clip-rule", "stroke", "stroke-width")
+)
+
+
+def _format_number(match: "re.Match[str]", precision: int) -> str:
+    value = round(float(match.group()), precision)
+    text = f"{value:.{precision}f}".rstrip("0").rstrip(".")
+    if text in ("-0", ""):
+        text = "0"
+    if text.startswith("0."):
+        text = text[1:]
+    elif text.startswith("-0."):
+        text = "-" + text[2:]
+    return text
+
+
+def _compact_path_data(match: "re.Match[str]", precision: int) -> str:
+    data = _NUMBER.sub(lambda m: _format_number(m, precision), match.group(2))
+    # Separators are only needed between two numbers, and a minus sign or a
+    # leading decimal point already separates them
+    data = re.sub(r"\s*,\s*|\s+", " ", data).strip()
+    data = re.sub(r" ?([A-Za-z]) ?", r"\1", data)
+    data = re.sub(r" (?=-)", "", data)
+    data = re.sub(r"(\.\d+) (?=\.)", r"\1", data)
+    return f' {match.group(1)}="{data}"'
+
+
+def _hoist_shared_style(svg: str) -> str:
+    """Move a style repeated on every shape to the root element, once."""
+    styles = {match.group(2) for match in _SHAPE_STYLE.finditer(svg)}
+    if len(styles) != 1:
+        return svg
+    style = styles.pop()
+    properties = {item.split(":")[0].strip() for item in style.split(";") if item}
+    if not properties <= _INHERITED_PROPERTIES:
+        return svg
+    svg = _SHAPE_STYLE.sub(r"\1", svg)
+    return re.sub(r"<svg\b", f'<svg style="{style}"', svg, count=1)
+
+
+def minify_svg(svg: str, precision: int = 1) -> str:
+    """
+    Minify an SVG document exported from a drawing tool.
+
+    Removes the XML prolog, comments, editor-only root attributes, invisible
+    bounding boxes and insignificant whitespace, rounds path coordinates and
+    declares a style shared by all shapes once on the root element.
+
+    Args:
+        svg: SVG document
+        precision: Decimal places kept in ``d`` and ``points`` coordinates
+
+    Returns:
+        The minified SVG document
+    """
+    svg = _XML_PROLOG.sub("", svg)
+    svg = _SVG_TAG.sub(lambda m: _ROOT_ATTRIBUTES.sub("", m.group()), svg, count=1)
+    if "xlink:" not in svg.replace("xmlns:xlink", ""):
+        svg = re.sub(r'\sxmlns:xlink="[^"]*"', "", svg)
+    svg = _PATH_DATA.sub(lambda m: _compact_path_data(m, precision), svg)
+    if "url(#" not in svg and 'href="#' not in svg:
+        svg = re.sub(r'\sid="[^"]*"', "", svg)
+    svg = re.sub(r";\"", '"', svg)
+    svg = _HEX_SHORTHAND.sub(lambda m: "#" + "".join(m.groups()).lower(), svg)
+    svg = re.sub(r">\s+<", "><", svg)
+    svg = re.sub(r"\s+", " ", svg)
+    svg = re.sub(r"\s*(/?>)", r"\1", svg)
+    # Empty groups and the invisible bounding box of the export
+    svg = re.sub(r'<(?:rect|polygon) style="fill:none"[^>]*/>', "", svg)
+    previous = None
+    while previous != svg:
+        previous, svg = svg, re.sub(r"<g>((?:(?!</?g\b).)*)</g>", r"\1", svg)
+    return _hoist_shared_style(svg).strip()
+
+
+def _icon_image(source: Path):
+    try:
+        from PIL import Image
+    except ImportError:
+        raise ImportError(
+            "Building the favicon requires Pillow, install it with "
+            "`pip install pillow`."
+        ) from None
+    image = Image.open(source)
+    # Use the largest frame of a multi-resolution source icon
+    if hasattr(image, "ico"):
+        image = image.ico.getimage(max(image.ico.sizes()))
+    return image.convert("RGBA")
+
+
+def build_favicon(source: Path, sizes: Tuple[int, ...] = FAVICON_SIZES) -> bytes:
+    """
+    Render a multi-resolution ICO favicon.
+
+    Requires Pillow, which is only needed to build the assets.
+
+    Args:
+        source: Source image, the largest frame of an ICO file is used
+        sizes: Square icon sizes in pixels to include
+
+    Returns:
+        The ICO file content
+    """
+    buffer = io.BytesIO()
+    _icon_image(source).save(buffer, format="ICO", sizes=[(s, s) for s in sizes])
+    return buffer.getvalue()
+
+
+def build_touch_icon(source: Path, size: int = APPLE_TOUCH_ICON_SIZE) -> bytes:
+    """
+    Render a square, optimized PNG touch icon.
+
+    Args:
+        source: Source image, the largest frame of an ICO file is used
+        size: Edge length in pixels
+
+    Returns:
+        The PNG file content
+    """
+    from PIL import Image
+
+    image = _icon_image(source).resize((size, size), Image.Resampling.LANCZOS)
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG", optimize=True)
+    return buffer.getvalue()
+
+
+def _build_svg(source: Path) -> bytes:
+    return minify_svg(source.read_text(encoding="utf-8")).encode("utf-8")
+
+
+_BUILDERS: Dict[str, Callable[[Path], bytes]] = {
+    "svg": _build_svg,
+    "ico": build_favicon,
+    "png": build_touch_icon,
+}
+
+
+def _content_hash(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()[:12]
+
+
+def build_assets(output_dir: Path = STATIC_DIR) -> Dict[str, Dict[str, object]]:
+    """
+    Write the optimized, content-hashed assets and their manifest.
+
+    Previously generated versions of the assets in ``output_dir`` are removed.
+
+    Args:
+        output_dir: Directory to write to, defaults to the package ``static/``
+
+    Returns:
+        The manifest, mapping each asset name to its file name, size in
+        bytes and the hash of its source
+    """
+    output_dir = Path(output_dir)
+    manifest = {}
+    for name, (source, stem, extension) in ASSET_SOURCES.items():
+        source_path = STATIC_DIR / source
+        content = _BUILDERS[extension](source_path)
+        file_name = f"{stem}.{_content_hash(content)}.{extension}"
+        for stale in output_dir.glob(f"{stem}.*.{extension}"):
+            if stale.name != file_name:
+                stale.unlink()
+        (output_dir / file_name).write_bytes(content)
+        manifest[name] = {
+            "file": file_name,
+            "bytes": len(content),
+            "source": _content_hash(source_path.read_bytes()),
+        }
+    (output_dir / MANIFEST_PATH.name).write_text(
+        json.dumps(manifest, indent=2) + "\n", encoding="utf-8"
+    )
+    load_manifest.cache_clear()
+    _register_resources(manifest)
+    return manifest
+
+
+def check_assets() -> List[str]:
+    """
+    Check that the shipped assets are current and within their size budgets.
+
+    Returns:
+        List of problems, empty if all assets are up to date and within budget
+    """
+    try:
+        manifest = load_manifest()
+    except FileNotFoundError:
+        return [f"Missing manifest {MANIFEST_PATH.name}"]
+    problems = []
+    for name, (source, _, _) in ASSET_SOURCES.items():
+        entry = manifest.get(name)
+        if entry is None or not (STATIC_DIR / entry["file"]).exists():
+            problems.append(f"Missing asset {name}")
+            continue
+        if entry["source"] != _content_hash((STATIC_DIR / source).read_bytes()):
+            problems.append(f"Outdated asset {name}, source {source} changed")
+        size = (STATIC_DIR / entry["file"]).stat().st_size
+        if size > SIZE_BUDGETS[name]:
+            problems.append(
+                f"Asset {name} is {size} bytes, over its {SIZE_BUDGETS[name]} byte budget"
+            )
+    return problems
+
+
+@cache
+def load_manifest() -> Dict[str, Dict[str, object]]:
+    """Read the asset manifest shipped in ``static/``."""
+    return json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+
+
+def asset_path(name: str) -> Path:
+    """
+    Get the path of an optimized asset.
+
+    Args:
+        name: Asset name, one of the keys of ``ASSET_SOURCES``
+
+    Returns:
+        Path of the generated file in ``static/``
+    """
+    return STATIC_DIR / load_manifest()[name]["file"]
+
+
+@cache
+def svg_data_uri(name: str) -> str:
+    """
+    Get an optimized SVG asset as a percent-encoded data URI.
+
+    Percent-encoding keeps the URI smaller than base64 for SVG markup. The
+    URI is computed once per process.
+
+    Args:
+        name: Name of an SVG asset, e.g. 'logo-light' or 'logo-dark'
+
+    Returns:
+        ``data:image/svg+xml,...`` URI
+    """
+    svg = asset_path(name).read_text(encoding="utf-8").replace('"', "'")
+    return "data:image/svg+xml," + quote(svg, safe="/:='.,;-()")
+
+
+class SiemensIXAssets:
+    """
+    Resource holder exposing the assets to Panel's component resource handler.
+
+    Only the files listed in ``_resources["images"]`` may be served through it.
+    """
+
+    _resources: Dict[str, Dict[str, str]] = {"images": {}}
+
+
+def _register_resources(manifest: Dict[str, Dict[str, object]]) -> None:
+    SiemensIXAssets._resources = {
+        "images": {name: f"static/{entry['file']}" for name, entry in manifest.items()}
+    }
+
+
+if MANIFEST_PATH.exists():
+    _register_resources(load_manifest())
+
+
+def asset_url(name: str) -> str:
+    """
+    Get the long-term cacheable URL of an optimized asset.
+
+    Args:
+        name: Asset name, e.g. 'favicon' or 'apple-touch-icon'
+
+    Returns:
+        URL relative to the application root, with the content hash as
+        ``?v=`` query parameter so the server sends far-future cache headers
+    """
+    from panel.io.resources import component_resource_path
+
+    manifest = load_manifest()
+    _register_resources(manifest)
+    file_name = manifest[name]["file"]
+    url = component_resource_path(
+        SiemensIXAssets, "_resources/images", f"static/{file_name}"
+    )
+    content_hash = file_name.rsplit(".", 2)[1]
+    return f"{url}?v={content_hash}"
+
+
+def main() -> int:
+    """Build the assets, or with ``--check`` verify them against their budgets."""
+    parser = argparse.ArgumentParser(description="Build the Siemens iX brand assets.")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Exit with status 1 if an asset is outdated or over its size budget",
+    )
+    args = parser.parse_args()
+
+    if args.check:
+        problems = check_assets()
+        for problem in problems:
+            print(problem, file=sys.stderr)
+        return 1 if problems else 0
+
+    manifest = build_assets()
+    for name, entry in manifest.items():
+        print(f"{name:<18} {entry['bytes']:>6} bytes  {STATIC_DIR / entry['file']}")
+    return 0
+
+
+__all__ = [
+    "ASSET_SOURCES",
+    "SIZE_BUDGETS",
+    "SiemensIXAssets",
+    "asset_path",
+    "asset_url",
+    "build_assets",
+    "build_favicon",
+    "build_touch_icon",
+    "check_assets",
+    "load_manifest",
+    "minify_svg",
+    "svg_data_uri",
+]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
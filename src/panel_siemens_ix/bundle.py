@@ -0,0 +1,302 @@
+"""
+Precompiled static theme bundle for the Siemens iX theme.
+
+Compiles the light and dark themes into content-hashed CSS and JSON files in
+the package's ``static/`` directory. The CSS holds the palette, the
+categorical chart colors and the continuous colormap of both modes as CSS
+custom properties (``--ix-primary-main``, ``--ix-categorical-1``,
+``--ix-cmap-gradient`` etc.), switched by the ``.mui-light``/``.mui-dark``
+class that ``panel_material_ui`` sets in the browser, plus the page styles
+otherwise sent per session through ``pmui.Page.sx``. Styles written with
+:func:`css_var` therefore follow the theme toggle without any Python
+callback or server round trip. It is served by Panel's component
+resource handler under a URL carrying the content hash (``?v=<hash>``), which
+the browser may cache indefinitely.
+
+Rebuild the bundle after changing the palettes or themes with:
+    python -m panel_siemens_ix.bundle
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+from functools import cache
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .colors import get_categorical_palette, get_colors, get_continuous_cmap
+from .theme import create_theme
+
+STATIC_DIR = Path(__file__).parent / "static"
+BUNDLE_NAME = "siemens-ix-theme"
+MANIFEST_PATH = STATIC_DIR / f"{BUNDLE_NAME}.manifest.json"
+
+_HEADER = "/* Generated by panel_siemens_ix.bundle, do not edit. */\n"
+
+# Categorical colors and colormap samples emitted as CSS variables
+N_CATEGORICAL = 17
+N_GRADIENT_STOPS = 20
+
+# Page styles that would otherwise be pushed into ``pmui.Page.sx``
+_PAGE_CSS = """\
+.mui-light .title, .mui-dark .title {
+  color: var(--ix-text-primary);
+}
+.title {
+  font-size: 1em;
+  font-weight: 550;
+}
+"""
+
+
+def css_variables(mode: str) -> Dict[str, str]:
+    """
+    Get the palette of a mode as CSS custom properties.
+
+    Args:
+        mode: Theme mode, either 'light' or 'dark'
+
+    Returns:
+        Mapping of ``--ix-<group>-<name>`` property names to colors
+    """
+    palette = get_colors(mode).to_dict()
+    return {
+        f"--ix-{group}-{name}": color
+        for group, colors in palette.items()
+        for name, color in colors.items()
+    }
+
+
+def chart_variables(mode: str) -> Dict[str, str]:
+    """
+    Get the chart colors of a mode as CSS custom properties.
+
+    Args:
+        mode: Theme mode, either 'light' or 'dark'
+
+    Returns:
+        ``--ix-categorical-<i>`` colors of ``get_categorical_palette`` with
+        their best-contrast label colors (``--ix-categorical-<i>-contrast``),
+        and the continuous colormap as ``--ix-cmap-start``/``-mid``/``-end``
+        and as a ``--ix-cmap-gradient`` CSS gradient
+    """
+    from .colors import _continuous_cmap_stops
+    from .contrast import best_contrast
+
+    dark_theme = mode == "dark"
+    palette = get_categorical_palette(dark_theme, N_CATEGORICAL)
+    variables = {}
+    for i, (color, text) in enumerate(zip(palette, best_contrast(palette)), start=1):
+        variables[f"--ix-categorical-{i}"] = color
+        variables[f"--ix-categorical-{i}-contrast"] = text
+    start, mid, end = _continuous_cmap_stops(dark_theme)
+    gradient = ", ".join(get_continuous_cmap(dark_theme, N_GRADIENT_STOPS))
+    variables.update({
+        "--ix-cmap-start": start,
+        "--ix-cmap-mid": mid,
+        "--ix-cmap-end": end,
+        "--ix-cmap-gradient": f"linear-gradient(to right, {gradient})",
+    })
+    return variables
+
+
+@cache
+def _variable_names() -> frozenset:
+    return frozenset(css_variables("light")) | frozenset(chart_variables("light"))
+
+
+def css_var(*name: str, fallback: Optional[str] = None) -> str:
+    """
+    Reference a theme CSS variable, for styles that follow the theme toggle.
+
+    Args:
+        *name: Variable name without the ``--ix-`` prefix, as one string or
+            in parts, e.g. ``css_var("text", "primary")``,
+            ``css_var("categorical-3")`` or ``css_var("cmap-gradient")``
+        fallback: Value used where the variable is not defined
+
+    Returns:
+        A ``var(--ix-...)`` expression
+
+    Raises:
+        ValueError: If no such variable is generated
+    """
+    variable = "--ix-" + "-".join(name)
+    if variable not in _variable_names():
+        raise ValueError(f"Unknown Siemens iX CSS variable {variable!r}")
+    return f"var({variable}, {fallback})" if fallback is not None else f"var({variable})"
+
+
+def _css_block(selectors: str, variables: Dict[str, str]) -> str:
+    body = "".join(f"  {name}: {value};\n" for name, value in variables.items())
+    return f"{selectors} {{\n{body}}}\n"
+
+
+def theme_css() -> str:
+    """
+    Compile both themes into a single stylesheet.
+
+    Light mode is the default; the dark variables apply below ``.mui-dark``.
+    """
+    return (
+        _HEADER
+        + _css_block(
+            ":root, :host, .mui-light", {**css_variables("light"), **chart_variables("light")}
+        )
+        + _css_block(".mui-dark", {**css_variables("dark"), **chart_variables("dark")})
+        + _PAGE_CSS
+    )
+
+
+def theme_json() -> str:
+    """Serialize both Material-UI themes into compact, deterministic JSON."""
+    themes = {mode: create_theme(mode) for mode in ("light", "dark")}
+    return json.dumps(themes, sort_keys=True, separators=(",", ":"))
+
+
+def _content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()[:12]
+
+
+def _compile() -> Dict[str, str]:
+    """Compile the bundle, mapping hashed file names to their content."""
+    files = {}
+    for extension, content in (("css", theme_css()), ("json", theme_json())):
+        files[f"{BUNDLE_NAME}.{_content_hash(content)}.{extension}"] = content
+    return files
+
+
+def build_theme_bundle(output_dir: Path = STATIC_DIR) -> Dict[str, str]:
+    """
+    Write the content-hashed CSS/JSON bundle and its manifest.
+
+    Previously generated bundle files in ``output_dir`` are removed.
+
+    Args:
+        output_dir: Directory to write to, defaults to the package ``static/``
+
+    Returns:
+        The manifest, mapping ``"css"`` and ``"json"`` to the file names
+    """
+    output_dir = Path(output_dir)
+    files = _compile()
+    for stale in output_dir.glob(f"{BUNDLE_NAME}.*.*"):
+        if stale.name not in files and stale.suffix in (".css", ".json"):
+            if not stale.name.endswith(".manifest.json"):
+                stale.unlink()
+    manifest = {}
+    for name, content in files.items():
+        (output_dir / name).write_text(content, encoding="utf-8")
+        manifest[name.rsplit(".", 1)[1]] = name
+    (output_dir / MANIFEST_PATH.name).write_text(
+        json.dumps(manifest, indent=2) + "\n", encoding="utf-8"
+    )
+    load_manifest.cache_clear()
+    _register_resources(manifest)
+    return manifest
+
+
+def check_theme_bundle() -> List[str]:
+    """
+    Check that the shipped bundle matches the current palettes and themes.
+
+    Returns:
+        List of missing or outdated files, empty if the bundle is up to date
+    """
+    try:
+        manifest = load_manifest()
+    except FileNotFoundError:
+        return [MANIFEST_PATH.name]
+    expected = {name.rsplit(".", 1)[1]: name for name in _compile()}
+    return [
+        expected[kind]
+        for kind in expected
+        if manifest.get(kind) != expected[kind]
+        or not (STATIC_DIR / expected[kind]).exists()
+    ]
+
+
+@cache
+def load_manifest() -> Dict[str, str]:
+    """Read the bundle manifest shipped in ``static/``."""
+    return json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+
+
+class SiemensIXThemeBundle:
+    """
+    Resource holder exposing the bundle to Panel's component resource handler.
+
+    Only the files listed in ``__css__`` may be served through it.
+    """
+
+    __css__: List[str] = []
+
+
+def _register_resources(manifest: Dict[str, str]) -> None:
+    SiemensIXThemeBundle.__css__ = [f"static/{name}" for name in manifest.values()]
+
+
+if MANIFEST_PATH.exists():
+    _register_resources(load_manifest())
+
+
+def theme_bundle_url(kind: str = "css") -> str:
+    """
+    Get the long-term cacheable URL of a bundle file.
+
+    Args:
+        kind: Either 'css' or 'json'
+
+    Returns:
+        URL relative to the application root, with the content hash as
+        ``?v=`` query parameter so the server sends far-future cache headers
+    """
+    from panel.io.resources import component_resource_path
+
+    manifest = load_manifest()
+    _register_resources(manifest)
+    name = manifest[kind]
+    url = component_resource_path(SiemensIXThemeBundle, "__css__", f"static/{name}")
+    content_hash = name.rsplit(".", 2)[1]
+    return f"{url}?v={content_hash}"
+
+
+def main() -> int:
+    """Build the bundle, or with ``--check`` verify that it is up to date."""
+    parser = argparse.ArgumentParser(description="Build the Siemens iX theme bundle.")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Exit with status 1 if the shipped bundle is outdated",
+    )
+    args = parser.parse_args()
+
+    if args.check:
+        outdated = check_theme_bundle()
+        for name in outdated:
+            print(f"Outdated or missing: {name}", file=sys.stderr)
+        return 1 if outdated else 0
+
+    manifest = build_theme_bundle()
+    for kind, name in manifest.items():
+        print(f"{kind}: {STATIC_DIR / name}")
+    return 0
+
+
+__all__ = [
+    "SiemensIXThemeBundle",
+    "build_theme_bundle",
+    "chart_variables",
+    "check_theme_bundle",
+    "css_var",
+    "css_variables",
+    "load_manifest",
+    "theme_bundle_url",
+    "theme_css",
+    "theme_json",
+]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+"""
+Perceptually distinct categorical palettes for large numbers of categories.
+
+Extends a seed palette (the Siemens iX chart colors) by greedy maximin
+selection: from a fixed grid of candidate sRGB colors, the next color is
+always the one farthest, in OKLab distance, from every color chosen so far and
+from the background. Distances to the selection are updated for all candidates
+in one vectorized step per added color, so even 200-color palettes take only
+tens of milliseconds, and every added color keeps the largest possible
+distance to all others.
+"""
+
+from functools import lru_cache
+from typing import Sequence, Tuple
+
+import numpy as np
+
+from .gradients import array_to_hex, oklab_to_srgb, srgb_to_oklab, to_rgba_array
+
+# Candidates per sRGB channel; 24**3 colors are searched
+GRID_STEPS = 24
+# Minimum OKLab lightness difference between candidates and the background
+MIN_BACKGROUND_CONTRAST = 0.25
+# Minimum OKLab chroma, which excludes grays easily mistaken for grid lines
+MIN_CHROMA = 0.05
+# Lightness bounds away from the background for light and dark backgrounds
+LIGHTNESS_LIMITS = {"light": 0.3, "dark": 0.92}
+
+
+def _to_oklab(colors: Sequence[str]) -> np.ndarray:
+    return srgb_to_oklab(to_rgba_array(colors)[:, :3] / 255.0)
+
+
+@lru_cache(maxsize=8)
+def _candidates(background: str) -> np.ndarray:
+    """Read-only OKLab candidate colors readable on ``background``."""
+    background = _to_oklab([background])[0]
+    steps = np.linspace(0.0, 1.0, GRID_STEPS)
+    rgb = np.stack(np.meshgrid(steps, steps, steps, indexing="ij"), axis=-1)
+    lab = srgb_to_oklab(rgb.reshape(-1, 3))
+    lightness, chroma = lab[:, 0], np.hypot(lab[:, 1], lab[:, 2])
+    if background[0] >= 0.5:
+        keep = (lightness <= background[0] - MIN_BACKGROUND_CONTRAST) & (
+            lightness >= LIGHTNESS_LIMITS["light"]
+        )
+    else:
+        keep = (lightness >= background[0] + MIN_BACKGROUND_CONTRAST) & (
+            lightness <= LIGHTNESS_LIMITS["dark"]
+        )
+    keep &= chroma >= MIN_CHROMA
+    candidates = np.ascontiguousarray(lab[keep], dtype=np.float32)
+    candidates.flags.writeable = False
+    return candidates
+
+
+def _squared_distances(points: np.ndarray, reference: np.ndarray) -> np.ndarray:
+    """Squared distances from each of ``points`` to its nearest ``reference``."""
+    diff = points[:, None, :] - reference[None, :, :]
+    return np.einsum("ijk,ijk->ij", diff, diff).min(axis=1)
+
+
+def maximin_extend(
+    seeds: Sequence[str], n_colors: int, background: str
+) -> np.ndarray:
+    """
+    Extend ``seeds`` to ``n_colors`` maximally distinct colors.
+
+    Parameters
+    ----------
+    seeds : Sequence[str]
+        Colors that start the palette, kept in order.
+    n_colors : int
+        Total number of colors, including the seeds.
+    background : str
+        Background the palette is drawn on. Added colors keep their distance
+        from it and a minimum lightness contrast to it.
+
+    Returns
+    -------
+    np.ndarray
+        ``(n_colors, 3)`` ``uint8`` RGB array, the seeds first.
+    """
+    seeds = list(seeds)[:n_colors]
+    n_new = n_colors - len(seeds)
+    seed_rgb = to_rgba_array(seeds)[:, :3]
+    if n_new <= 0:
+        return seed_rgb
+
+    background_lab = _to_oklab([background])[0]
+    candidates = _candidates(background)
+    selected = np.vstack([_to_oklab(seeds), background_lab[None]]).astype(np.float32)
+    nearest = _squared_distances(candidates, selected)
+
+    chosen = np.empty((n_new, 3), dtype=np.float32)
+    for i in range(n_new):
+        best = int(np.argmax(nearest))
+        chosen[i] = candidates[best]
+        diff = candidates - chosen[i]
+        np.minimum(nearest, np.einsum("ij,ij->i", diff, diff), out=nearest)
+
+    new_rgb = np.round(oklab_to_srgb(chosen) * 255).astype(np.uint8)
+    return np.concatenate([seed_rgb, new_rgb])
+
+
+def min_pairwise_distance(colors: Sequence[str]) -> float:
+    """
+    Smallest OKLab distance between any two colors.
+
+    Parameters
+    ----------
+    colors : Sequence[str]
+        At least two colors; any alpha channel is ignored.
+
+    Returns
+    -------
+    float
+        The minimum pairwise OKLab (Euclidean) distance.
+    """
+    lab = _to_oklab(colors)
+    diff = lab[:, None, :] - lab[None, :, :]
+    distances = np.sqrt(np.einsum("ijk,ijk->ij", diff, diff))
+    distances[np.diag_indices(len(lab))] = np.inf
+    return float(distances.min())
+
+
+def distinct_palette(
+    seeds: Sequence[str], n_colors: int, background: str, alpha: str = ""
+) -> Tuple[str, ...]:
+    """
+    Hex colors of :func:`maximin_extend`, optionally with an alpha suffix.
+
+    Parameters
+    ----------
+    seeds, n_colors, background
+        See :func:`maximin_extend`.
+    alpha : str, default=""
+        Two hex digits appended to every color, e.g. ``"66"`` for 40%.
+
+    Returns
+    -------
+    Tuple[str, ...]
+        The seeds as given, followed by the added ``#rrggbb`` colors, all
+        with ``alpha`` appended.
+    """
+    seeds = list(seeds)[:n_colors]
+    added = array_to_hex(maximin_extend(seeds, n_colors, background)[len(seeds):])
+    return tuple(color + alpha for color in [*seeds, *added])
+
+
+__all__ = [
+    "distinct_palette",
+    "maximin_extend",
+    "min_pairwise_distance",
+]
@@ -0,0 +1,259 @@
+"""
+Lookup-table colormaps for the Siemens iX design system.
+
+A :class:`SiemensIXColormap` wraps a precomputed ``(n, 4)`` ``uint8`` RGBA
+lookup table and maps whole NumPy arrays of values to colors in a single
+vectorized pass. The same table is exported to Bokeh, Matplotlib and Plotly.
+"""
+
+from typing import Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .gradients import array_to_hex, to_rgba_array
+
+Color = str | Sequence[int]
+
+
+def _to_rgba_row(color: Optional[Color], default: Optional[np.ndarray]) -> np.ndarray:
+    """Convert a color string or RGBA sequence to a ``uint8`` RGBA row."""
+    if color is None:
+        return default
+    if isinstance(color, str):
+        return to_rgba_array([color])[0]
+    row = np.asarray(color, dtype=np.uint8)
+    if row.shape == (3,):
+        row = np.append(row, np.uint8(255))
+    if row.shape != (4,):
+        raise ValueError(f"Expected an RGB(A) color, got {color!r}")
+    return row
+
+
+class SiemensIXColormap:
+    """
+    Colormap backed by a precomputed RGBA lookup table.
+
+    Parameters
+    ----------
+    lut : array-like
+        ``(n, 4)`` RGBA lookup table with values in ``0..255``. Read-only,
+        C-contiguous ``uint8`` arrays are used as-is without copying.
+    name : str, default="siemens_ix"
+        Name used when exporting the colormap.
+    bad : str or sequence of int, default=(0, 0, 0, 0)
+        Color for NaN values.
+    under : str or sequence of int, optional
+        Color for values below ``vmin``. Defaults to the first LUT entry.
+    over : str or sequence of int, optional
+        Color for values above ``vmax``. Defaults to the last LUT entry.
+
+    Examples
+    --------
+    >>> cmap = get_colormap(dark_theme=True, n_colors=256)
+    >>> rgba = cmap(sensor_values, vmin=0, vmax=100)  # (..., 4) uint8
+    >>> fig = px.imshow(sensor_values, color_continuous_scale=cmap.to_plotly())
+    """
+
+    __slots__ = ("name", "lut", "_table", "_hex", "_plotly", "_matplotlib")
+
+    def __init__(
+        self,
+        lut: Any,
+        name: str = "siemens_ix",
+        bad: Color = (0, 0, 0, 0),
+        under: Optional[Color] = None,
+        over: Optional[Color] = None,
+    ):
+        lut = np.asarray(lut)
+        if lut.ndim != 2 or lut.shape[1] != 4 or len(lut) < 1:
+            raise ValueError(f"lut must have shape (n, 4), got {lut.shape}")
+        if lut.dtype != np.uint8 or lut.flags.writeable or not lut.flags.c_contiguous:
+            lut = np.ascontiguousarray(lut, dtype=np.uint8).copy()
+            lut.flags.writeable = False
+
+        self.name = name
+        self.lut = lut
+        # LUT extended with the under, over and bad colors so that a single
+        # np.take resolves every value, including out-of-range and NaN ones.
+        self._table = np.concatenate(
+            [
+                lut,
+                _to_rgba_row(under, lut[0])[None],
+                _to_rgba_row(over, lut[-1])[None],
+                _to_rgba_row(bad, None)[None],
+            ]
+        )
+        self._table.flags.writeable = False
+        self._hex: Optional[Tuple[str, ...]] = None
+        self._plotly: Optional[List[List[Any]]] = None
+        self._matplotlib = None
+
+    @classmethod
+    def from_colors(cls, colors: Sequence[str], **kwargs) -> "SiemensIXColormap":
+        """
+        Create a colormap from a sequence of color strings.
+
+        Parameters
+        ----------
+        colors : Sequence[str]
+            Colors in any format supported by :func:`.conversion.parse_color`.
+        **kwargs
+            Passed on to :class:`SiemensIXColormap`.
+        """
+        return cls(to_rgba_array(colors), **kwargs)
+
+    @property
+    def N(self) -> int:
+        """Number of colors in the lookup table."""
+        return len(self.lut)
+
+    def __len__(self) -> int:
+        return len(self.lut)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(name={self.name!r}, N={self.N})"
+
+    def indices(
+        self,
+        values: Any,
+        vmin: Optional[float] = None,
+        vmax: Optional[float] = None,
+    ) -> np.ndarray:
+        """
+        Map values to lookup table indices.
+
+        Values in ``[vmin, vmax]`` map to ``0..N-1``, values below ``vmin``
+        to ``N``, values above ``vmax`` to ``N+1`` and NaN to ``N+2``, which
+        are the under, over and bad rows of the extended table.
+
+        Parameters
+        ----------
+        values : array-like
+            Values to map. Float32 input is processed in float32.
+        vmin, vmax : float, optional
+            Data range. Default to the NaN-ignoring min and max of ``values``.
+
+        Returns
+        -------
+        np.ndarray
+            ``intp`` index array with the shape of ``values``.
+        """
+        values = np.asarray(values)
+        if values.dtype.kind != "f":
+            values = values.astype(np.float64)
+        if vmin is None or vmax is None:
+            finite = values[np.isfinite(values)] if values.size else values
+            if vmin is None:
+                vmin = float(finite.min()) if finite.size else 0.0
+            if vmax is None:
+                vmax = float(finite.max()) if finite.size else 1.0
+
+        n = self.N
+        scale = n / (vmax - vmin) if vmax > vmin else 0.0
+        nan = np.isnan(values)
+        # Non-finite values only get under, over or bad indices below; masking
+        # them first keeps inf * 0 (a constant range) from warning
+        scaled = np.where(np.isfinite(values), values, values.dtype.type(vmin))
+        scaled -= values.dtype.type(vmin)
+        scaled *= values.dtype.type(scale)
+        # vmax itself maps to the last color rather than the over color
+        np.clip(scaled, 0, n - 1, out=scaled)
+        idx = scaled.astype(np.intp)
+        idx[values < vmin] = n
+        idx[values > vmax] = n + 1
+        idx[nan] = n + 2
+        return idx
+
+    def __call__(
+        self,
+        values: Any,
+        vmin: Optional[float] = None,
+        vmax: Optional[float] = None,
+        out: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Map values to RGBA colors in one vectorized lookup.
+
+        Parameters
+        ----------
+        values : array-like
+            Values to color, of any shape.
+        vmin, vmax : float, optional
+            Data range. Default to the NaN-ignoring min and max of ``values``.
+        out : np.ndarray, optional
+            Preallocated ``uint8`` array of shape ``values.shape + (4,)`` to
+            write into, avoiding a new allocation per refresh.
+
+        Returns
+        -------
+        np.ndarray
+            ``uint8`` RGBA array of shape ``values.shape + (4,)``.
+        """
+        return np.take(self._table, self.indices(values, vmin, vmax), axis=0, out=out)
+
+    def to_bokeh(self) -> Tuple[str, ...]:
+        """
+        Export as a Bokeh palette.
+
+        Returns
+        -------
+        Tuple[str, ...]
+            Hex colors, computed once and shared between calls.
+        """
+        if self._hex is None:
+            self._hex = tuple(array_to_hex(self.lut))
+        return self._hex
+
+    def to_plotly(self) -> List[List[Any]]:
+        """
+        Export as a Plotly colorscale.
+
+        Returns
+        -------
+        List[List[Any]]
+            ``[[position, 'rgba(r, g, b, a)'], ...]`` pairs covering ``0..1``.
+        """
+        if self._plotly is None:
+            # Plotly needs at least two stops, so a single color is repeated
+            lut = self.lut if self.N > 1 else np.repeat(self.lut, 2, axis=0)
+            positions = np.linspace(0.0, 1.0, len(lut))
+            alphas = np.round(lut[:, 3] / 255, 3)
+            self._plotly = [
+                [position, f"rgba({r}, {g}, {b}, {a:g})"]
+                for position, (r, g, b), a in zip(
+                    positions.tolist(), lut[:, :3].tolist(), alphas.tolist()
+                )
+            ]
+        return self._plotly
+
+    def to_matplotlib(self):
+        """
+        Export as a Matplotlib ``ListedColormap``.
+
+        Requires ``matplotlib``. The normalized color table is built once and
+        shared between calls.
+
+        Returns
+        -------
+        matplotlib.colors.ListedColormap
+        """
+        if self._matplotlib is None:
+            try:
+                from matplotlib.colors import ListedColormap
+            except ImportError:
+                raise ImportError(
+                    "to_matplotlib() requires matplotlib, install it with "
+                    "`pip install matplotlib`."
+                ) from None
+            table = self._table / 255.0
+            cmap = ListedColormap(table[: self.N], name=self.name)
+            cmap.set_under(table[self.N])
+            cmap.set_over(table[self.N + 1])
+            cmap.set_bad(table[self.N + 2])
+            self._matplotlib = cmap
+        return self._matplotlib
+
+
+__all__ = [
+    "SiemensIXColormap",
+]
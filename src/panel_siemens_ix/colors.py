@@ -1,53 +1,35 @@
 # Predefined color maps
-import panel_material_ui as pmui
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass, field, asdict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, List, Tuple
+from dataclasses import dataclass, field, fields
+
+from .conversion import to_rgba
+from .instrumentation import instrumented
 
 
 def _hex_to_rgba(color: str, alpha: Optional[float] = None) -> str:
     """
     Convert hex or rgba color to rgba format, optionally with custom alpha.
 
+    Parsing and formatting are memoized by the :mod:`.conversion` module.
+
     Args:
-        color: Hex color (e.g., '#00cccc') or rgba string (e.g., 'rgba(0, 204, 204, 0.45)')
+        color: Hex color (e.g., '#00cccc' or '#00cccc73') or rgb/rgba string
+            (e.g., 'rgba(0, 204, 204, 0.45)')
         alpha: Optional alpha value to override existing alpha
 
     Returns:
-        rgba color string
-    """
-    # Handle existing rgba strings
-    if color.startswith("rgba("):
-        if alpha is not None:
-            # Extract rgb values and apply new alpha
-            import re
-
-            match = re.match(r"rgba\((\d+),\s*(\d+),\s*(\d+),\s*[\d.]+\)", color)
-            if match:
-                r, g, b = match.groups()
-                return f"rgba({r}, {g}, {b}, {alpha})"
-        return color
-
-    # Handle hex colors
-    hex_color = color.lstrip("#")
-
-    if len(hex_color) == 6:
-        r = int(hex_color[0:2], 16)
-        g = int(hex_color[2:4], 16)
-        b = int(hex_color[4:6], 16)
-    elif len(hex_color) == 3:
-        r = int(hex_color[0] * 2, 16)
-        g = int(hex_color[1] * 2, 16)
-        b = int(hex_color[2] * 2, 16)
-    else:
-        raise ValueError(f"Invalid hex color format: {hex_color}")
+        rgb or rgba color string
 
-    if alpha is not None:
-        return f"rgba({r}, {g}, {b}, {alpha})"
-    return f"rgb({r}, {g}, {b})"
+    Raises:
+        ValueError: If the color format is not supported
+    """
+    return to_rgba(color, alpha)
 
 
 # Siemens iX Color Palette - Dark Theme
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SiemensIXDarkColors:
     primary: Dict[str, str] = field(
         default_factory=lambda: {
@@ -213,11 +195,11 @@ class SiemensIXDarkColors:
     )
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {f.name: dict(getattr(self, f.name)) for f in fields(self)}
 
 
 # Siemens iX Color Palette - Light Theme
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SiemensIXLightColors:
     primary: Dict[str, str] = field(
         default_factory=lambda: {
@@ -382,29 +364,172 @@ class SiemensIXLightColors:
     )
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {f.name: dict(getattr(self, f.name)) for f in fields(self)}
+
+
+def _intern_palette(
+    palette: SiemensIXDarkColors | SiemensIXLightColors,
+) -> SiemensIXDarkColors | SiemensIXLightColors:
+    """
+    Make a palette instance read-only so it can be shared process-wide.
+
+    Every color group is swapped for a read-only mapping view, so callers
+    can't mutate the shared instance through ``palette.primary["main"] = ...``.
+    """
+    for f in fields(palette):
+        object.__setattr__(
+            palette, f.name, MappingProxyType(dict(getattr(palette, f.name)))
+        )
+    return palette
 
 
+# Registry of interned, immutable palettes, built once per process
+PALETTES: Mapping[str, SiemensIXDarkColors | SiemensIXLightColors] = MappingProxyType(
+    {
+        "light": _intern_palette(SiemensIXLightColors()),
+        "dark": _intern_palette(SiemensIXDarkColors()),
+    }
+)
+
+
+@instrumented("get_colors")
 def get_colors(mode: str = "light") -> SiemensIXDarkColors | SiemensIXLightColors:
     """
     Get the raw Siemens iX color palette for the specified mode.
 
+    The returned palette is a shared, read-only instance from ``PALETTES``,
+    so repeated calls are a dictionary lookup and allocate nothing. Use
+    ``to_dict()`` to obtain a mutable copy.
+
+    Args:
+        mode: Theme mode, either 'light' or 'dark'
+
+    Returns:
+        The interned color palette
+
+    Raises:
+        ValueError: If mode is not 'light' or 'dark'
+    """
+    try:
+        return PALETTES[mode]
+    except (KeyError, TypeError):
+        raise ValueError("Mode must be either 'light' or 'dark'") from None
+
+
+_PACKED: Dict[str, Any] = {}
+
+
+def get_packed_colors(mode: str = "light"):
+    """
+    Get the palette of a mode packed into a single RGBA array.
+
+    The :class:`~panel_siemens_ix.packed.PackedPalette` is built on first
+    use and shared process-wide. It offers the same group access as
+    :func:`get_colors` (``packed.primary["main"]``) as views over one
+    ``(n, 4)`` ``uint8`` array, with colors normalized to lowercase
+    ``#rrggbb``/``#rrggbbaa``, and vectorized whole-palette operations.
+    The array is read from the memory-mapped palette file shipped with the
+    package (see :mod:`panel_siemens_ix.palette_file`) when it is current.
+
     Args:
         mode: Theme mode, either 'light' or 'dark'
 
     Returns:
-        Dictionary containing the color palette
+        The packed palette
 
     Raises:
         ValueError: If mode is not 'light' or 'dark'
     """
-    if mode not in ["light", "dark"]:
-        raise ValueError("Mode must be either 'light' or 'dark'")
+    try:
+        return _PACKED[mode]
+    except (KeyError, TypeError):
+        palette = get_colors(mode)
+    palette_file = _palette_file()
+    if palette_file is not None:
+        packed = palette_file.palette(mode)
+    else:
+        from .packed import PackedPalette
+
+        packed = PackedPalette.from_palette(palette, mode=mode)
+    return _PACKED.setdefault(mode, packed)
+
+
+def _palette_file():
+    """The shipped binary palette file, or None if missing or outdated."""
+    from .palette_file import load_palette_file
+
+    return load_palette_file()
+
+
+def _generate_palette(color: str, n_colors: int = 3) -> List[str]:
+    """
+    Generate a hue-rotated palette around a base color.
+
+    Vectorized equivalent of ``panel_material_ui.theme.generate_palette``
+    that does not require importing Panel.
+    """
+    from .gradients import array_to_hex, hue_rotation
+
+    return array_to_hex(hue_rotation(color, n_colors))
+
+
+# Bounds of the LRU caches memoizing palettes and colormaps per arguments
+_PALETTE_CACHE_SIZE = 128
+_CMAP_CACHE_SIZE = 32
+
+
+def _continuous_cmap_stops(dark_theme: bool) -> Tuple[str, str, str]:
+    """Return the start, mid and end colors of the continuous colormap."""
+    colors = get_colors("dark" if dark_theme else "light")
+    if dark_theme:
+        # Dark theme: gradient from surface dark cyan through bright accent
+        return (
+            colors.background["surface"],  # #37374d
+            colors.chart["17"],  # #00C1B6 (teal connector)
+            colors.primary["main"],  # #00cccc
+        )
+    # Light theme: gradient from paper through primary to darker shade
+    return (
+        colors.background["paper"],  # #f3f3f0
+        colors.primary["main"],  # #007993
+        colors.chart["16"],  # #002949 (very dark blue)
+    )
+
+
+@lru_cache(maxsize=_CMAP_CACHE_SIZE)
+def _continuous_cmap_array(dark_theme: bool, n_colors: int, space: str):
+    """
+    Compute and memoize the read-only RGBA array of a continuous colormap.
+
+    Default sizes are zero-copy views into the memory-mapped palette file.
+    """
+    palette_file = _palette_file()
+    if palette_file is not None:
+        lut = palette_file.lut(dark_theme, n_colors, space)
+        if lut is not None:
+            return lut
+    from .gradients import three_part_gradient
+
+    rgba = three_part_gradient(_continuous_cmap_stops(dark_theme), n_colors, space)
+    rgba.flags.writeable = False
+    return rgba
+
+
+@lru_cache(maxsize=_CMAP_CACHE_SIZE)
+def _continuous_cmap_hex(dark_theme: bool, n_colors: int, space: str) -> Tuple[str, ...]:
+    """Compute and memoize the hex strings of a continuous colormap."""
+    from .gradients import array_to_hex
 
-    return SiemensIXDarkColors() if mode == "dark" else SiemensIXLightColors()
+    return tuple(array_to_hex(_continuous_cmap_array(dark_theme, n_colors, space)))
 
 
-def get_continuous_cmap(dark_theme: bool = False, n_colors: int = 128) -> List[str]:
+@instrumented("get_continuous_cmap")
+def get_continuous_cmap(
+    dark_theme: bool = False,
+    n_colors: int = 128,
+    space: str = "srgb",
+    as_array: bool = False,
+):
     """
     Get the continuous color map optimized for the Siemens iX design system.
 
@@ -412,17 +537,28 @@ def get_continuous_cmap(dark_theme: bool = False, n_colors: int = 128) -> List[s
     the surface background through accent colors to create a professional,
     Siemens iX-branded continuous colormap.
 
+    The gradient is interpolated with NumPy in a single vectorized pass and
+    memoized per ``(dark_theme, n_colors, space)`` in a bounded LRU cache,
+    so rebuilding it on a theme toggle or re-render is a cache hit (see
+    :func:`palette_cache_info`).
+
     Parameters
     ----------
     dark_theme : bool, default=False
         If True, return dark theme color map. Otherwise, return light theme color map.
     n_colors : int, default=128
-        Number of colors in the continuous gradient.
+        Number of colors in the continuous gradient. Must be at least 1.
+    space : {"srgb", "oklab"}, default="srgb"
+        Color space to interpolate in. ``"oklab"`` gives perceptually even steps.
+    as_array : bool, default=False
+        If True, return a read-only, C-contiguous ``(n_colors, 4)`` ``uint8``
+        RGBA array instead of hex strings.
 
     Returns
     -------
-    List[str]
-        List of hex color codes forming a continuous color map
+    Tuple[str, ...] or np.ndarray
+        Immutable, shared tuple of hex color codes forming a continuous
+        color map, or the read-only RGBA array if ``as_array`` is True
 
     Examples
     --------
@@ -431,58 +567,69 @@ def get_continuous_cmap(dark_theme: bool = False, n_colors: int = 128) -> List[s
 
     >>> # Get a dark theme continuous colormap
     >>> cmap_dark = get_continuous_cmap(dark_theme=True, n_colors=64)
+
+    >>> # Get a perceptually uniform RGBA lookup table
+    >>> lut = get_continuous_cmap(n_colors=1024, space="oklab", as_array=True)
     """
-    colors = get_colors("dark" if dark_theme else "light")
+    dark_theme = bool(dark_theme)
+    if as_array:
+        return _continuous_cmap_array(dark_theme, n_colors, space)
+    return _continuous_cmap_hex(dark_theme, n_colors, space)
 
-    if dark_theme:
-        # Dark theme: gradient from surface dark cyan through bright accent
-        # Start with surface, go through mid-tone, end with bright accent
-        start_color = colors.background["surface"]  # #37374d
-        mid_color = colors.chart["17"]  # #00C1B6 (teal connector)
-        end_color = colors.primary["main"]  # #00cccc
-
-        # Create a three-part gradient for better visual distribution
-        n_part1 = n_colors // 3
-        n_part2 = n_colors // 3
-        n_part3 = n_colors - n_part1 - n_part2
-
-        part1 = pmui.theme.linear_gradient(start_color, mid_color, n=n_part1)
-        part2 = pmui.theme.linear_gradient(mid_color, end_color, n=n_part2)
-        # For the third part, create variations of the end color
-        part3 = pmui.theme.generate_palette(end_color, n_colors=n_part3)
-
-        return part1 + part2 + part3[-n_part3:]
-    else:
-        # Light theme: gradient from paper through primary to darker shade
-        start_color = colors.background["paper"]  # #f3f3f0
-        mid_color = colors.primary["main"]  # #007993
-        end_color = colors.chart["16"]  # #002949 (very dark blue)
 
-        # Create a three-part gradient for better visual distribution
-        n_part1 = n_colors // 3
-        n_part2 = n_colors // 3
-        n_part3 = n_colors - n_part1 - n_part2
+@lru_cache(maxsize=_CMAP_CACHE_SIZE)
+def get_colormap(
+    dark_theme: bool = False, n_colors: int = 256, space: str = "srgb"
+):
+    """
+    Get the Siemens iX continuous colormap as a lookup-table object.
+
+    The returned :class:`.colormap.SiemensIXColormap` wraps the memoized
+    RGBA array of :func:`get_continuous_cmap` without copying it and maps
+    whole NumPy arrays of values to colors in one vectorized call.
+
+    Parameters
+    ----------
+    dark_theme : bool, default=False
+        If True, return the dark theme colormap.
+    n_colors : int, default=256
+        Number of entries in the lookup table.
+    space : {"srgb", "oklab"}, default="srgb"
+        Color space the gradient is interpolated in.
+
+    Returns
+    -------
+    SiemensIXColormap
+        Shared colormap instance for the given arguments
 
-        part1 = pmui.theme.linear_gradient(start_color, mid_color, n=n_part1)
-        part2 = pmui.theme.linear_gradient(mid_color, end_color, n=n_part2)
-        # For the third part, create darker variations
-        part3 = pmui.theme.generate_palette(end_color, n_colors=n_part3)
+    Examples
+    --------
+    >>> cmap = get_colormap(dark_theme=True, n_colors=1024)
+    >>> rgba = cmap(values, vmin=0.0, vmax=1.0)  # uint8 array, shape values.shape + (4,)
+    >>> hv_image.opts(cmap=list(cmap.to_bokeh()))
+    """
+    from .colormap import SiemensIXColormap
 
-        return part1 + part2 + part3[-n_part3:]
+    dark_theme = bool(dark_theme)
+    lut = _continuous_cmap_array(dark_theme, n_colors, space)
+    name = f"siemens_ix_{'dark' if dark_theme else 'light'}_{space}"
+    return SiemensIXColormap(lut, name=name)
 
 
+@instrumented("get_categorical_palette")
 def get_categorical_palette(
     dark_theme: bool = False,
     n_colors: int = 17,
     primary: bool = False,
     opacity: bool = False,
-) -> List[str]:
+) -> Tuple[str, ...]:
     """
     Get an optimized categorical color palette for the Siemens iX design system.
 
     This function provides carefully selected colors that maximize visual distinction
     while maintaining the Siemens iX brand aesthetic. Colors are selected based on
-    perceptual distance and theme-appropriate contrast.
+    perceptual distance and theme-appropriate contrast. Palettes are memoized in a
+    bounded LRU cache (see :func:`palette_cache_info`).
 
     Parameters
     ----------
@@ -497,8 +644,9 @@ def get_categorical_palette(
 
     Returns
     -------
-    List[str]
-        List of hex color codes suitable for categorical data visualization
+    Tuple[str, ...]
+        Immutable, shared tuple of hex color codes suitable for categorical
+        data visualization
 
     Examples
     --------
@@ -513,24 +661,29 @@ def get_categorical_palette(
     """
     if n_colors < 1:
         raise ValueError("n_colors must be at least 1")
+    return _categorical_palette(bool(dark_theme), n_colors, bool(primary), bool(opacity))
+
 
+@lru_cache(maxsize=_PALETTE_CACHE_SIZE)
+def _categorical_palette(
+    dark_theme: bool, n_colors: int, primary: bool, opacity: bool
+) -> Tuple[str, ...]:
+    """Build the categorical palette once per argument combination."""
     colors = get_colors("dark" if dark_theme else "light")
 
     # If primary-based palette is requested
     if primary:
-        return pmui.theme.generate_palette(
-            color=colors.primary["main"], n_colors=n_colors
-        )
+        return tuple(_generate_palette(colors.primary["main"], n_colors=n_colors))
 
     # For very small palettes, use semantic colors for better meaning
     if n_colors <= 5:
-        semantic_colors = [
+        semantic_colors = (
             colors.primary["main"],     # Primary
             colors.success["main"],    # Success
             colors.warning["main"],    # Warning
             colors.error["main"],      # Error
             colors.info["main"],       # Info
-        ]
+        )
         return semantic_colors[:n_colors]
 
     # Use the enhanced chart colors with improved sequence
@@ -556,45 +709,65 @@ def get_categorical_palette(
         indices = [min(i, len(palette) - 1) for i in indices]
 
         if opacity:
-            return [palette_40[i] for i in indices]
+            return tuple(palette_40[i] for i in indices)
         else:
-            return [palette[i] for i in indices]
+            return tuple(palette[i] for i in indices)
 
-    # For more colors than defined, extend using palette generation
-    base_colors = palette.copy()
+    # For more colors than defined, keep the chart colors and add the colors
+    # farthest in OKLab from all previous ones and from the background
+    from .categorical import distinct_palette
 
-    # Use the most distinct colors as base for generation
-    if dark_theme:
-        # Use bright colors as base for dark theme
-        base_for_generation = [colors.primary["main"], colors.chart["1"], colors.chart["4"]]
-    else:
-        # Use primary colors as base for light theme
-        base_for_generation = [colors.primary["main"], colors.chart["4"], colors.chart["7"]]
+    alpha = palette_40[0][7:] if opacity else ""
+    return distinct_palette(palette, n_colors, colors.background["default"], alpha=alpha)
+
+
+def _palette_caches() -> Dict[str, Any]:
+    return {
+        "categorical_palette": _categorical_palette,
+        "continuous_cmap": _continuous_cmap_hex,
+        "continuous_cmap_array": _continuous_cmap_array,
+        "colormap": get_colormap,
+    }
 
-    # Generate additional colors
-    additional_needed = n_colors - len(base_colors)
-    generated_colors = []
 
-    # Distribute generation across base colors
-    colors_per_base = max(1, additional_needed // len(base_for_generation))
+def palette_cache_info() -> Dict[str, Dict[str, Optional[int]]]:
+    """
+    Get hit/miss statistics of the palette and colormap caches.
+
+    Returns
+    -------
+    Dict[str, Dict[str, Optional[int]]]
+        Per cache (``categorical_palette``, ``continuous_cmap``,
+        ``continuous_cmap_array`` and ``colormap``), the ``hits``,
+        ``misses``, ``maxsize`` and current number of entries (``currsize``).
+
+    Examples
+    --------
+    >>> palette_cache_info()["categorical_palette"]
+    {'hits': 41, 'misses': 3, 'maxsize': 128, 'currsize': 3}
+    """
+    return {
+        name: cached.cache_info()._asdict()
+        for name, cached in _palette_caches().items()
+    }
 
-    for base_color in base_for_generation:
-        if len(generated_colors) < additional_needed:
-            n_gen = min(colors_per_base, additional_needed - len(generated_colors))
-            generated_colors.extend(
-                pmui.theme.generate_palette(base_color, n_colors=n_gen + 1)[1:n_gen + 1]
-            )
 
-    # Combine and return
-    final_palette = base_colors + generated_colors[:additional_needed]
-    return final_palette[:n_colors]
+def clear_palette_caches() -> None:
+    """Empty the palette and colormap caches and reset their statistics."""
+    for cached in _palette_caches().values():
+        cached.cache_clear()
 
 
 __all__ = [
     "SiemensIXDarkColors",
     "SiemensIXLightColors",
+    "PALETTES",
     "get_colors",
+    "get_packed_colors",
     "get_continuous_cmap",
+    "get_colormap",
     "get_categorical_palette",
+    "palette_cache_info",
+    "clear_palette_caches",
     "_hex_to_rgba",
 ]
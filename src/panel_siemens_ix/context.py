@@ -0,0 +1,209 @@
+"""
+Process-wide theme configuration context.
+
+:func:`get_context` computes everything needed to theme a
+``panel_material_ui.Page`` once per process and set of options: the frozen
+light and dark themes, page styles, inlined logos and asset URLs. Applying the
+context to a session only merges these precomputed, immutable values into the
+page parameters and sets session-scoped Panel config, so it never changes
+class-level parameter defaults and needs no locking per session, which keeps
+several apps served by one ``panel serve --num-threads`` process independent.
+
+Examples
+--------
+>>> from panel_siemens_ix import get_context
+>>> context = get_context(with_logo=True)
+>>> page = context.page(title="My App", main=[...])  # once per session
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from .frozen import FrozenDict, freeze
+
+DISCONNECT_NOTIFICATION: str = """The connection to the server was lost. Please refresh to \
+reconnect."""
+
+
+def _root_relative(url: str) -> str:
+    """Strip the prefix of the current session from a resource URL."""
+    from panel.io.state import state
+
+    rel_path = state.rel_path
+    if rel_path and url.startswith(f"{rel_path}/"):
+        return url[len(rel_path) + 1 :]
+    return url
+
+
+def _session_url(url: str) -> str:
+    """Resolve a root relative resource URL for the current session."""
+    from panel.io.state import state
+
+    rel_path = state.rel_path
+    return f"{rel_path}/{url}" if rel_path else url
+
+
+@dataclass(frozen=True, slots=True)
+class SiemensIXContext:
+    """
+    Immutable, precomputed Siemens iX configuration for Panel pages.
+
+    Obtain instances with :func:`get_context`, which shares one instance per
+    set of options across the process.
+
+    Attributes:
+        theme_config: Frozen light and dark Material-UI themes
+        logo: Logo data URIs for light and dark mode, or None
+        favicon: Root relative, content-hashed favicon URL
+        apple_touch_icon: Root relative, content-hashed touch icon URL
+        sx: Page styles sent with every session, None with the theme bundle
+        stylesheets: Root relative stylesheet URLs added to each page,
+            including the theme bundle with the ``--ix-*`` CSS variables
+        disconnect_notification: Message shown when the connection is lost
+    """
+
+    theme_config: Mapping[str, Any]
+    logo: Optional[Mapping[str, str]]
+    favicon: str
+    apple_touch_icon: str
+    sx: Optional[Mapping[str, Any]]
+    stylesheets: Tuple[str, ...] = ()
+    disconnect_notification: str = DISCONNECT_NOTIFICATION
+
+    def page_params(self) -> Dict[str, Any]:
+        """
+        Get the ``pmui.Page`` parameters for the current session.
+
+        Returns:
+            A new dict sharing the precomputed, immutable values, with
+            resource URLs resolved for the current session
+        """
+        return {
+            "theme_config": self.theme_config,
+            "logo": self.logo,
+            "favicon": _session_url(self.favicon),
+            "meta_apple_touch_icon": _session_url(self.apple_touch_icon),
+            "sx": self.sx,
+            "stylesheets": [_session_url(url) for url in self.stylesheets],
+        }
+
+    def apply_session(self) -> None:
+        """
+        Apply the session-level Panel configuration.
+
+        Within a session Panel stores config values per document, so this
+        does not affect other sessions.
+        """
+        import panel as pn
+
+        pn.config.disconnect_notification = self.disconnect_notification
+
+    def page(self, **params) -> Any:
+        """
+        Create a themed ``pmui.Page`` for the current session.
+
+        Args:
+            **params: Page parameters, overriding the context values
+
+        Returns:
+            The new ``panel_material_ui.Page``
+        """
+        import panel_material_ui as pmui
+
+        self.apply_session()
+        page_params = self.page_params()
+        if "stylesheets" in params:
+            params["stylesheets"] = page_params["stylesheets"] + list(params["stylesheets"])
+        page_params.update(params)
+        return pmui.Page(**page_params)
+
+    def apply(self, page: Any) -> Any:
+        """
+        Theme an existing ``pmui.Page`` in place.
+
+        Args:
+            page: Page to update
+
+        Returns:
+            The same page
+        """
+        from param.parameterized import edit_constant
+
+        self.apply_session()
+        params = self.page_params()
+        apple_touch_icon = params.pop("meta_apple_touch_icon")
+        params["stylesheets"] = list(page.stylesheets) + params["stylesheets"]
+        page.param.update(**params)
+        with edit_constant(page.meta):
+            page.meta.apple_touch_icon = apple_touch_icon
+        return page
+
+
+_CONTEXTS: Dict[Tuple[bool, bool], SiemensIXContext] = {}
+_CONTEXTS_LOCK = threading.Lock()
+
+
+def _build_context(with_logo: bool, theme_bundle: bool) -> SiemensIXContext:
+    from .assets import asset_url, svg_data_uri
+    from .colors import get_colors
+    from .theme import create_theme
+
+    from .bundle import theme_bundle_url
+
+    # The browser-cached theme bundle defines the CSS variables of both
+    # modes, so styles using them switch with the theme client-side
+    stylesheets = (_root_relative(theme_bundle_url("css")),)
+    if theme_bundle:
+        # Page styles come from the bundle as well
+        sx = None
+    else:
+        sx = freeze({
+            "&.mui-dark .title": {"color": get_colors("dark").text["primary"]},
+            "&.mui-light .title": {"color": get_colors("light").text["primary"]},
+            "& .title": {"fontSize": "1.em", "fontWeight": 550},
+        })
+
+    logo = None
+    if with_logo:
+        logo = FrozenDict(light=svg_data_uri("logo-light"), dark=svg_data_uri("logo-dark"))
+
+    return SiemensIXContext(
+        theme_config=FrozenDict(light=create_theme("light"), dark=create_theme("dark")),
+        logo=logo,
+        favicon=_root_relative(asset_url("favicon")),
+        apple_touch_icon=_root_relative(asset_url("apple-touch-icon")),
+        sx=sx,
+        stylesheets=stylesheets,
+    )
+
+
+def get_context(with_logo: bool = True, theme_bundle: bool = False) -> SiemensIXContext:
+    """
+    Get the shared configuration context for a set of options.
+
+    The context is built on first use and then returned without locking, so
+    calling this once per session is O(1).
+
+    Args:
+        with_logo: Whether pages show the Siemens logo in the header
+        theme_bundle: Whether page styles load from the static theme bundle
+
+    Returns:
+        The process-wide :class:`SiemensIXContext` for these options
+    """
+    key = (bool(with_logo), bool(theme_bundle))
+    context = _CONTEXTS.get(key)
+    if context is None:
+        with _CONTEXTS_LOCK:
+            context = _CONTEXTS.get(key)
+            if context is None:
+                context = _CONTEXTS[key] = _build_context(*key)
+    return context
+
+
+__all__ = [
+    "DISCONNECT_NOTIFICATION",
+    "SiemensIXContext",
+    "get_context",
+]
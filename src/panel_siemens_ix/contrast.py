@@ -0,0 +1,486 @@
+"""
+Vectorized WCAG contrast checks for the Siemens iX palettes and themes.
+
+Contrast ratios of every foreground against every background are computed as
+one ``(F, B)`` NumPy matrix, compositing translucent foregrounds over each
+background first. Failing colors can be nudged in OKLab lightness towards
+black or white until they meet the required level, for all of them at once.
+
+Check the shipped palettes and themes with:
+    python -m panel_siemens_ix.contrast
+    python -m panel_siemens_ix.contrast --level AAA
+"""
+
+import argparse
+import sys
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
+
+import numpy as np
+
+from .gradients import (
+    _srgb_to_linear,
+    array_to_hex,
+    oklab_to_srgb,
+    srgb_to_oklab,
+    to_rgba_array,
+)
+
+# Minimum contrast ratios of WCAG 2.x success criteria 1.4.3, 1.4.6 and 1.4.11
+WCAG_LEVELS: Dict[str, float] = {
+    "AA": 4.5,
+    "AA-large": 3.0,
+    "AAA": 7.0,
+    "AAA-large": 4.5,
+    "non-text": 3.0,
+}
+
+_LUMINANCE = np.array([0.2126, 0.7152, 0.0722])
+_BISECTION_STEPS = 24
+
+# Theme entries checked by check_theme(), as paths into the theme dict
+_THEME_TEXT = ("primary", "secondary", "hint")
+_THEME_INTENTS = ("primary", "secondary", "error", "warning", "info", "success")
+
+
+def _threshold(level: str | float) -> float:
+    if isinstance(level, str):
+        try:
+            return WCAG_LEVELS[level]
+        except KeyError:
+            raise ValueError(
+                f"level must be a ratio or one of {tuple(WCAG_LEVELS)}, got {level!r}"
+            ) from None
+    return float(level)
+
+
+def _composite(foreground: np.ndarray, background: np.ndarray) -> np.ndarray:
+    """Blend RGBA ``uint8`` foregrounds over opaque backgrounds, in 0..1."""
+    alpha = foreground[..., 3:4] / 255.0
+    return foreground[..., :3] / 255.0 * alpha + background[..., :3] / 255.0 * (1 - alpha)
+
+
+def _ratio(foreground_rgb: np.ndarray, background_rgb: np.ndarray) -> np.ndarray:
+    """Contrast ratio of sRGB values in 0..1, broadcasting over leading axes."""
+    l1 = _srgb_to_linear(foreground_rgb) @ _LUMINANCE
+    l2 = _srgb_to_linear(background_rgb) @ _LUMINANCE
+    return (np.maximum(l1, l2) + 0.05) / (np.minimum(l1, l2) + 0.05)
+
+
+def relative_luminance(colors: Sequence[str]) -> np.ndarray:
+    """
+    WCAG relative luminance of colors, ignoring alpha.
+
+    Parameters
+    ----------
+    colors : Sequence[str]
+        Colors in any format supported by :func:`.conversion.parse_color`.
+
+    Returns
+    -------
+    np.ndarray
+        ``float64`` array of shape ``(n,)`` with values in ``0..1``.
+    """
+    return _srgb_to_linear(to_rgba_array(colors)[:, :3] / 255.0) @ _LUMINANCE
+
+
+def contrast_matrix(
+    foregrounds: Sequence[str], backgrounds: Sequence[str]
+) -> np.ndarray:
+    """
+    Contrast ratio of every foreground on every background.
+
+    Translucent foregrounds are composited over each background first;
+    the alpha of backgrounds is ignored.
+
+    Parameters
+    ----------
+    foregrounds, backgrounds : Sequence[str]
+        Colors in any format supported by :func:`.conversion.parse_color`.
+
+    Returns
+    -------
+    np.ndarray
+        ``(len(foregrounds), len(backgrounds))`` ratios in ``1..21``.
+    """
+    fg = to_rgba_array(foregrounds)[:, None, :]
+    bg = to_rgba_array(backgrounds)[None, :, :]
+    return _ratio(_composite(fg, bg), bg[..., :3] / 255.0)
+
+
+def best_contrast(
+    backgrounds: Sequence[str], candidates: Sequence[str] = ("#000000", "#ffffff")
+) -> List[str]:
+    """
+    Pick the candidate with the highest contrast on each background.
+
+    Parameters
+    ----------
+    backgrounds : Sequence[str]
+        Background colors, e.g. swatches that need a label.
+    candidates : Sequence[str], default=("#000000", "#ffffff")
+        Foreground colors to choose from.
+
+    Returns
+    -------
+    List[str]
+        One candidate per background.
+    """
+    best = contrast_matrix(candidates, backgrounds).argmax(axis=0)
+    return [candidates[i] for i in best.tolist()]
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class ContrastReport:
+    """
+    Result of a contrast check.
+
+    Attributes:
+        foregrounds: Names of the foreground colors (matrix rows)
+        backgrounds: Names of the background colors (matrix columns)
+        ratios: Read-only ``(F, B)`` contrast matrix
+        required: Read-only ``(F, B)`` boolean mask of the checked pairs
+        threshold: Minimum contrast ratio for checked pairs
+        colors: Color of every foreground and background name
+    """
+
+    foregrounds: Tuple[str, ...]
+    backgrounds: Tuple[str, ...]
+    ratios: np.ndarray
+    required: np.ndarray
+    threshold: float
+    colors: Mapping[str, str]
+
+    @property
+    def failures(self) -> List[Tuple[str, str, float]]:
+        """``(foreground, background, ratio)`` of every failing pair."""
+        rows, cols = np.nonzero(self.required & (self.ratios < self.threshold))
+        return [
+            (self.foregrounds[i], self.backgrounds[j], float(self.ratios[i, j]))
+            for i, j in zip(rows.tolist(), cols.tolist())
+        ]
+
+    @property
+    def passed(self) -> bool:
+        """Whether every checked pair meets the threshold."""
+        return not bool((self.required & (self.ratios < self.threshold)).any())
+
+    def summary(self) -> str:
+        """Human-readable list of the failing pairs."""
+        failures = self.failures
+        checked = int(self.required.sum())
+        lines = [
+            f"{checked - len(failures)}/{checked} pairs meet {self.threshold:g}:1"
+        ]
+        lines += [
+            f"  FAIL {fg} ({self.colors[fg]}) on {bg} ({self.colors[bg]}): {ratio:.2f}:1"
+            for fg, bg, ratio in failures
+        ]
+        return "\n".join(lines)
+
+
+def check_contrast(
+    foregrounds: Mapping[str, str],
+    backgrounds: Mapping[str, str],
+    level: str | float = "AA",
+    pairs: Sequence[Tuple[str, str]] | None = None,
+) -> ContrastReport:
+    """
+    Check named foreground colors against named background colors.
+
+    Parameters
+    ----------
+    foregrounds, backgrounds : Mapping[str, str]
+        Colors by name.
+    level : str or float, default="AA"
+        A key of ``WCAG_LEVELS`` or a minimum contrast ratio.
+    pairs : Sequence[Tuple[str, str]], optional
+        ``(foreground, background)`` names to check. Defaults to all pairs.
+
+    Returns
+    -------
+    ContrastReport
+    """
+    fg_names, bg_names = tuple(foregrounds), tuple(backgrounds)
+    ratios = contrast_matrix(list(foregrounds.values()), list(backgrounds.values()))
+    ratios.flags.writeable = False
+    if pairs is None:
+        required = np.ones(ratios.shape, dtype=bool)
+    else:
+        required = np.zeros(ratios.shape, dtype=bool)
+        fg_index = {name: i for i, name in enumerate(fg_names)}
+        bg_index = {name: j for j, name in enumerate(bg_names)}
+        for fg, bg in pairs:
+            required[fg_index[fg], bg_index[bg]] = True
+    required.flags.writeable = False
+    return ContrastReport(
+        foregrounds=fg_names,
+        backgrounds=bg_names,
+        ratios=ratios,
+        required=required,
+        threshold=_threshold(level),
+        colors={**backgrounds, **foregrounds},
+    )
+
+
+def check_palette(palette: Any, level: str | float = "AA") -> ContrastReport:
+    """
+    Check a ``SiemensIX*Colors`` palette.
+
+    Every text color except ``disabled`` is checked on every background, and
+    each intent's ``contrast`` color on its ``main``, ``hover`` and
+    ``active`` colors.
+
+    Parameters
+    ----------
+    palette : SiemensIXLightColors, SiemensIXDarkColors or str
+        Palette, or a mode passed to :func:`.colors.get_colors`.
+    level : str or float, default="AA"
+        A key of ``WCAG_LEVELS`` or a minimum contrast ratio.
+
+    Returns
+    -------
+    ContrastReport
+    """
+    if isinstance(palette, str):
+        from .colors import get_colors
+
+        palette = get_colors(palette)
+    groups = palette.to_dict()
+    foregrounds = {
+        f"text.{name}": color for name, color in groups["text"].items() if name != "disabled"
+    }
+    backgrounds = {f"background.{name}": color for name, color in groups["background"].items()}
+    pairs = [(fg, bg) for fg in foregrounds for bg in backgrounds]
+    for group, colors in groups.items():
+        if "contrast" not in colors:
+            continue
+        foregrounds[f"{group}.contrast"] = colors["contrast"]
+        for state in ("main", "hover", "active"):
+            if state in colors:
+                backgrounds[f"{group}.{state}"] = colors[state]
+                pairs.append((f"{group}.contrast", f"{group}.{state}"))
+    return check_contrast(foregrounds, backgrounds, level, pairs)
+
+
+def _theme_colors(theme: Mapping[str, Any]):
+    palette = theme["palette"]
+    foregrounds = {
+        f"palette.text.{name}": palette["text"][name]
+        for name in _THEME_TEXT
+        if name in palette.get("text", {})
+    }
+    backgrounds = {
+        f"palette.background.{name}": color
+        for name, color in palette.get("background", {}).items()
+    }
+    pairs = [(fg, bg) for fg in foregrounds for bg in backgrounds]
+    for intent in _THEME_INTENTS:
+        colors = palette.get(intent)
+        if not colors or "contrastText" not in colors:
+            continue
+        fg = f"palette.{intent}.contrastText"
+        foregrounds[fg] = colors["contrastText"]
+        for shade in ("main", "dark", "light"):
+            if shade in colors:
+                backgrounds[f"palette.{intent}.{shade}"] = colors[shade]
+                pairs.append((fg, f"palette.{intent}.{shade}"))
+    return foregrounds, backgrounds, pairs
+
+
+def check_theme(theme: Mapping[str, Any], level: str | float = "AA") -> ContrastReport:
+    """
+    Check a Material-UI theme from :func:`.theme.create_theme`.
+
+    The text colors (except ``disabled``) are checked on every background,
+    and each intent's ``contrastText`` on its ``main``, ``dark`` and
+    ``light`` shades, which is where Material-UI renders it.
+
+    Parameters
+    ----------
+    theme : Mapping
+        Theme dict, e.g. ``create_theme("dark", overrides)``.
+    level : str or float, default="AA"
+        A key of ``WCAG_LEVELS`` or a minimum contrast ratio.
+
+    Returns
+    -------
+    ContrastReport
+    """
+    foregrounds, backgrounds, pairs = _theme_colors(theme)
+    return check_contrast(foregrounds, backgrounds, level, pairs)
+
+
+def nudge_colors(
+    foregrounds: Sequence[str],
+    backgrounds: Sequence[Sequence[str]],
+    level: str | float = "AA",
+) -> List[str]:
+    """
+    Adjust foregrounds until they meet a contrast level on their backgrounds.
+
+    Each foreground is moved in OKLab towards black or white, whichever
+    reaches the higher contrast, by the smallest amount that meets the level
+    on all of its backgrounds; all foregrounds are bisected together. Colors
+    that already pass are returned unchanged, and alpha is preserved.
+
+    Parameters
+    ----------
+    foregrounds : Sequence[str]
+        Colors to adjust.
+    backgrounds : Sequence[Sequence[str]]
+        For every foreground, the backgrounds it must pass on.
+    level : str or float, default="AA"
+        A key of ``WCAG_LEVELS`` or a minimum contrast ratio.
+
+    Returns
+    -------
+    List[str]
+        Hex colors, ``#rrggbbaa`` where the input was translucent.
+    """
+    threshold = _threshold(level)
+    owner = np.array([i for i, bgs in enumerate(backgrounds) for _ in bgs], dtype=np.intp)
+    bg = to_rgba_array([color for bgs in backgrounds for color in bgs])
+    fg = to_rgba_array(foregrounds)
+    n = len(fg)
+
+    def worst(rgb: np.ndarray) -> np.ndarray:
+        """Lowest ratio of every foreground over its backgrounds."""
+        rgba = np.concatenate([np.round(rgb * 255), fg[:, 3:4]], axis=1)
+        ratios = _ratio(_composite(rgba[owner], bg), bg[:, :3] / 255.0)
+        result = np.full(n, np.inf)
+        np.minimum.at(result, owner, ratios)
+        return result
+
+    lab = srgb_to_oklab(fg[:, :3] / 255.0)
+    black, white = np.zeros((n, 3)), np.ones((n, 3))
+    towards_white = worst(white) > worst(black)
+    target = srgb_to_oklab(np.where(towards_white[:, None], white, black))
+
+    # Bisect the smallest step towards the target that meets the threshold
+    low, high = np.zeros(n), np.ones(n)
+    passing = worst(fg[:, :3] / 255.0) >= threshold
+    high[passing] = 0.0
+    for _ in range(_BISECTION_STEPS):
+        mid = (low + high) / 2
+        ok = worst(oklab_to_srgb(lab + (target - lab) * mid[:, None])) >= threshold
+        high = np.where(ok, mid, high)
+        low = np.where(ok, low, mid)
+
+    rgba = fg.copy()
+    rgba[:, :3] = np.round(oklab_to_srgb(lab + (target - lab) * high[:, None]) * 255)
+    rgba[passing] = fg[passing]
+    hex_colors = array_to_hex(rgba, alpha=True)
+    return [
+        color if alpha < 255 else color[:7]
+        for color, alpha in zip(hex_colors, rgba[:, 3].tolist())
+    ]
+
+
+def _nested(paths: Sequence[str], colors: Sequence[str]) -> Dict[str, Any]:
+    """Turn dotted paths and their colors into nested theme overrides."""
+    overrides: Dict[str, Any] = {}
+    for path, color in zip(paths, colors):
+        node = overrides
+        *parents, leaf = path.split(".")
+        for key in parents:
+            node = node.setdefault(key, {})
+        node[leaf] = color
+    return overrides
+
+
+def fix_theme(theme: Mapping[str, Any], level: str | float = "AA"):
+    """
+    Return a copy of a theme with failing colors nudged to pass.
+
+    Failing text and ``contrastText`` colors are nudged first. Intent shades
+    (``main``, ``dark``, ``light``) that still fail with their nudged
+    ``contrastText``, e.g. white text on a mid-tone, are nudged in turn;
+    page backgrounds are never changed.
+
+    Parameters
+    ----------
+    theme : Mapping
+        Theme dict, e.g. ``create_theme("light", tenant_overrides)``.
+    level : str or float, default="AA"
+        A key of ``WCAG_LEVELS`` or a minimum contrast ratio.
+
+    Returns
+    -------
+    FrozenDict
+        The adjusted theme, or the theme itself if every checked pair
+        already passes. Pairs that cannot reach the level, such as
+        translucent text, are improved as far as possible.
+    """
+    from .theme import merge_theme
+
+    foregrounds, backgrounds, pairs = _theme_colors(theme)
+    report = check_contrast(foregrounds, backgrounds, level, pairs)
+    failing = sorted({fg for fg, _, _ in report.failures})
+    if failing:
+        fixed = nudge_colors(
+            [foregrounds[fg] for fg in failing],
+            [[backgrounds[bg] for f, bg in pairs if f == fg] for fg in failing],
+            level,
+        )
+        theme = merge_theme(theme, _nested(failing, fixed))
+        foregrounds, backgrounds, pairs = _theme_colors(theme)
+        report = check_contrast(foregrounds, backgrounds, level, pairs)
+
+    shades = sorted(
+        {bg for _, bg, _ in report.failures if not bg.startswith("palette.background.")}
+    )
+    if shades:
+        # Contrast is symmetric, so a shade is nudged against its text
+        fixed = nudge_colors(
+            [backgrounds[bg] for bg in shades],
+            [[foregrounds[fg] for fg, b in pairs if b == bg] for bg in shades],
+            level,
+        )
+        theme = merge_theme(theme, _nested(shades, fixed))
+    return merge_theme(theme, {})
+
+
+def main() -> int:
+    """Check the shipped palettes and themes, exiting 1 on failures."""
+    parser = argparse.ArgumentParser(description="Check Siemens iX color contrast.")
+    parser.add_argument(
+        "--level",
+        default="AA",
+        help=f"One of {', '.join(WCAG_LEVELS)} or a minimum ratio (default: AA)",
+    )
+    args = parser.parse_args()
+    try:
+        level: str | float = float(args.level)
+    except ValueError:
+        level = args.level
+
+    from .theme import create_theme
+
+    failed = False
+    for mode in ("light", "dark"):
+        for name, report in (
+            (f"{mode} palette", check_palette(mode, level)),
+            (f"{mode} theme", check_theme(create_theme(mode), level)),
+        ):
+            print(f"{name}: {report.summary()}")
+            failed = failed or not report.passed
+    return 1 if failed else 0
+
+
+__all__ = [
+    "WCAG_LEVELS",
+    "ContrastReport",
+    "best_contrast",
+    "check_contrast",
+    "check_palette",
+    "check_theme",
+    "contrast_matrix",
+    "fix_theme",
+    "nudge_colors",
+    "relative_luminance",
+]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
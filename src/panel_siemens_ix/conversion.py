@@ -0,0 +1,200 @@
+"""
+Color conversion utilities for the Siemens iX color system.
+
+Parses the color notations used by the Siemens iX palettes (``#rgb``,
+``#rgba``, ``#rrggbb``, ``#rrggbbaa``, ``rgb(...)`` and ``rgba(...)``) into
+``(r, g, b, alpha)`` tuples and formats them back to CSS strings. Parsed and
+formatted colors are kept in bounded LRU caches, since the same handful of
+palette colors is converted over and over during theme construction.
+"""
+
+import re
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple
+
+RGBA = Tuple[int, int, int, float]
+
+_CACHE_SIZE = 1024
+
+_HEX_PATTERN = re.compile(r"#?([0-9a-fA-F]{3,8})")
+_RGB_PATTERN = re.compile(
+    r"rgba?\(\s*(\d{1,3})\s*,\s*(\d{1,3})\s*,\s*(\d{1,3})\s*(?:,\s*([\d.]+)\s*)?\)"
+)
+
+
+def _format_alpha(alpha: float) -> str:
+    """Format an alpha value compactly, e.g. ``1``, ``0.45`` or ``0.302``."""
+    return f"{round(alpha, 3):g}"
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def parse_color(color: str) -> RGBA:
+    """
+    Parse a hex, rgb or rgba color string.
+
+    Parameters
+    ----------
+    color : str
+        Color such as ``'#00cccc'``, ``'#00cccc73'``, ``'#fff'`` or
+        ``'rgba(255,255,255,0.45)'``.
+
+    Returns
+    -------
+    Tuple[int, int, int, float]
+        Red, green and blue in ``0..255`` and alpha in ``0..1``.
+
+    Raises
+    ------
+    ValueError
+        If the color is not in a supported format.
+    """
+    color = color.strip()
+    match = _RGB_PATTERN.fullmatch(color)
+    if match:
+        r, g, b = (int(v) for v in match.group(1, 2, 3))
+        alpha = float(match.group(4)) if match.group(4) is not None else 1.0
+        if max(r, g, b) > 255 or not 0.0 <= alpha <= 1.0:
+            raise ValueError(f"Color component out of range: {color}")
+        return r, g, b, alpha
+
+    match = _HEX_PATTERN.fullmatch(color)
+    if match is None or len(match.group(1)) not in (3, 4, 6, 8):
+        raise ValueError(f"Invalid color format: {color}")
+
+    hex_color = match.group(1)
+    if len(hex_color) in (3, 4):
+        hex_color = "".join(c * 2 for c in hex_color)
+    r = int(hex_color[0:2], 16)
+    g = int(hex_color[2:4], 16)
+    b = int(hex_color[4:6], 16)
+    alpha = int(hex_color[6:8], 16) / 255 if len(hex_color) == 8 else 1.0
+    return r, g, b, alpha
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def to_rgba(color: str, alpha: Optional[float] = None) -> str:
+    """
+    Convert a color to a CSS ``rgb()``/``rgba()`` string.
+
+    Opaque colors without an ``alpha`` override are returned as ``rgb(...)``,
+    everything else as ``rgba(...)``.
+
+    Parameters
+    ----------
+    color : str
+        Color in any format supported by :func:`parse_color`.
+    alpha : float, optional
+        Alpha value overriding the color's own alpha.
+
+    Returns
+    -------
+    str
+        CSS color string, e.g. ``'rgba(0, 204, 204, 0.45)'``.
+    """
+    r, g, b, parsed_alpha = parse_color(color)
+    if alpha is None:
+        if parsed_alpha == 1.0:
+            return f"rgb({r}, {g}, {b})"
+        alpha = parsed_alpha
+    return f"rgba({r}, {g}, {b}, {_format_alpha(alpha)})"
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def to_hex(color: str, alpha: Optional[float] = None) -> str:
+    """
+    Convert a color to a lowercase hex string.
+
+    Opaque colors are returned as ``#rrggbb``, translucent ones as
+    ``#rrggbbaa``.
+
+    Parameters
+    ----------
+    color : str
+        Color in any format supported by :func:`parse_color`.
+    alpha : float, optional
+        Alpha value overriding the color's own alpha.
+
+    Returns
+    -------
+    str
+        Hex color string, e.g. ``'#00cccc73'``.
+    """
+    r, g, b, parsed_alpha = parse_color(color)
+    alpha = parsed_alpha if alpha is None else alpha
+    if alpha >= 1.0:
+        return f"#{r:02x}{g:02x}{b:02x}"
+    return f"#{r:02x}{g:02x}{b:02x}{round(alpha * 255):02x}"
+
+
+def parse_colors(colors: Iterable[str]) -> List[RGBA]:
+    """
+    Parse a sequence of colors in one call.
+
+    Parameters
+    ----------
+    colors : Iterable[str]
+        Colors in any format supported by :func:`parse_color`.
+
+    Returns
+    -------
+    List[Tuple[int, int, int, float]]
+        Parsed ``(r, g, b, alpha)`` tuples in input order.
+    """
+    return [parse_color(color) for color in colors]
+
+
+def to_rgba_list(colors: Iterable[str], alpha: Optional[float] = None) -> List[str]:
+    """
+    Convert a sequence of colors to CSS ``rgb()``/``rgba()`` strings.
+
+    Parameters
+    ----------
+    colors : Iterable[str]
+        Colors in any format supported by :func:`parse_color`.
+    alpha : float, optional
+        Alpha value applied to every color.
+
+    Returns
+    -------
+    List[str]
+        CSS color strings in input order.
+    """
+    return [to_rgba(color, alpha) for color in colors]
+
+
+def to_hex_list(colors: Iterable[str], alpha: Optional[float] = None) -> List[str]:
+    """
+    Convert a sequence of colors to hex strings.
+
+    Parameters
+    ----------
+    colors : Iterable[str]
+        Colors in any format supported by :func:`parse_color`.
+    alpha : float, optional
+        Alpha value applied to every color.
+
+    Returns
+    -------
+    List[str]
+        Hex color strings in input order.
+    """
+    return [to_hex(color, alpha) for color in colors]
+
+
+def clear_cache() -> None:
+    """Clear the parsed and formatted color caches."""
+    parse_color.cache_clear()
+    to_rgba.cache_clear()
+    to_hex.cache_clear()
+
+
+__all__ = [
+    "RGBA",
+    "parse_color",
+    "parse_colors",
+    "to_rgba",
+    "to_rgba_list",
+    "to_hex",
+    "to_hex_list",
+    "clear_cache",
+]
@@ -0,0 +1,79 @@
+"""
+Immutable mappings used to share theme structures safely.
+
+A :class:`FrozenDict` is a ``dict`` subclass that rejects mutation, so it can
+be passed anywhere a plain dict is expected (``param.Dict`` parameters, JSON
+serialization) while allowing memoized themes to share unchanged subtrees.
+"""
+
+from typing import Any, Dict, Mapping
+
+
+class FrozenDict(dict):
+    """
+    Hashable, read-only ``dict``.
+
+    All mutating methods raise ``TypeError``. Copies return the instance
+    itself, since it can never change.
+    """
+
+    __slots__ = ("_hash",)
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError(f"{type(self).__name__} is immutable, use thaw() for a mutable copy")
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(frozenset(self.items()))
+            return self._hash
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict.__repr__(self)})"
+
+    def __reduce__(self):
+        return type(self), (dict(self),)
+
+    def __copy__(self) -> "FrozenDict":
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "FrozenDict":
+        return self
+
+
+def freeze(value: Any) -> Any:
+    """
+    Recursively convert mappings to :class:`FrozenDict` and lists to tuples.
+
+    Already frozen mappings are returned as-is, so freezing a structure that
+    shares frozen subtrees does not copy them.
+    """
+    if isinstance(value, FrozenDict):
+        return value
+    if isinstance(value, Mapping):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """
+    Recursively convert a frozen structure into plain, mutable dicts and lists.
+    """
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return value
+
+
+__all__ = [
+    "FrozenDict",
+    "freeze",
+    "thaw",
+]
@@ -0,0 +1,292 @@
+"""
+Vectorized gradient engine for the Siemens iX color system.
+
+Colors are handled as NumPy arrays of RGB(A) values so that whole gradients
+are interpolated in one pass instead of per-color Python loops. Gradients can
+be interpolated in sRGB (matching ``panel_material_ui.theme.linear_gradient``
+and ``generate_palette``) or in the perceptually uniform OKLab space.
+"""
+
+import colorsys
+from typing import Iterable, List, Literal, Sequence
+
+import numpy as np
+
+from .conversion import parse_colors
+
+GradientSpace = Literal["srgb", "oklab"]
+
+SPACES = ("srgb", "oklab")
+
+# sRGB -> LMS and LMS -> OKLab matrices from https://bottosson.github.io/posts/oklab/
+_RGB_TO_LMS = np.array(
+    [
+        [0.4122214708, 0.5363325363, 0.0514459929],
+        [0.2119034982, 0.6806995451, 0.1073969566],
+        [0.0883024619, 0.2817188376, 0.6299787005],
+    ]
+)
+_LMS_TO_OKLAB = np.array(
+    [
+        [0.2104542553, 0.7936177850, -0.0040720468],
+        [1.9779984951, -2.4285922050, 0.4505937099],
+        [0.0259040371, 0.7827717662, -0.8086757660],
+    ]
+)
+_LMS_TO_RGB = np.linalg.inv(_RGB_TO_LMS)
+_OKLAB_TO_LMS = np.linalg.inv(_LMS_TO_OKLAB)
+
+_HEX_BYTES = np.array([f"{i:02x}" for i in range(256)])
+
+
+def to_rgba_array(colors: Iterable[str]) -> np.ndarray:
+    """
+    Convert colors to an ``(n, 4)`` ``uint8`` RGBA array.
+
+    Parameters
+    ----------
+    colors : Iterable[str]
+        Colors in any format supported by :func:`.conversion.parse_color`.
+
+    Returns
+    -------
+    np.ndarray
+        C-contiguous array of shape ``(n, 4)`` and dtype ``uint8``.
+    """
+    parsed = parse_colors(colors)
+    rgba = np.empty((len(parsed), 4), dtype=np.uint8)
+    if parsed:
+        values = np.array(parsed, dtype=np.float64)
+        rgba[:, :3] = values[:, :3]
+        rgba[:, 3] = np.round(values[:, 3] * 255)
+    return rgba
+
+
+def array_to_hex(rgba: np.ndarray, alpha: bool = False) -> List[str]:
+    """
+    Convert an ``(n, 3)`` or ``(n, 4)`` ``uint8`` array to hex strings.
+
+    Parameters
+    ----------
+    rgba : np.ndarray
+        Array of RGB(A) byte values.
+    alpha : bool, default=False
+        If True, append the alpha channel as ``#rrggbbaa``.
+
+    Returns
+    -------
+    List[str]
+        Hex color strings, one per row.
+    """
+    channels = rgba[:, :4] if alpha else rgba[:, :3]
+    digits = _HEX_BYTES[np.asarray(channels, dtype=np.uint8)]
+    return ["#" + "".join(row) for row in digits.tolist()]
+
+
+def _srgb_to_linear(rgb: np.ndarray) -> np.ndarray:
+    return np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+
+
+def _linear_to_srgb(rgb: np.ndarray) -> np.ndarray:
+    rgb = np.clip(rgb, 0.0, 1.0)
+    return np.where(
+        rgb <= 0.0031308, rgb * 12.92, 1.055 * rgb ** (1 / 2.4) - 0.055
+    )
+
+
+def srgb_to_oklab(rgb: np.ndarray) -> np.ndarray:
+    """
+    Convert sRGB values in ``0..1`` to OKLab.
+
+    Parameters
+    ----------
+    rgb : np.ndarray
+        Array of shape ``(..., 3)``.
+
+    Returns
+    -------
+    np.ndarray
+        OKLab ``L, a, b`` values of the same shape.
+    """
+    lms = _srgb_to_linear(np.asarray(rgb, dtype=np.float64)) @ _RGB_TO_LMS.T
+    return np.cbrt(lms) @ _LMS_TO_OKLAB.T
+
+
+def oklab_to_srgb(lab: np.ndarray) -> np.ndarray:
+    """
+    Convert OKLab values to sRGB in ``0..1``, clipping out-of-gamut colors.
+
+    Parameters
+    ----------
+    lab : np.ndarray
+        Array of shape ``(..., 3)``.
+
+    Returns
+    -------
+    np.ndarray
+        sRGB values of the same shape.
+    """
+    lms = (np.asarray(lab, dtype=np.float64) @ _OKLAB_TO_LMS.T) ** 3
+    return _linear_to_srgb(lms @ _LMS_TO_RGB.T)
+
+
+def _check_space(space: str) -> None:
+    if space not in SPACES:
+        raise ValueError(f"space must be one of {SPACES}, got {space!r}")
+
+
+def linear_gradient(
+    start: str, end: str, n: int, space: GradientSpace = "srgb"
+) -> np.ndarray:
+    """
+    Interpolate ``n`` colors between two colors.
+
+    In ``"srgb"`` space the result matches
+    ``panel_material_ui.theme.linear_gradient`` exactly.
+
+    Parameters
+    ----------
+    start : str
+        Starting color.
+    end : str
+        Final color.
+    n : int
+        Number of colors, including both end points.
+    space : {"srgb", "oklab"}, default="srgb"
+        Color space to interpolate in.
+
+    Returns
+    -------
+    np.ndarray
+        ``(n, 3)`` ``uint8`` array of RGB values.
+    """
+    _check_space(space)
+    endpoints = to_rgba_array([start, end])[:, :3].astype(np.float64)
+    if n <= 1:
+        return endpoints[:max(n, 0)].astype(np.uint8)
+
+    t = np.arange(n, dtype=np.float64) / (n - 1)
+    if space == "srgb":
+        s, f = endpoints
+        rgb = np.trunc(s + t[:, None] * (f - s))
+        # Mirror the float round trip of panel_material_ui's rgb2hex
+        return np.trunc(rgb / 255.0 * 255.0).astype(np.uint8)
+
+    s, f = srgb_to_oklab(endpoints / 255.0)
+    lab = s + t[:, None] * (f - s)
+    return np.round(oklab_to_srgb(lab) * 255).astype(np.uint8)
+
+
+def _hls_to_rgb(h: np.ndarray, lightness: float, saturation: float) -> np.ndarray:
+    """Vectorized ``colorsys.hls_to_rgb`` for an array of hues."""
+    if saturation == 0.0:
+        return np.full((len(h), 3), lightness)
+    if lightness <= 0.5:
+        m2 = lightness * (1.0 + saturation)
+    else:
+        m2 = lightness + saturation - (lightness * saturation)
+    m1 = 2.0 * lightness - m2
+
+    def _channel(hue: np.ndarray) -> np.ndarray:
+        hue = np.mod(hue, 1.0)
+        return np.select(
+            [hue < 1 / 6, hue < 0.5, hue < 2 / 3],
+            [m1 + (m2 - m1) * hue * 6.0, m2, m1 + (m2 - m1) * (2 / 3 - hue) * 6.0],
+            m1,
+        )
+
+    return np.stack([_channel(h + 1 / 3), _channel(h), _channel(h - 1 / 3)], axis=-1)
+
+
+def hue_rotation(color: str, n: int, space: GradientSpace = "srgb") -> np.ndarray:
+    """
+    Generate ``n`` colors by rotating the hue of a base color.
+
+    In ``"srgb"`` space (HLS rotation) the result matches
+    ``panel_material_ui.theme.generate_palette`` exactly. In ``"oklab"``
+    space the hue is rotated in OKLCh, keeping lightness and chroma.
+
+    Parameters
+    ----------
+    color : str
+        Base color, returned as the first entry.
+    n : int
+        Number of colors.
+    space : {"srgb", "oklab"}, default="srgb"
+        Color space to rotate the hue in.
+
+    Returns
+    -------
+    np.ndarray
+        ``(n, 3)`` ``uint8`` array of RGB values.
+    """
+    _check_space(space)
+    rgb = to_rgba_array([color])[0, :3] / 255.0
+    hues = np.linspace(0, 1, int(n) + 1)[:-1]
+
+    if space == "srgb":
+        h, lightness, saturation = colorsys.rgb_to_hls(*rgb.tolist())
+        hues += h
+        hues %= 1
+        hues -= hues.astype(int)
+        return np.trunc(_hls_to_rgb(hues, lightness, saturation) * 255).astype(np.uint8)
+
+    lightness, a, b = srgb_to_oklab(rgb)
+    chroma = np.hypot(a, b)
+    angles = np.arctan2(b, a) + 2 * np.pi * hues
+    lab = np.stack(
+        [np.full(len(hues), lightness), chroma * np.cos(angles), chroma * np.sin(angles)],
+        axis=-1,
+    )
+    return np.round(oklab_to_srgb(lab) * 255).astype(np.uint8)
+
+
+def three_part_gradient(
+    stops: Sequence[str], n_colors: int, space: GradientSpace = "srgb"
+) -> np.ndarray:
+    """
+    Build the three-part Siemens iX continuous gradient.
+
+    The first third runs from ``stops[0]`` to ``stops[1]``, the second third
+    from ``stops[1]`` to ``stops[2]`` and the remainder rotates the hue of
+    ``stops[2]``.
+
+    Parameters
+    ----------
+    stops : Sequence[str]
+        Start, mid and end colors.
+    n_colors : int
+        Total number of colors. Must be at least 1.
+    space : {"srgb", "oklab"}, default="srgb"
+        Color space to interpolate in.
+
+    Returns
+    -------
+    np.ndarray
+        C-contiguous ``(n_colors, 4)`` ``uint8`` RGBA array.
+    """
+    if n_colors < 1:
+        raise ValueError("n_colors must be at least 1")
+    start, mid, end = stops
+    n_part1 = n_colors // 3
+    n_part2 = n_colors // 3
+    n_part3 = n_colors - n_part1 - n_part2
+
+    rgba = np.full((n_colors, 4), 255, dtype=np.uint8)
+    rgba[:n_part1, :3] = linear_gradient(start, mid, n_part1, space)
+    rgba[n_part1:n_part1 + n_part2, :3] = linear_gradient(mid, end, n_part2, space)
+    rgba[n_part1 + n_part2:, :3] = hue_rotation(end, n_part3, space)
+    return rgba
+
+
+__all__ = [
+    "GradientSpace",
+    "SPACES",
+    "to_rgba_array",
+    "array_to_hex",
+    "srgb_to_oklab",
+    "oklab_to_srgb",
+    "linear_gradient",
+    "hue_rotation",
+    "three_part_gradient",
+]
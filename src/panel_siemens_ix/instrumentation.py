@@ -0,0 +1,268 @@
+"""
+Optional call counters and timing histograms for the hot-path functions.
+
+``get_colors``, ``create_theme``, ``get_continuous_cmap`` and
+``get_categorical_palette`` are instrumented when the environment variable
+``SIEMENS_IX_METRICS`` is set to ``1`` (or ``true``/``yes``/``on``) before
+``panel_siemens_ix`` is imported. Otherwise :func:`instrumented` returns the
+functions unchanged, so there is no overhead at all.
+
+When enabled, every call is counted and timed, process-wide and per Bokeh
+document (Panel session), which exposes dashboards that rebuild palettes in
+tight loops. The :class:`Metrics` registry is published as
+``pn.state.cache["siemens_ix_metrics"]`` once Panel is loaded, and exports
+the Prometheus text format::
+
+    import panel as pn
+    metrics = pn.state.cache["siemens_ix_metrics"]
+    metrics.session_calls()       # calls per function in the current session
+    print(metrics.prometheus())
+
+    pn.serve(app, extra_patterns=[metrics_route()])  # GET /metrics
+"""
+
+import bisect
+import functools
+import os
+import sys
+import threading
+import time
+import weakref
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+ENV_VAR = "SIEMENS_IX_METRICS"
+ENABLED = os.environ.get(ENV_VAR, "").strip().lower() in ("1", "true", "yes", "on")
+
+STATE_CACHE_KEY = "siemens_ix_metrics"
+
+# Upper bounds of the timing histogram buckets, in seconds
+BUCKETS = (1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 1e-2, 5e-2, 0.1, 0.5)
+_BUCKETS_NS = tuple(int(bound * 1e9) for bound in BUCKETS)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class _Histogram:
+    """Call count and duration histogram of one function."""
+
+    __slots__ = ("counts", "count", "sum_ns")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.sum_ns = 0
+
+    def observe(self, duration_ns: int) -> None:
+        self.counts[bisect.bisect_left(_BUCKETS_NS, duration_ns)] += 1
+        self.count += 1
+        self.sum_ns += duration_ns
+
+
+class Metrics:
+    """Thread-safe registry of the call statistics."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, _Histogram] = {}
+        # Per-document call counts, dropped with their (destroyed) documents
+        self._sessions: "weakref.WeakKeyDictionary[Any, Dict[str, int]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._published = False
+
+    def record(self, name: str, duration_ns: int) -> None:
+        """Count a call of ``name`` that took ``duration_ns`` nanoseconds."""
+        document = _current_document()
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = _Histogram()
+            histogram.observe(duration_ns)
+            if document is not None:
+                calls = self._sessions.get(document)
+                if calls is None:
+                    calls = self._sessions[document] = {}
+                calls[name] = calls.get(name, 0) + 1
+        if not self._published:
+            self._publish()
+
+    def _publish(self) -> None:
+        state = getattr(sys.modules.get("panel"), "state", None)
+        if state is not None:
+            state.cache.setdefault(STATE_CACHE_KEY, self)
+            self._published = True
+
+    def calls(self) -> Dict[str, int]:
+        """Process-wide number of calls per function."""
+        with self._lock:
+            return {name: h.count for name, h in self._histograms.items()}
+
+    def timings(self) -> Dict[str, Dict[str, Any]]:
+        """Per function: ``count``, ``sum`` (seconds) and cumulative ``buckets``."""
+        with self._lock:
+            result = {}
+            for name, h in self._histograms.items():
+                cumulative, total = [], 0
+                for bound, count in zip(BUCKETS + (float("inf"),), h.counts):
+                    total += count
+                    cumulative.append((bound, total))
+                result[name] = {"count": h.count, "sum": h.sum_ns / 1e9, "buckets": cumulative}
+            return result
+
+    def session_calls(self, document: Any = None) -> Dict[str, int]:
+        """
+        Number of calls per function in a session.
+
+        Args:
+            document: Bokeh document of the session, defaults to the current one
+
+        Returns:
+            Calls per function, empty outside of a session
+        """
+        document = _current_document() if document is None else document
+        with self._lock:
+            return dict(self._sessions.get(document, {})) if document is not None else {}
+
+    def sessions(self) -> List[Tuple[Optional[str], Dict[str, int]]]:
+        """``(session id, calls per function)`` of every live session."""
+        with self._lock:
+            items = list(self._sessions.items())
+        return [(_session_id(document), dict(calls)) for document, calls in items]
+
+    def reset(self) -> None:
+        """Discard all recorded calls."""
+        with self._lock:
+            self._histograms.clear()
+            self._sessions.clear()
+
+    def prometheus(self) -> str:
+        """Export the metrics in the Prometheus text exposition format."""
+        timings = self.timings()
+        sessions = self.sessions()
+        lines = [
+            "# HELP siemens_ix_calls_total Calls of panel_siemens_ix functions.",
+            "# TYPE siemens_ix_calls_total counter",
+        ]
+        lines += [
+            f'siemens_ix_calls_total{{function="{name}"}} {t["count"]}'
+            for name, t in timings.items()
+        ]
+        lines += [
+            "# HELP siemens_ix_call_duration_seconds Duration of panel_siemens_ix function calls.",
+            "# TYPE siemens_ix_call_duration_seconds histogram",
+        ]
+        for name, t in timings.items():
+            for bound, count in t["buckets"]:
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(
+                    f'siemens_ix_call_duration_seconds_bucket{{function="{name}",le="{le}"}} {count}'
+                )
+            lines.append(f'siemens_ix_call_duration_seconds_sum{{function="{name}"}} {t["sum"]!r}')
+            lines.append(f'siemens_ix_call_duration_seconds_count{{function="{name}"}} {t["count"]}')
+        lines += [
+            "# HELP siemens_ix_sessions Live sessions that called panel_siemens_ix functions.",
+            "# TYPE siemens_ix_sessions gauge",
+            f"siemens_ix_sessions {len(sessions)}",
+            "# HELP siemens_ix_session_calls_max Most calls of a function by one live session.",
+            "# TYPE siemens_ix_session_calls_max gauge",
+        ]
+        most: Dict[str, int] = {}
+        for _, calls in sessions:
+            for name, count in calls.items():
+                most[name] = max(most.get(name, 0), count)
+        lines += [
+            f'siemens_ix_session_calls_max{{function="{name}"}} {count}'
+            for name, count in most.items()
+        ]
+
+        from .colors import palette_cache_info
+
+        lines += [
+            "# HELP siemens_ix_cache_hits_total Palette cache hits.",
+            "# TYPE siemens_ix_cache_hits_total counter",
+        ]
+        info = palette_cache_info()
+        lines += [f'siemens_ix_cache_hits_total{{cache="{c}"}} {i["hits"]}' for c, i in info.items()]
+        lines += [
+            "# HELP siemens_ix_cache_misses_total Palette cache misses.",
+            "# TYPE siemens_ix_cache_misses_total counter",
+        ]
+        lines += [
+            f'siemens_ix_cache_misses_total{{cache="{c}"}} {i["misses"]}' for c, i in info.items()
+        ]
+        return "\n".join(lines) + "\n"
+
+
+def _current_document() -> Any:
+    """The Bokeh document of the current Panel session, if any."""
+    state = getattr(sys.modules.get("panel"), "state", None)
+    return None if state is None else state.curdoc
+
+
+def _session_id(document: Any) -> Optional[str]:
+    context = getattr(document, "session_context", None)
+    return getattr(context, "id", None)
+
+
+METRICS = Metrics()
+
+
+def get_metrics() -> Metrics:
+    """The process-wide metrics registry (empty unless instrumentation is enabled)."""
+    return METRICS
+
+
+def instrumented(name: str) -> Callable[[F], F]:
+    """
+    Decorator counting and timing calls of a function as ``name``.
+
+    Returns the function itself unless instrumentation is enabled.
+    """
+
+    def decorate(func: F) -> F:
+        if not ENABLED:
+            return func
+        perf_counter_ns, record = time.perf_counter_ns, METRICS.record
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(name, perf_counter_ns() - start)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+def metrics_route(path: str = "/metrics") -> Tuple[str, Any]:
+    """
+    Tornado route serving :meth:`Metrics.prometheus`.
+
+    Args:
+        path: URL path of the endpoint
+
+    Returns:
+        ``(path, handler)`` for ``pn.serve(..., extra_patterns=[...])``
+    """
+    from tornado.web import RequestHandler
+
+    class MetricsHandler(RequestHandler):
+        def get(self):
+            self.set_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.write(METRICS.prometheus())
+
+    return path, MetricsHandler
+
+
+__all__ = [
+    "ENABLED",
+    "ENV_VAR",
+    "METRICS",
+    "Metrics",
+    "get_metrics",
+    "instrumented",
+    "metrics_route",
+]
@@ -0,0 +1,251 @@
+"""
+Packed, array-backed storage for the Siemens iX palettes.
+
+A :class:`PackedPalette` keeps every color of a palette in one read-only
+``(n, 4)`` ``uint8`` RGBA NumPy array plus a ``(group, name) -> row`` index.
+Color groups are exposed as read-only mapping views over the array with the
+same access pattern as the palette dataclasses (``packed.primary["main"]``),
+while whole-palette operations such as alpha changes, luminance (for contrast
+checks) and interpolation run as single vectorized array operations.
+"""
+
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .gradients import _srgb_to_linear, array_to_hex, to_rgba_array
+
+ColorKey = Tuple[str, str]
+
+# WCAG 2.x relative luminance coefficients for linear sRGB
+_LUMINANCE = np.array([0.2126, 0.7152, 0.0722])
+
+
+def _readonly(array: np.ndarray) -> np.ndarray:
+    array.flags.writeable = False
+    return array
+
+
+class PackedGroup(Mapping[str, str]):
+    """
+    Read-only view of one color group of a :class:`PackedPalette`.
+
+    Values are normalized hex strings, ``#rrggbb`` for opaque colors and
+    ``#rrggbbaa`` otherwise.
+    """
+
+    __slots__ = ("_palette", "_rows")
+
+    def __init__(self, palette: "PackedPalette", rows: Mapping[str, int]):
+        self._palette = palette
+        self._rows = rows
+
+    def __getitem__(self, name: str) -> str:
+        return self._palette.hex()[self._rows[name]]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+    @property
+    def rgba(self) -> np.ndarray:
+        """Read-only ``(len(group), 4)`` ``uint8`` rows of this group."""
+        rows = list(self._rows.values())
+        if rows == list(range(rows[0], rows[0] + len(rows))):
+            # Groups packed contiguously are a view, without copying
+            return self._palette.rgba[rows[0] : rows[0] + len(rows)]
+        return _readonly(self._palette.rgba[rows])
+
+
+class PackedPalette:
+    """
+    Palette stored as a single ``uint8`` RGBA array with a name index.
+
+    Parameters
+    ----------
+    rgba : array-like
+        ``(n, 4)`` RGBA values in ``0..255``.
+    keys : Sequence[Tuple[str, str]]
+        ``(group, name)`` of every row, in order.
+    mode : str, optional
+        Theme mode the palette belongs to.
+
+    Examples
+    --------
+    >>> packed = get_packed_colors("dark")
+    >>> packed.primary["main"]
+    '#00cccc'
+    >>> packed.rgba.nbytes
+    384
+    >>> faded = packed.with_alpha(0.4)  # every color at 40% opacity
+    """
+
+    __slots__ = ("mode", "rgba", "index", "_groups", "_hex")
+
+    def __init__(
+        self, rgba: Any, keys: Sequence[ColorKey], mode: Optional[str] = None
+    ):
+        rgba = np.ascontiguousarray(rgba, dtype=np.uint8)
+        if rgba.ndim != 2 or rgba.shape[1] != 4 or len(rgba) != len(keys):
+            raise ValueError(
+                f"rgba must have shape ({len(keys)}, 4), got {rgba.shape}"
+            )
+        if rgba.flags.writeable:
+            rgba = _readonly(rgba.copy())
+        self.mode = mode
+        self.rgba = rgba
+        self.index: Mapping[ColorKey, int] = MappingProxyType(
+            {key: row for row, key in enumerate(keys)}
+        )
+        groups: Dict[str, Dict[str, int]] = {}
+        for (group, name), row in self.index.items():
+            groups.setdefault(group, {})[name] = row
+        self._groups = MappingProxyType(
+            {group: PackedGroup(self, MappingProxyType(rows)) for group, rows in groups.items()}
+        )
+        self._hex: Optional[Tuple[str, ...]] = None
+
+    @classmethod
+    def from_palette(cls, palette: Any, mode: Optional[str] = None) -> "PackedPalette":
+        """
+        Pack a palette dataclass (or ``{group: {name: color}}`` mapping).
+
+        Parameters
+        ----------
+        palette : SiemensIXLightColors, SiemensIXDarkColors or Mapping
+            Palette to pack. Colors may use any format supported by
+            :func:`.conversion.parse_color`.
+        mode : str, optional
+            Theme mode the palette belongs to.
+        """
+        groups = palette if isinstance(palette, Mapping) else palette.to_dict()
+        keys = [(group, name) for group, colors in groups.items() for name in colors]
+        colors = [color for colors in groups.values() for color in colors.values()]
+        return cls(_readonly(to_rgba_array(colors)), keys, mode=mode)
+
+    def __getattr__(self, group: str) -> PackedGroup:
+        if group.startswith("_"):
+            raise AttributeError(group)
+        try:
+            return self._groups[group]
+        except KeyError:
+            raise AttributeError(
+                f"{type(self).__name__!r} has no color group {group!r}"
+            ) from None
+
+    def __getitem__(self, key: ColorKey) -> str:
+        return self.hex()[self.index[key]]
+
+    def __len__(self) -> int:
+        return len(self.rgba)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(mode={self.mode!r}, n={len(self)})"
+
+    @property
+    def groups(self) -> Mapping[str, PackedGroup]:
+        """Read-only mapping of group names to their views."""
+        return self._groups
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the packed color array in bytes."""
+        return self.rgba.nbytes
+
+    def hex(self) -> Tuple[str, ...]:
+        """
+        All colors as hex strings, in row order.
+
+        Returns
+        -------
+        Tuple[str, ...]
+            ``#rrggbb`` for opaque colors, ``#rrggbbaa`` otherwise, computed
+            once in a single vectorized pass.
+        """
+        if self._hex is None:
+            with_alpha = array_to_hex(self.rgba, alpha=True)
+            opaque = (self.rgba[:, 3] == 255).tolist()
+            self._hex = tuple(
+                color[:7] if is_opaque else color
+                for color, is_opaque in zip(with_alpha, opaque)
+            )
+        return self._hex
+
+    def to_dict(self) -> Dict[str, Dict[str, str]]:
+        """Mutable ``{group: {name: hex}}`` copy of the palette."""
+        return {group: dict(view) for group, view in self._groups.items()}
+
+    def rows(self, keys: Sequence[ColorKey]) -> np.ndarray:
+        """
+        Gather the RGBA rows of several colors at once.
+
+        Parameters
+        ----------
+        keys : Sequence[Tuple[str, str]]
+            ``(group, name)`` pairs.
+
+        Returns
+        -------
+        np.ndarray
+            ``(len(keys), 4)`` ``uint8`` array.
+        """
+        return self.rgba[[self.index[key] for key in keys]]
+
+    def _replace(self, rgba: np.ndarray) -> "PackedPalette":
+        return type(self)(_readonly(rgba), list(self.index), mode=self.mode)
+
+    def with_alpha(self, alpha: Any) -> "PackedPalette":
+        """
+        Return a copy with every color's opacity replaced.
+
+        Parameters
+        ----------
+        alpha : float or array-like
+            Opacity in ``0..1``, a scalar or one value per row.
+        """
+        rgba = self.rgba.copy()
+        rgba[:, 3] = np.round(np.clip(np.asarray(alpha, dtype=np.float64), 0, 1) * 255)
+        return self._replace(rgba)
+
+    def mix(self, color: str, amount: Any) -> "PackedPalette":
+        """
+        Return a copy with every color blended towards ``color`` in sRGB.
+
+        Parameters
+        ----------
+        color : str
+            Color to blend towards; its alpha channel is ignored.
+        amount : float or array-like
+            Blend factor in ``0..1``, a scalar or one value per row.
+        """
+        target = to_rgba_array([color])[0, :3].astype(np.float64)
+        amount = np.clip(np.asarray(amount, dtype=np.float64), 0, 1)
+        if amount.ndim:
+            amount = amount[:, None]
+        rgba = self.rgba.copy()
+        rgb = self.rgba[:, :3].astype(np.float64)
+        rgba[:, :3] = np.round(rgb + (target - rgb) * amount)
+        return self._replace(rgba)
+
+    def luminance(self) -> np.ndarray:
+        """
+        WCAG relative luminance of every color, ignoring alpha.
+
+        Returns
+        -------
+        np.ndarray
+            ``float64`` array of shape ``(n,)`` with values in ``0..1``.
+        """
+        return _srgb_to_linear(self.rgba[:, :3] / 255.0) @ _LUMINANCE
+
+
+__all__ = [
+    "PackedGroup",
+    "PackedPalette",
+]
@@ -0,0 +1,298 @@
+"""
+Binary palette file, memory-mapped and read without copying.
+
+The packed light and dark palettes and the continuous colormap lookup tables
+in their default sizes are compiled into ``static/siemens-ix-palettes.bin``.
+Processes open it with :mod:`mmap` and wrap the arrays with
+:func:`numpy.frombuffer`, so no palette is parsed or interpolated at startup
+and all workers on a host share the same (read-only) page cache pages.
+
+Layout (little endian)::
+
+    b"SIXPAL\\0\\0" | uint32 version | uint32 header size | JSON header | arrays
+
+The JSON header maps array names (``palette/<mode>``,
+``lut/<mode>/<space>/<n_colors>``) to their offset, shape and dtype, and
+holds the ``(group, name)`` keys of the palettes. Arrays start on 64-byte
+boundaries. The header also records a hash of the inputs the data is
+computed from (the palette colors and the colormap stops, spaces and sizes);
+if they changed, the file is ignored and everything is computed as before.
+Changes to the conversion or gradient code itself are not part of the hash;
+``--check`` compares the whole file with freshly computed data and catches
+them.
+
+Rebuild the file after changing the palettes or gradients with:
+    python -m panel_siemens_ix.palette_file
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from functools import cache
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from .colors import get_colors
+from .gradients import SPACES, three_part_gradient
+from .packed import PackedPalette
+
+PACKAGE_DIR = Path(__file__).parent
+PALETTE_FILE = PACKAGE_DIR / "static" / "siemens-ix-palettes.bin"
+
+MAGIC = b"SIXPAL\0\0"
+VERSION = 2
+ALIGNMENT = 64
+# Colormap sizes stored in the file: the defaults of get_continuous_cmap
+# and get_colormap
+LUT_SIZES = (128, 256)
+
+_PREFIX = struct.Struct("<8sII")
+
+
+@cache
+def input_hash() -> str:
+    """Hash of the palettes and colormap parameters the data is computed from."""
+    from .colors import _continuous_cmap_stops
+
+    inputs = {
+        "palettes": {mode: get_colors(mode).to_dict() for mode in ("light", "dark")},
+        "stops": [_continuous_cmap_stops(dark_theme) for dark_theme in (False, True)],
+        "spaces": list(SPACES),
+        "sizes": list(LUT_SIZES),
+    }
+    encoded = json.dumps(inputs, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def _lut_name(dark_theme: bool, n_colors: int, space: str) -> str:
+    return f"lut/{'dark' if dark_theme else 'light'}/{space}/{n_colors}"
+
+
+class PaletteFile:
+    """
+    Read-only view of a memory-mapped palette file.
+
+    Arrays returned by :meth:`array`, :meth:`palette` and :meth:`lut` are
+    read-only views into the mapping; they stay valid as long as they are
+    referenced, even if the file is replaced on disk.
+    """
+
+    __slots__ = ("path", "header", "_buffer")
+
+    def __init__(self, path: Path, header: Mapping, buffer: mmap.mmap):
+        self.path = path
+        self.header = header
+        self._buffer = buffer
+
+    @classmethod
+    def open(cls, path: Path = PALETTE_FILE, expected_hash: Optional[str] = None) -> "PaletteFile":
+        """
+        Map a palette file into memory.
+
+        Args:
+            path: File to open
+            expected_hash: If given, the input hash the file must have
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the file is invalid, of another version or stale
+        """
+        path = Path(path)
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, size = _PREFIX.unpack_from(buffer)
+        except struct.error:
+            raise ValueError(f"{path} is not a palette file") from None
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a palette file")
+        if version != VERSION:
+            raise ValueError(f"{path} has version {version}, expected {VERSION}")
+        header = json.loads(buffer[_PREFIX.size : _PREFIX.size + size])
+        if expected_hash is not None and header["input_hash"] != expected_hash:
+            raise ValueError(f"{path} is outdated")
+        return cls(path, header, buffer)
+
+    @property
+    def names(self) -> List[str]:
+        """Names of the stored arrays."""
+        return list(self.header["arrays"])
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the mapped file in bytes."""
+        return len(self._buffer)
+
+    def array(self, name: str) -> np.ndarray:
+        """Zero-copy, read-only view of a stored array."""
+        spec = self.header["arrays"][name]
+        shape = tuple(spec["shape"])
+        return np.frombuffer(
+            self._buffer,
+            dtype=np.dtype(spec["dtype"]),
+            count=int(np.prod(shape)),
+            offset=spec["offset"],
+        ).reshape(shape)
+
+    def palette(self, mode: str) -> PackedPalette:
+        """The packed palette of a mode, backed by the mapping."""
+        keys = [tuple(key) for key in self.header["keys"][mode]]
+        return PackedPalette(self.array(f"palette/{mode}"), keys, mode=mode)
+
+    def lut(self, dark_theme: bool, n_colors: int, space: str) -> Optional[np.ndarray]:
+        """The continuous colormap lookup table, or None if not stored."""
+        name = _lut_name(dark_theme, n_colors, space)
+        if name not in self.header["arrays"]:
+            return None
+        return self.array(name)
+
+
+@cache
+def load_palette_file() -> Optional[PaletteFile]:
+    """
+    Map the shipped palette file once per process.
+
+    Returns:
+        The palette file, or None if it is missing, invalid or outdated,
+        in which case callers compute the data themselves
+    """
+    try:
+        return PaletteFile.open(PALETTE_FILE, expected_hash=input_hash())
+    except (OSError, ValueError):
+        return None
+
+
+def _compile() -> Tuple[Dict[str, np.ndarray], Dict[str, List[Tuple[str, str]]]]:
+    """Compute the arrays to store, bypassing any existing palette file."""
+    from .colors import _continuous_cmap_stops
+
+    arrays: Dict[str, np.ndarray] = {}
+    keys: Dict[str, List[Tuple[str, str]]] = {}
+    for mode in ("light", "dark"):
+        packed = PackedPalette.from_palette(get_colors(mode), mode=mode)
+        arrays[f"palette/{mode}"] = packed.rgba
+        keys[mode] = list(packed.index)
+    for dark_theme in (False, True):
+        for space in SPACES:
+            for n_colors in LUT_SIZES:
+                arrays[_lut_name(dark_theme, n_colors, space)] = three_part_gradient(
+                    _continuous_cmap_stops(dark_theme), n_colors, space
+                )
+    return arrays, keys
+
+
+def _pad(size: int) -> int:
+    return -size % ALIGNMENT
+
+
+def encode_palette_file() -> bytes:
+    """Serialize the palettes and lookup tables into the binary format."""
+    arrays, keys = _compile()
+    specs = {}
+    offset = 0
+    for name, array in arrays.items():
+        specs[name] = {"offset": offset, "shape": list(array.shape), "dtype": array.dtype.str}
+        offset += array.nbytes + _pad(array.nbytes)
+
+    def encode_header(base: int) -> bytes:
+        header = {
+            "input_hash": input_hash(),
+            "arrays": {
+                name: {**spec, "offset": spec["offset"] + base} for name, spec in specs.items()
+            },
+            "keys": keys,
+        }
+        return json.dumps(header, separators=(",", ":")).encode("utf-8")
+
+    # Offsets are absolute, so the header size depends on where the data
+    # starts; grow the data start until the encoded header fits before it
+    base = ALIGNMENT
+    while _PREFIX.size + len(encode_header(base)) > base:
+        base += ALIGNMENT
+    header = encode_header(base)
+
+    parts = [_PREFIX.pack(MAGIC, VERSION, len(header)), header]
+    parts.append(b"\0" * (base - _PREFIX.size - len(header)))
+    for array in arrays.values():
+        data = np.ascontiguousarray(array).tobytes()
+        parts += [data, b"\0" * _pad(len(data))]
+    return b"".join(parts)
+
+
+def build_palette_file(path: Path = PALETTE_FILE) -> int:
+    """
+    Write the palette file.
+
+    The file is replaced atomically, so processes that still map the previous
+    version keep reading consistent data.
+
+    Args:
+        path: File to write, defaults to the package ``static/`` copy
+
+    Returns:
+        Size of the written file in bytes
+    """
+    path = Path(path)
+    data = encode_palette_file()
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+    load_palette_file.cache_clear()
+    return len(data)
+
+
+def check_palette_file(path: Path = PALETTE_FILE) -> List[str]:
+    """
+    Check that a palette file matches the current palettes and gradients.
+
+    Returns:
+        List of problems, empty if the file is up to date
+    """
+    try:
+        if Path(path).read_bytes() != encode_palette_file():
+            return [f"{Path(path).name} is outdated"]
+    except FileNotFoundError:
+        return [f"{Path(path).name} is missing"]
+    return []
+
+
+def main() -> int:
+    """Build the palette file, or with ``--check`` verify that it is up to date."""
+    parser = argparse.ArgumentParser(description="Build the Siemens iX binary palette file.")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Exit with status 1 if the shipped palette file is outdated",
+    )
+    args = parser.parse_args()
+
+    if args.check:
+        problems = check_palette_file()
+        for problem in problems:
+            print(problem, file=sys.stderr)
+        return 1 if problems else 0
+
+    size = build_palette_file()
+    print(f"Wrote {PALETTE_FILE} ({size} bytes)")
+    return 0
+
+
+__all__ = [
+    "PALETTE_FILE",
+    "PaletteFile",
+    "build_palette_file",
+    "check_palette_file",
+    "encode_palette_file",
+    "input_hash",
+    "load_palette_file",
+]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,340 @@
+"""
+Siemens iX defaults for Bokeh, HoloViews/hvPlot, Plotly and Altair.
+
+:func:`register_plotting` (called by ``configure(plotting=True)``) registers,
+once per process, light and dark variants of
+
+* Bokeh themes, applied by Panel to every Bokeh and HoloViews plot rendered
+  in the light or dark Material UI theme (inside a ``pmui.Page`` the
+  browser additionally derives plot styles from the page's theme),
+* Plotly templates ``siemens_ix_light``/``siemens_ix_dark``,
+* Altair themes ``siemens_ix_light``/``siemens_ix_dark``,
+* HoloViews default options: the categorical color cycle and the continuous
+  colormap of the default mode.
+
+Libraries that are not installed are skipped. All style dicts are computed
+once per mode and shared, so charts need no per-render styling; select the
+dark variant of a template with ``template=PLOTLY_TEMPLATES["dark"]`` or
+``alt.theme.enable(ALTAIR_THEMES["dark"])``.
+"""
+
+import importlib.util
+import threading
+from functools import cache
+from typing import Any, Dict, List, Optional
+
+from .colors import get_categorical_palette, get_colors, get_continuous_cmap
+from .conversion import to_hex, to_rgba
+from .frozen import FrozenDict, freeze, thaw
+
+MODES = ("light", "dark")
+PLOTLY_TEMPLATES = {mode: f"siemens_ix_{mode}" for mode in MODES}
+ALTAIR_THEMES = {mode: f"siemens_ix_{mode}" for mode in MODES}
+
+# Number of colors in the categorical cycle and the continuous colormap
+N_CATEGORICAL = 17
+N_CONTINUOUS = 256
+
+_REGISTERED: Dict[str, bool] = {}
+_DEFAULT_MODE: Optional[str] = None
+_REGISTER_LOCK = threading.Lock()
+
+
+def _css(color: str) -> str:
+    """Opaque colors as ``#rrggbb``, translucent ones as ``rgba()``."""
+    color = to_hex(color)
+    return color if len(color) == 7 else to_rgba(color)
+
+
+@cache
+def _style(mode: str) -> FrozenDict:
+    """Colors shared by all libraries for a mode."""
+    colors = get_colors(mode)
+    dark_theme = mode == "dark"
+    return freeze(
+        {
+            "background": _css(colors.background["default"]),
+            "plot_background": _css(colors.background["paper"]),
+            "surface": _css(colors.background["surface"]),
+            "text": _css(colors.text["primary"]),
+            "text_secondary": _css(colors.text["secondary"]),
+            "axis": _css(colors.border["std"]),
+            "grid": _css(colors.border["weak"]),
+            "palette": list(get_categorical_palette(dark_theme, N_CATEGORICAL)),
+            "cmap": list(get_continuous_cmap(dark_theme, N_CONTINUOUS)),
+        }
+    )
+
+
+@cache
+def bokeh_theme_json(mode: str = "light") -> FrozenDict:
+    """
+    Bokeh theme JSON for a mode, extending the Material UI Bokeh theme.
+
+    Args:
+        mode: Theme mode, either 'light' or 'dark'
+
+    Returns:
+        Immutable theme JSON; ``thaw`` it for ``bokeh.themes.Theme(json=...)``
+    """
+    style = _style(mode)
+    return freeze(
+        {
+            "attrs": {
+                "Plot": {
+                    "background_fill_color": style["plot_background"],
+                    "border_fill_color": style["background"],
+                    "outline_line_color": style["grid"],
+                },
+                "Axis": {
+                    "axis_label_standoff": 10,
+                    "axis_label_text_font_size": "1.25em",
+                    "axis_label_text_font_style": "normal",
+                    "axis_label_text_color": style["text"],
+                    "axis_line_color": style["axis"],
+                    "major_label_text_font_size": "1.025em",
+                    "major_label_text_color": style["text_secondary"],
+                    "major_tick_line_color": style["axis"],
+                    "minor_tick_line_color": style["axis"],
+                },
+                "Grid": {"grid_line_color": style["grid"]},
+                "Legend": {
+                    "spacing": 8,
+                    "glyph_width": 15,
+                    "label_standoff": 8,
+                    "label_text_font_size": "1.025em",
+                    "label_text_color": style["text"],
+                    "background_fill_color": style["plot_background"],
+                    "border_line_color": style["grid"],
+                },
+                "ColorBar": {
+                    "title_text_font_size": "1.025em",
+                    "title_text_font_style": "normal",
+                    "title_text_color": style["text"],
+                    "major_label_text_font_size": "1.025em",
+                    "major_label_text_color": style["text_secondary"],
+                    "background_fill_color": style["plot_background"],
+                },
+                "Title": {"text_font_size": "1.15em", "text_color": style["text"]},
+            }
+        }
+    )
+
+
+@cache
+def plotly_template(mode: str = "light") -> FrozenDict:
+    """
+    Plotly template for a mode.
+
+    Args:
+        mode: Theme mode, either 'light' or 'dark'
+
+    Returns:
+        Immutable ``{"layout": ...}`` template
+    """
+    style = _style(mode)
+    cmap = style["cmap"]
+    axis = {
+        "gridcolor": style["grid"],
+        "linecolor": style["axis"],
+        "tickcolor": style["axis"],
+        "zerolinecolor": style["axis"],
+    }
+    return freeze(
+        {
+            "layout": {
+                "paper_bgcolor": style["background"],
+                "plot_bgcolor": style["plot_background"],
+                "font": {"color": style["text"]},
+                "title": {"font": {"color": style["text"]}},
+                "colorway": style["palette"],
+                "colorscale": {
+                    "sequential": [[i / (len(cmap) - 1), c] for i, c in enumerate(cmap)]
+                },
+                "xaxis": axis,
+                "yaxis": axis,
+                "legend": {"bgcolor": "rgba(0,0,0,0)"},
+                "hoverlabel": {
+                    "bgcolor": style["surface"],
+                    "font": {"color": style["text"]},
+                },
+            }
+        }
+    )
+
+
+@cache
+def altair_theme(mode: str = "light") -> FrozenDict:
+    """
+    Altair (Vega-Lite) theme config for a mode.
+
+    Args:
+        mode: Theme mode, either 'light' or 'dark'
+
+    Returns:
+        Immutable ``{"config": ...}`` theme
+    """
+    style = _style(mode)
+    axis = {
+        "domainColor": style["axis"],
+        "tickColor": style["axis"],
+        "gridColor": style["grid"],
+        "labelColor": style["text_secondary"],
+        "titleColor": style["text"],
+    }
+    return freeze(
+        {
+            "config": {
+                "background": style["background"],
+                "view": {"fill": style["plot_background"], "stroke": "transparent"},
+                "axis": axis,
+                "legend": {"labelColor": style["text"], "titleColor": style["text"]},
+                "title": {"color": style["text"]},
+                "range": {
+                    "category": style["palette"],
+                    "ramp": style["cmap"],
+                    "heatmap": style["cmap"],
+                },
+            }
+        }
+    )
+
+
+def holoviews_options(mode: str = "light") -> Dict[str, Dict[str, Any]]:
+    """
+    HoloViews default options (Bokeh backend) for a mode.
+
+    Args:
+        mode: Theme mode, either 'light' or 'dark'
+
+    Returns:
+        Options per element type; the categorical colors are set as
+        HoloViews' default color cycle instead
+    """
+    cmap = _style(mode)["cmap"]
+    return {
+        element: {"cmap": cmap}
+        for element in ("HeatMap", "Image", "QuadMesh", "Raster", "HexTiles")
+    }
+
+
+def _installed(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def register_bokeh() -> bool:
+    """Use the Siemens iX Bokeh themes for the light and dark Material UI themes."""
+    from bokeh.themes import Theme
+    from panel_material_ui.theme import MuiDarkTheme, MuiDefaultTheme
+
+    from panel.viewable import Viewable
+
+    for theme, mode in ((MuiDefaultTheme, "light"), (MuiDarkTheme, "dark")):
+        theme.param.bokeh_theme.default = Theme(json=thaw(bokeh_theme_json(mode)))
+    # Panel shares one Design (and theme) instance per design and mode;
+    # drop those created before so they pick up the new themes
+    clear = getattr(Viewable._instantiate_design, "cache_clear", None)
+    if clear is not None:
+        clear()
+    return True
+
+
+def register_plotly(default_mode: str = "light") -> bool:
+    """Register the Plotly templates and make ``default_mode`` the default."""
+    if not _installed("plotly"):
+        return False
+    import plotly.io as pio
+
+    for mode, name in PLOTLY_TEMPLATES.items():
+        pio.templates[name] = thaw(plotly_template(mode))
+    pio.templates.default = PLOTLY_TEMPLATES[default_mode]
+    return True
+
+
+def register_altair(default_mode: str = "light") -> bool:
+    """Register the Altair themes and enable ``default_mode``."""
+    if not _installed("altair"):
+        return False
+    import altair as alt
+
+    for mode, name in ALTAIR_THEMES.items():
+        config = thaw(altair_theme(mode))
+        if hasattr(alt, "theme"):  # Altair >= 5.5
+            alt.theme.register(name, enable=mode == default_mode)(lambda config=config: config)
+        else:
+            alt.themes.register(name, lambda config=config: config)
+    if not hasattr(alt, "theme"):
+        alt.themes.enable(ALTAIR_THEMES[default_mode])
+    return True
+
+
+def register_holoviews(default_mode: str = "light") -> bool:
+    """Set HoloViews' default color cycle and colormaps to ``default_mode``."""
+    if not _installed("holoviews"):
+        return False
+    import holoviews as hv
+    import holoviews.plotting.bokeh  # noqa: F401, registers the Bokeh options
+
+    hv.Cycle.default_cycles["default_colors"] = list(_style(default_mode)["palette"])
+    options = [
+        getattr(hv.opts, element)(**kwargs)
+        for element, kwargs in holoviews_options(default_mode).items()
+        if hasattr(hv.opts, element)
+    ]
+    hv.opts.defaults(*options, backend="bokeh")
+    return True
+
+
+def register_plotting(default_mode: str = "light") -> Dict[str, bool]:
+    """
+    Register the Siemens iX defaults of all installed plotting libraries.
+
+    Registration happens once per process; later calls return the result of
+    the first one, only switching the default mode if it differs.
+
+    Args:
+        default_mode: Mode of the Plotly template, Altair theme and HoloViews
+            defaults used when a chart does not select one; Bokeh themes
+            follow the page's light or dark theme
+
+    Returns:
+        Whether each library (``bokeh``, ``holoviews``, ``plotly``,
+        ``altair``) was registered
+    """
+    global _DEFAULT_MODE
+    if default_mode not in MODES:
+        raise ValueError("Mode must be either 'light' or 'dark'")
+    if _REGISTERED and default_mode == _DEFAULT_MODE:
+        return dict(_REGISTERED)
+    with _REGISTER_LOCK:
+        if not _REGISTERED:
+            _REGISTERED.update(
+                bokeh=register_bokeh(),
+                holoviews=register_holoviews(default_mode),
+                plotly=register_plotly(default_mode),
+                altair=register_altair(default_mode),
+            )
+        elif default_mode != _DEFAULT_MODE:
+            # The templates and themes of both modes exist; switch the default
+            register_holoviews(default_mode)
+            register_plotly(default_mode)
+            register_altair(default_mode)
+        _DEFAULT_MODE = default_mode
+    return dict(_REGISTERED)
+
+
+def registered() -> List[str]:
+    """Libraries with registered Siemens iX defaults."""
+    return [library for library, done in _REGISTERED.items() if done]
+
+
+__all__ = [
+    "ALTAIR_THEMES",
+    "PLOTLY_TEMPLATES",
+    "altair_theme",
+    "bokeh_theme_json",
+    "holoviews_options",
+    "plotly_template",
+    "register_plotting",
+    "registered",
+]
@@ -6,27 +6,155 @@ supporting both light and dark modes with comprehensive color definitions includ
 hover and active states.
 """
 
-from typing import Dict, Any
-from .colors import SiemensIXDarkColors, SiemensIXLightColors, _hex_to_rgba
+from functools import lru_cache
+from typing import Dict, Any, Mapping, Optional
+from .colors import SiemensIXDarkColors, SiemensIXLightColors, _hex_to_rgba, get_colors
+from .frozen import FrozenDict, freeze
+from .instrumentation import instrumented
 
 
-def create_theme(mode: str = "light") -> Dict[str, Any]:
+@instrumented("create_theme")
+def create_theme(
+    mode: str = "light", overrides: Optional[Mapping[str, Any]] = None
+) -> FrozenDict:
     """
     Create a Material-UI compatible theme using Siemens iX design system colors.
 
+    Themes are memoized per ``(mode, overrides)`` and returned as immutable
+    ``FrozenDict`` trees, so repeat calls are a cache hit. A theme with
+    overrides shares every unchanged subtree with the base theme and only
+    allocates the dicts along the overridden paths.
+
     Args:
         mode: Theme mode, either 'light' or 'dark'
+        overrides: Optional nested mapping merged over the base theme with
+            ``merge_theme``, e.g. ``{"palette": {"primary": {"main": "#ff0000"}}}``.
+            A value of ``None`` removes the key.
 
     Returns:
-        Dictionary containing Material-UI theme configuration
+        Immutable dictionary containing Material-UI theme configuration.
+        Use ``panel_siemens_ix.frozen.thaw`` for a mutable copy.
 
     Raises:
         ValueError: If mode is not 'light' or 'dark'
     """
-    if mode not in ["light", "dark"]:
-        raise ValueError("Mode must be either 'light' or 'dark'")
+    if not overrides:
+        return _base_theme(mode)
+    return _derived_theme(mode, freeze(overrides))
+
+
+@lru_cache(maxsize=None)
+def _base_theme(mode: str) -> FrozenDict:
+    """Build and memoize the frozen base theme for a mode."""
+    return freeze(_build_theme(mode))
+
+
+@lru_cache(maxsize=256)
+def _derived_theme(mode: str, overrides: FrozenDict) -> FrozenDict:
+    """Build and memoize a theme with (frozen) overrides applied."""
+    return merge_theme(_base_theme(mode), overrides)
+
+
+_MISSING = object()
+
+
+def merge_theme(base: Mapping[str, Any], overrides: Mapping[str, Any]) -> FrozenDict:
+    """
+    Deep-merge overrides into a theme in a single pass.
+
+    Only the dicts along paths whose values actually change are copied;
+    every other subtree is shared with ``base``. If nothing changes,
+    ``base`` itself is returned.
+
+    Args:
+        base: Theme to merge into, e.g. the result of ``create_theme``
+        overrides: Nested mapping of values to set. A value of ``None``
+            removes the key, so the output of ``theme_diff`` can be applied
+            directly.
+
+    Returns:
+        Immutable merged theme
+
+    Examples:
+        >>> kiosk = merge_theme(create_theme("light"), {"typography": {"fontSize": 12}})
+    """
+    return _merge(freeze(base), overrides)
+
 
-    colors = SiemensIXDarkColors() if mode == "dark" else SiemensIXLightColors()
+def _merge(base: FrozenDict, overrides: Mapping[str, Any]) -> FrozenDict:
+    merged = None
+    for key, value in overrides.items():
+        current = base.get(key, _MISSING)
+        if value is None:
+            if current is _MISSING:
+                continue
+            new = _MISSING
+        elif isinstance(value, Mapping) and isinstance(current, FrozenDict):
+            new = _merge(current, value)
+        else:
+            new = freeze(value)
+
+        if new is current or (
+            not isinstance(new, Mapping) and type(new) is type(current) and new == current
+        ):
+            continue
+        if merged is None:
+            merged = dict(base)
+        if new is _MISSING:
+            del merged[key]
+        else:
+            merged[key] = new
+    return base if merged is None else FrozenDict(merged)
+
+
+def theme_diff(a: Mapping[str, Any], b: Mapping[str, Any]) -> FrozenDict:
+    """
+    Compute the minimal patch that turns theme ``a`` into theme ``b``.
+
+    Subtrees shared between both themes are skipped by identity, so diffing
+    a theme against a variant derived from it only visits the changed paths.
+    Results are memoized, which makes e.g. the light/dark toggle patch free
+    after the first call.
+
+    Args:
+        a: Source theme
+        b: Target theme
+
+    Returns:
+        Immutable nested mapping containing only the changed keys. Keys that
+        exist in ``a`` but not in ``b`` map to ``None``. Applying it with
+        ``merge_theme(a, patch)`` yields a theme equal to ``b``.
+
+    Examples:
+        >>> patch = theme_diff(create_theme("light"), create_theme("dark"))
+        >>> patch["palette"]["mode"]
+        'dark'
+    """
+    return _theme_diff(freeze(a), freeze(b))
+
+
+@lru_cache(maxsize=128)
+def _theme_diff(a: FrozenDict, b: FrozenDict) -> FrozenDict:
+    diff = {}
+    for key, new in b.items():
+        old = a.get(key, _MISSING)
+        if old is new:
+            continue
+        if isinstance(old, FrozenDict) and isinstance(new, FrozenDict):
+            nested = _theme_diff(old, new)
+            if nested:
+                diff[key] = nested
+        elif type(old) is not type(new) or old != new:
+            diff[key] = new
+    for key in a:
+        if key not in b:
+            diff[key] = None
+    return FrozenDict(diff)
+
+
+def _build_theme(mode: str) -> Dict[str, Any]:
+    """Build the plain theme dictionary for a mode."""
+    colors = get_colors(mode)
     return {
         "palette": {
             "mode": mode,
@@ -236,13 +364,26 @@ def create_theme(mode: str = "light") -> Dict[str, Any]:
     }
 
 
-# Convenience aliases
-siemens_ix_light_theme = create_theme("light")
-siemens_ix_dark_theme = create_theme("dark")
+# Convenience aliases, built lazily on first access (PEP 562) so importing
+# this module stays cheap
+_THEME_ALIASES = {
+    "siemens_ix_light_theme": "light",
+    "siemens_ix_dark_theme": "dark",
+}
+
+
+def __getattr__(name: str) -> FrozenDict:
+    if name in _THEME_ALIASES:
+        theme = create_theme(_THEME_ALIASES[name])
+        globals()[name] = theme
+        return theme
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 __all__ = [
     "create_theme",
+    "merge_theme",
+    "theme_diff",
     "siemens_ix_light_theme",
     "siemens_ix_dark_theme",
 ]
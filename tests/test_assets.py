@@ -0,0 +1,83 @@
+"""Brand assets: size budgets, content-hashed names and valid minified SVGs."""
+
+import hashlib
+import xml.etree.ElementTree as ET
+from urllib.parse import unquote
+
+import pytest
+
+from panel_siemens_ix.assets import (
+    ASSET_SOURCES,
+    SIZE_BUDGETS,
+    STATIC_DIR,
+    asset_path,
+    asset_url,
+    check_assets,
+    load_manifest,
+    minify_svg,
+    svg_data_uri,
+)
+
+SVG_ASSETS = [name for name, (_, _, extension) in ASSET_SOURCES.items() if extension == "svg"]
+SVG_NAMESPACE = "{http://www.w3.org/2000/svg}"
+SHAPES = ("path", "polygon", "rect", "circle", "ellipse")
+
+
+def _shapes(root):
+    # Visible shapes, without the invisible bounding box the minifier drops
+    return [
+        element for element in root.iter()
+        if element.tag.removeprefix(SVG_NAMESPACE) in SHAPES
+        and element.get("style", "").rstrip(";") != "fill:none"
+    ]
+
+
+def test_assets_are_current_and_within_budget():
+    assert check_assets() == []
+
+
+@pytest.mark.parametrize("name", list(ASSET_SOURCES))
+def test_asset_size_within_budget(name):
+    size = asset_path(name).stat().st_size
+    assert size == load_manifest()[name]["bytes"]
+    assert size <= SIZE_BUDGETS[name]
+
+
+@pytest.mark.parametrize("name", list(ASSET_SOURCES))
+def test_asset_name_carries_content_hash(name):
+    path = asset_path(name)
+    content_hash = path.name.rsplit(".", 2)[1]
+    assert content_hash == hashlib.sha256(path.read_bytes()).hexdigest()[:12]
+
+
+@pytest.mark.parametrize("name", ["favicon", "apple-touch-icon"])
+def test_asset_url_carries_content_hash(name):
+    url = asset_url(name)
+    path = asset_path(name)
+    assert path.name in url
+    assert url.endswith("?v=" + hashlib.sha256(path.read_bytes()).hexdigest()[:12])
+
+
+@pytest.mark.parametrize("name", SVG_ASSETS)
+def test_minified_svg_parses(name):
+    source = ET.parse(STATIC_DIR / ASSET_SOURCES[name][0]).getroot()
+    minified = ET.fromstring(asset_path(name).read_text(encoding="utf-8"))
+    assert minified.tag == SVG_NAMESPACE + "svg"
+    assert minified.get("viewBox") == source.get("viewBox")
+    assert len(_shapes(minified)) == len(_shapes(source))
+
+
+@pytest.mark.parametrize("name", SVG_ASSETS)
+def test_shipped_svg_is_minified_source(name):
+    source = (STATIC_DIR / ASSET_SOURCES[name][0]).read_text(encoding="utf-8")
+    assert asset_path(name).read_text(encoding="utf-8") == minify_svg(source)
+
+
+@pytest.mark.parametrize("name", SVG_ASSETS)
+def test_svg_data_uri_round_trips(name):
+    prefix = "data:image/svg+xml,"
+    uri = svg_data_uri(name)
+    assert uri.startswith(prefix)
+    svg = unquote(uri[len(prefix):])
+    assert svg == asset_path(name).read_text(encoding="utf-8").replace('"', "'")
+    assert ET.fromstring(svg).tag == SVG_NAMESPACE + "svg"
@@ -0,0 +1,40 @@
+"""Categorical palettes: unchanged up to 17 colors, well separated beyond."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from panel_siemens_ix.categorical import min_pairwise_distance
+from panel_siemens_ix.colors import get_categorical_palette
+
+# Palettes of 1 to 17 colors as returned before the maximin extension
+BASELINE = json.loads(
+    (Path(__file__).parent / "data" / "categorical_palettes.json").read_text(encoding="utf-8")
+)
+
+# Minimum pairwise OKLab distance, also the default of
+# benchmarks/bench_categorical_palette.py
+MIN_DISTANCE = 0.05
+
+MODES = [(False, False), (False, True), (True, False), (True, True)]
+
+
+def _key(dark_theme, opacity):
+    return ("dark" if dark_theme else "light") + ("-40" if opacity else "")
+
+
+@pytest.mark.parametrize("dark_theme, opacity", MODES)
+@pytest.mark.parametrize("n_colors", range(1, 18))
+def test_small_palettes_unchanged(dark_theme, opacity, n_colors):
+    palette = get_categorical_palette(dark_theme, n_colors, opacity=opacity)
+    assert list(palette) == BASELINE[_key(dark_theme, opacity)][str(n_colors)]
+
+
+@pytest.mark.parametrize("dark_theme, opacity", MODES)
+@pytest.mark.parametrize("n_colors", range(18, 65))
+def test_large_palettes_distinct(dark_theme, opacity, n_colors):
+    palette = get_categorical_palette(dark_theme, n_colors, opacity=opacity)
+    assert len(palette) == n_colors
+    assert list(palette[:17]) == BASELINE[_key(dark_theme, opacity)]["17"]
+    assert min_pairwise_distance(palette) > MIN_DISTANCE
@@ -0,0 +1,34 @@
+"""SiemensIXColormap maps values, including non-finite ones, to table rows."""
+
+import warnings
+
+import numpy as np
+import pytest
+
+from panel_siemens_ix import get_colormap
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+@pytest.mark.parametrize(
+    "values",
+    [
+        [0.0, 1.0, np.inf, -np.inf, np.nan],
+        [0.0, 0.0, np.inf, -np.inf, np.nan],  # constant finite range
+        [np.inf, -np.inf, np.nan],  # no finite values
+    ],
+)
+def test_indices_of_non_finite_values(values, dtype):
+    cmap = get_colormap()
+    n = cmap.N
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        idx = cmap.indices(np.array(values, dtype=dtype))
+    # inf is over, -inf under and NaN bad, whatever the finite range
+    assert idx[-3:].tolist() == [n + 1, n, n + 2]
+    assert (idx[:-3] < n).all()
+
+
+def test_indices_of_range():
+    cmap = get_colormap()
+    idx = cmap.indices(np.array([-1.0, 0.0, 0.5, 1.0, 2.0]), vmin=0.0, vmax=1.0)
+    assert idx.tolist() == [cmap.N, 0, cmap.N // 2, cmap.N - 1, cmap.N + 1]
@@ -0,0 +1,33 @@
+"""configure() sets the pmui.Page defaults of the context applied last."""
+
+import pytest
+
+pmui = pytest.importorskip("panel_material_ui")
+
+import panel_siemens_ix  # noqa: E402
+from panel_siemens_ix import configure, get_context  # noqa: E402
+
+
+@pytest.fixture
+def page_defaults(monkeypatch):
+    parameters = pmui.Page.param
+    for name in ("stylesheets", "sx", "logo", "theme_config"):
+        monkeypatch.setattr(parameters[name], "default", parameters[name].default)
+    monkeypatch.setattr(panel_siemens_ix, "_APPLIED_CONTEXT", None)
+    monkeypatch.setattr(panel_siemens_ix, "_BASE_STYLESHEETS", None)
+    return list(parameters.stylesheets.default or [])
+
+
+def test_stylesheets_added_once(page_defaults):
+    configure()
+    configure(with_logo=False)
+    context = configure(theme_bundle=True)
+    assert pmui.Page.param.stylesheets.default == page_defaults + list(context.stylesheets)
+
+
+def test_reconfigure_restores_defaults(page_defaults):
+    configure(theme_bundle=True)
+    assert pmui.Page.param.sx.default is None
+    configure()
+    assert pmui.Page.param.sx.default == get_context().sx
+    assert pmui.Page.param.logo.default == get_context().logo
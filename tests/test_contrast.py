@@ -0,0 +1,117 @@
+"""WCAG contrast checks and automatic fixes."""
+
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from panel_siemens_ix import create_theme
+from panel_siemens_ix.contrast import (
+    WCAG_LEVELS,
+    best_contrast,
+    check_palette,
+    check_theme,
+    contrast_matrix,
+    fix_theme,
+    nudge_colors,
+)
+from panel_siemens_ix.gradients import srgb_to_oklab, to_rgba_array
+
+# Light text and a light primary shade with white text, both failing AA
+FAILING_OVERRIDES = {
+    "palette": {
+        "text": {"primary": "#bbbbbb"},
+        "primary": {"main": "#7fd3ff", "contrastText": "#ffffff"},
+    }
+}
+
+
+def _ratio(foreground, background):
+    return float(contrast_matrix([foreground], [background])[0, 0])
+
+
+def _oklab(color):
+    return srgb_to_oklab(to_rgba_array([color])[:, :3] / 255.0)[0]
+
+
+def test_contrast_matrix():
+    ratios = contrast_matrix(["#000000", "#ffffff", "#00000080"], ["#ffffff", "#000000"])
+    np.testing.assert_allclose(ratios[:2], [[21.0, 1.0], [1.0, 21.0]])
+    # Translucent black is composited over each background first
+    assert 1.0 < ratios[2, 0] < 21.0 and ratios[2, 1] == pytest.approx(1.0)
+    assert best_contrast(["#000028", "#ffffff"]) == ["#ffffff", "#000000"]
+
+
+@pytest.mark.parametrize("mode", ["light", "dark"])
+def test_shipped_palettes_and_themes_pass(mode):
+    assert check_palette(mode).passed
+    assert check_theme(create_theme(mode)).passed
+    assert fix_theme(create_theme(mode)) is create_theme(mode)
+
+
+def test_failing_override_is_reported_and_fixed():
+    theme = create_theme("light", FAILING_OVERRIDES)
+    report = check_theme(theme)
+    assert not report.passed
+    failing = {(fg, bg) for fg, bg, _ in report.failures}
+    assert ("palette.text.primary", "palette.background.default") in failing
+    assert ("palette.primary.contrastText", "palette.primary.main") in failing
+
+    fixed = fix_theme(theme)
+    assert check_theme(fixed).passed
+    # Page backgrounds are never changed, only the failing colors
+    assert fixed["palette"]["background"] == theme["palette"]["background"]
+    assert fixed["palette"]["text"]["primary"] != "#bbbbbb"
+    assert fixed["palette"]["secondary"] is theme["palette"]["secondary"]
+
+
+@pytest.mark.parametrize(
+    "color, background, level",
+    [
+        ("#bbbbbb", "#ffffff", "AA"),
+        ("#bbbbbb", "#ffffff", "AAA"),
+        ("#444466", "#000028", "AA"),
+        ("#444466", "#000028", "AAA"),
+        ("#00cccc", "#ffffff", "AA"),
+        ("#777777", "#888888", "AA"),
+    ],
+)
+def test_nudge_colors_stops_at_threshold(color, background, level):
+    threshold = WCAG_LEVELS[level]
+    (nudged,) = nudge_colors([color], [[background]], level)
+    ratio = _ratio(nudged, background)
+    # Passes, but only just: 8-bit rounding is the only overshoot
+    assert threshold <= ratio < threshold * 1.03
+    # Moved in OKLab straight towards black or white, so the hue is kept
+    before, after = _oklab(color), _oklab(nudged)
+    if np.hypot(*before[1:]) > 0.02:
+        hue = np.arctan2(before[2], before[1])
+        assert np.arctan2(after[2], after[1]) == pytest.approx(hue, abs=0.05)
+
+
+def test_nudge_colors_unreachable_level():
+    # Black reaches about 5.9 on #888888, the best any color can do
+    assert nudge_colors(["#777777"], [["#888888"]], "AAA") == ["#000000"]
+
+
+def test_nudge_colors_keeps_passing_colors_and_alpha():
+    nudged = nudge_colors(["#000000", "#ffffff99"], [["#ffffff"], ["#ffffff"]])
+    assert nudged[0] == "#000000"
+    assert nudged[1].endswith("99") and _ratio(nudged[1], "#ffffff") >= 4.5
+
+
+def _run_cli(*args):
+    return subprocess.run(
+        [sys.executable, "-m", "panel_siemens_ix.contrast", *args],
+        capture_output=True,
+        text=True,
+    )
+
+
+def test_cli_exit_codes():
+    assert _run_cli().returncode == 0
+    # No palette reaches the maximum ratio on every pair
+    result = _run_cli("--level", "21")
+    assert result.returncode == 1
+    assert "fail" in result.stdout.lower()
@@ -0,0 +1,149 @@
+"""Parsing and formatting of hex and rgb()/rgba() colors."""
+
+import pytest
+
+from panel_siemens_ix.conversion import (
+    clear_cache,
+    parse_color,
+    parse_colors,
+    to_hex,
+    to_hex_list,
+    to_rgba,
+    to_rgba_list,
+)
+
+COLORS = [
+    "#00cccc",
+    "#00cccc73",
+    "#fff",
+    "#0008",
+    "rgb(0, 204, 204)",
+    "rgba(255,255,255,0.45)",
+    "#1491EB",
+]
+
+
+@pytest.mark.parametrize(
+    "color, expected",
+    [
+        # hex3, hex4, hex6 and hex8, with and without "#", in any case
+        ("#fff", (255, 255, 255, 1.0)),
+        ("#0c8", (0, 204, 136, 1.0)),
+        ("#0c88", (0, 204, 136, 0x88 / 255)),
+        ("#00cccc", (0, 204, 204, 1.0)),
+        ("00cccc", (0, 204, 204, 1.0)),
+        ("#1491EB", (20, 145, 235, 1.0)),
+        ("#00cccc73", (0, 204, 204, 0x73 / 255)),
+        ("#00000000", (0, 0, 0, 0.0)),
+        ("  #00cccc  ", (0, 204, 204, 1.0)),
+        # rgb() and rgba()
+        ("rgb(0, 204, 204)", (0, 204, 204, 1.0)),
+        ("rgb(0,204,204)", (0, 204, 204, 1.0)),
+        ("rgba(255,255,255,0.45)", (255, 255, 255, 0.45)),
+        ("rgba( 1 , 2 , 3 , 1 )", (1, 2, 3, 1.0)),
+        ("rgba(0, 0, 0, 0)", (0, 0, 0, 0.0)),
+    ],
+)
+def test_parse_color(color, expected):
+    r, g, b, alpha = parse_color(color)
+    assert (r, g, b) == expected[:3]
+    assert alpha == pytest.approx(expected[3])
+    assert all(isinstance(v, int) for v in (r, g, b))
+
+
+@pytest.mark.parametrize(
+    "color",
+    [
+        "",
+        "red",
+        "#",
+        "#ff",
+        "#fffff",
+        "#fffffff",
+        "#fffffffff",
+        "#gggggg",
+        "rgb(256, 0, 0)",
+        "rgba(0, 0, 0, 1.5)",
+        "rgb(0, 0)",
+        "rgb(-1, 0, 0)",
+        "hsl(0, 100%, 50%)",
+    ],
+)
+def test_parse_color_invalid(color):
+    with pytest.raises(ValueError):
+        parse_color(color)
+
+
+@pytest.mark.parametrize(
+    "color, alpha, expected",
+    [
+        ("#00cccc", None, "rgb(0, 204, 204)"),
+        ("#00cccc73", None, "rgba(0, 204, 204, 0.451)"),
+        ("#0000284d", None, "rgba(0, 0, 40, 0.302)"),
+        ("rgba(255,255,255,0.45)", None, "rgba(255, 255, 255, 0.45)"),
+        ("#00000000", None, "rgba(0, 0, 0, 0)"),
+        # An alpha override always gives rgba(), even when opaque
+        ("#00cccc", 1.0, "rgba(0, 204, 204, 1)"),
+        ("#00cccc", 0.5, "rgba(0, 204, 204, 0.5)"),
+        ("#00cccc73", 0.25, "rgba(0, 204, 204, 0.25)"),
+        ("#00cccc", 1 / 3, "rgba(0, 204, 204, 0.333)"),
+    ],
+)
+def test_to_rgba(color, alpha, expected):
+    assert to_rgba(color, alpha) == expected
+
+
+@pytest.mark.parametrize(
+    "color, alpha, expected",
+    [
+        ("#00CCCC", None, "#00cccc"),
+        ("#0c8", None, "#00cc88"),
+        ("#0c88", None, "#00cc8888"),
+        ("#00cccc73", None, "#00cccc73"),
+        ("#00ccccff", None, "#00cccc"),
+        ("rgb(0, 204, 204)", None, "#00cccc"),
+        ("rgba(255,255,255,0.45)", None, "#ffffff73"),
+        ("#00cccc", 0.5, "#00cccc80"),
+        ("#00cccc73", 1.0, "#00cccc"),
+        ("#00cccc", 0.0, "#00cccc00"),
+    ],
+)
+def test_to_hex(color, alpha, expected):
+    assert to_hex(color, alpha) == expected
+
+
+@pytest.mark.parametrize("color", COLORS)
+def test_round_trip(color):
+    r, g, b, alpha = parse_color(color)
+    assert parse_color(to_rgba(color))[:3] == (r, g, b)
+    assert parse_color(to_rgba(color))[3] == pytest.approx(alpha, abs=5e-4)
+    assert parse_color(to_hex(color))[:3] == (r, g, b)
+    assert parse_color(to_hex(color))[3] == pytest.approx(alpha, abs=0.5 / 255)
+
+
+@pytest.mark.parametrize("alpha", [None, 0.0, 0.45, 1.0])
+def test_list_helpers_match_scalar(alpha):
+    assert to_rgba_list(COLORS, alpha) == [to_rgba(c, alpha) for c in COLORS]
+    assert to_hex_list(COLORS, alpha) == [to_hex(c, alpha) for c in COLORS]
+    assert to_hex_list(iter(COLORS), alpha) == to_hex_list(COLORS, alpha)
+
+
+def test_parse_colors_matches_scalar():
+    assert parse_colors(COLORS) == [parse_color(c) for c in COLORS]
+    assert parse_colors(c for c in COLORS) == parse_colors(COLORS)
+    assert parse_colors([]) == [] and to_rgba_list([]) == [] and to_hex_list([]) == []
+
+
+def test_list_helpers_raise_on_invalid():
+    with pytest.raises(ValueError):
+        to_hex_list(["#00cccc", "not a color"])
+
+
+def test_clear_cache():
+    parse_color("#00cccc")
+    to_rgba("#00cccc")
+    to_hex("#00cccc")
+    clear_cache()
+    for func in (parse_color, to_rgba, to_hex):
+        assert func.cache_info().currsize == 0
+    assert to_hex("#00CCCC") == "#00cccc"
@@ -0,0 +1,33 @@
+"""Importing the package must not load its heavy dependencies."""
+
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_DEPENDENCIES = ("panel", "panel_material_ui", "numpy")
+
+
+@pytest.mark.parametrize("module", ["panel_siemens_ix", "panel_siemens_ix.colors"])
+def test_import_is_lightweight(module):
+    # A fresh interpreter, as modules loaded by other tests would hide imports
+    code = (
+        f"import sys, {module}\n"
+        f"print(','.join(m for m in {HEAVY_DEPENDENCIES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == ""
+
+
+def test_lazy_attributes_load_on_access():
+    code = (
+        "import sys, panel_siemens_ix\n"
+        "panel_siemens_ix.SiemensIXColormap\n"
+        "print('numpy' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "True"
@@ -0,0 +1,247 @@
+"""Call counters, timing histograms and the Prometheus export."""
+
+import asyncio
+import gc
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from panel_siemens_ix import instrumentation
+from panel_siemens_ix.instrumentation import BUCKETS, ENV_VAR, Metrics, instrumented, metrics_route
+
+ENABLED_SCRIPT = """
+import json
+import panel as pn
+import panel_siemens_ix as ix
+from panel_siemens_ix.instrumentation import ENABLED, METRICS
+
+for mode in ("light", "dark", "light"):
+    ix.get_colors(mode)
+ix.create_theme("dark")
+ix.create_theme("light", {"palette": {"primary": {"main": "#ff0000"}}})
+print(json.dumps({
+    "enabled": ENABLED,
+    "published": pn.state.cache.get("siemens_ix_metrics") is METRICS,
+    "calls": METRICS.calls(),
+    "timings": METRICS.timings(),
+    "prometheus": METRICS.prometheus(),
+}))
+"""
+
+
+class _Document:
+    """Stand-in for a Bokeh document of a Panel session."""
+
+    def __init__(self, session_id):
+        self.session_context = type("SessionContext", (), {"id": session_id})()
+
+
+def _samples(text):
+    """Map ``name{labels}`` to the value of every sample line of a Prometheus export."""
+    samples = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            key, value = line.rsplit(" ", 1)
+            samples[key] = float(value)
+    return samples
+
+
+@pytest.fixture
+def metrics(monkeypatch):
+    """A fresh registry outside of any session."""
+    monkeypatch.setattr(instrumentation, "_current_document", lambda: None)
+    return Metrics()
+
+
+@pytest.fixture(scope="module")
+def enabled_run():
+    env = dict(os.environ, **{ENV_VAR: "1"})
+    result = subprocess.run(
+        [sys.executable, "-c", ENABLED_SCRIPT], capture_output=True, text=True, env=env, check=True
+    )
+    return json.loads(result.stdout)
+
+
+def test_disabled_returns_function_unchanged(monkeypatch):
+    monkeypatch.setattr(instrumentation, "ENABLED", False)
+
+    def func():
+        return 1
+
+    assert instrumented("func")(func) is func
+
+
+def test_enabled_wraps_and_records(monkeypatch, metrics):
+    monkeypatch.setattr(instrumentation, "ENABLED", True)
+    monkeypatch.setattr(instrumentation, "METRICS", metrics)
+
+    @instrumented("double")
+    def double(x):
+        """Double x."""
+        return 2 * x
+
+    @instrumented("fail")
+    def fail():
+        raise ValueError("boom")
+
+    assert double.__name__ == "double" and double.__doc__ == "Double x."
+    assert [double(i) for i in range(3)] == [0, 2, 4]
+    with pytest.raises(ValueError):
+        fail()
+    assert metrics.calls() == {"double": 3, "fail": 1}
+
+
+def test_enabled_by_environment(enabled_run):
+    assert enabled_run["enabled"]
+    assert enabled_run["published"]
+    # create_theme builds on get_colors
+    assert enabled_run["calls"] == {"get_colors": 5, "create_theme": 2}
+    for name, count in enabled_run["calls"].items():
+        timing = enabled_run["timings"][name]
+        assert timing["count"] == count
+        assert timing["buckets"][-1][1] == count
+        assert timing["sum"] > 0
+
+
+def test_enabled_prometheus_export(enabled_run):
+    samples = _samples(enabled_run["prometheus"])
+    assert samples['siemens_ix_calls_total{function="get_colors"}'] == 5
+    assert samples['siemens_ix_calls_total{function="create_theme"}'] == 2
+    assert samples['siemens_ix_call_duration_seconds_count{function="create_theme"}'] == 2
+    assert samples['siemens_ix_call_duration_seconds_bucket{function="create_theme",le="+Inf"}'] == 2
+    # Outside of a server there are no sessions
+    assert samples["siemens_ix_sessions"] == 0
+
+
+@pytest.mark.parametrize("value", ["0", "", "false", "off"])
+def test_disabled_by_environment(value):
+    env = dict(os.environ, **{ENV_VAR: value})
+    script = (
+        "import panel_siemens_ix as ix\n"
+        "from panel_siemens_ix.instrumentation import ENABLED, METRICS\n"
+        "ix.get_colors(); ix.create_theme()\n"
+        "print(ENABLED, METRICS.calls())\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, env=env, check=True
+    )
+    assert result.stdout.strip() == "False {}"
+
+
+def test_histogram_buckets(metrics):
+    bounds_ns = [int(bound * 1e9) for bound in BUCKETS]
+    # On a bucket bound (le is inclusive), just above it and beyond the last bound
+    durations = [bounds_ns[0], bounds_ns[0] + 1, bounds_ns[3], 2 * 10**9]
+    for duration in durations:
+        metrics.record("f", duration)
+
+    timing = metrics.timings()["f"]
+    assert timing["count"] == 4
+    assert timing["sum"] == pytest.approx(sum(durations) / 1e9)
+    bounds = [bound for bound, _ in timing["buckets"]]
+    assert bounds == list(BUCKETS) + [float("inf")]
+    cumulative = [count for _, count in timing["buckets"]]
+    expected = [sum(d <= bound for d in durations) for bound in bounds_ns] + [4]
+    assert cumulative == expected
+    assert cumulative[:5] == [1, 2, 2, 3, 3]
+
+
+def test_reset(metrics):
+    metrics.record("f", 10)
+    metrics.reset()
+    assert metrics.calls() == {}
+    assert metrics.timings() == {}
+
+
+def test_session_attribution(monkeypatch, metrics):
+    first, second = _Document("first"), _Document("second")
+    current = {"document": first}
+    monkeypatch.setattr(instrumentation, "_current_document", lambda: current["document"])
+
+    metrics.record("get_colors", 10)
+    metrics.record("get_colors", 10)
+    metrics.record("create_theme", 10)
+    current["document"] = second
+    metrics.record("get_colors", 10)
+    current["document"] = None
+    metrics.record("get_colors", 10)
+
+    assert metrics.calls() == {"get_colors": 4, "create_theme": 1}
+    assert metrics.session_calls(first) == {"get_colors": 2, "create_theme": 1}
+    assert metrics.session_calls(second) == {"get_colors": 1}
+    # Outside of a session there is nothing to attribute
+    assert metrics.session_calls() == {}
+    current["document"] = second
+    assert metrics.session_calls() == {"get_colors": 1}
+    assert sorted(metrics.sessions()) == [
+        ("first", {"get_colors": 2, "create_theme": 1}),
+        ("second", {"get_colors": 1}),
+    ]
+
+    samples = _samples(metrics.prometheus())
+    assert samples["siemens_ix_sessions"] == 2
+    assert samples['siemens_ix_session_calls_max{function="get_colors"}'] == 2
+    assert samples['siemens_ix_session_calls_max{function="create_theme"}'] == 1
+
+    # Destroyed documents are dropped
+    current["document"] = None
+    del first
+    gc.collect()
+    assert metrics.sessions() == [("second", {"get_colors": 1})]
+    assert metrics.calls() == {"get_colors": 4, "create_theme": 1}
+
+
+def test_prometheus_text(metrics):
+    metrics.record("get_colors", 2_000)
+    metrics.record("get_colors", 200_000)
+    text = metrics.prometheus()
+
+    assert text.endswith("\n")
+    lines = text.splitlines()
+    assert "# TYPE siemens_ix_calls_total counter" in lines
+    assert "# TYPE siemens_ix_call_duration_seconds histogram" in lines
+    assert "# TYPE siemens_ix_sessions gauge" in lines
+    assert "# TYPE siemens_ix_cache_hits_total counter" in lines
+
+    samples = _samples(text)
+    assert samples['siemens_ix_calls_total{function="get_colors"}'] == 2
+    assert samples['siemens_ix_call_duration_seconds_bucket{function="get_colors",le="1e-06"}'] == 0
+    assert samples['siemens_ix_call_duration_seconds_bucket{function="get_colors",le="5e-06"}'] == 1
+    assert samples['siemens_ix_call_duration_seconds_bucket{function="get_colors",le="0.0005"}'] == 2
+    assert samples['siemens_ix_call_duration_seconds_bucket{function="get_colors",le="+Inf"}'] == 2
+    assert samples['siemens_ix_call_duration_seconds_sum{function="get_colors"}'] == pytest.approx(
+        202e-6
+    )
+    assert samples['siemens_ix_call_duration_seconds_count{function="get_colors"}'] == 2
+    assert 'siemens_ix_cache_hits_total{cache="categorical_palette"}' in samples
+    assert 'siemens_ix_cache_misses_total{cache="categorical_palette"}' in samples
+
+
+def test_metrics_route(monkeypatch, metrics):
+    from tornado.httpclient import AsyncHTTPClient
+    from tornado.httpserver import HTTPServer
+    from tornado.testing import bind_unused_port
+    from tornado.web import Application
+
+    monkeypatch.setattr(instrumentation, "METRICS", metrics)
+    metrics.record("create_theme", 1_000)
+    path, handler = metrics_route("/stats")
+    assert path == "/stats"
+
+    async def fetch():
+        sock, port = bind_unused_port()
+        server = HTTPServer(Application([(path, handler)]))
+        server.add_sockets([sock])
+        try:
+            return await AsyncHTTPClient().fetch(f"http://127.0.0.1:{port}{path}")
+        finally:
+            server.stop()
+
+    response = asyncio.run(fetch())
+    assert response.code == 200
+    assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+    assert response.body.decode() == metrics.prometheus()
+    assert _samples(response.body.decode())['siemens_ix_calls_total{function="create_theme"}'] == 1
@@ -0,0 +1,69 @@
+"""The palettes of panel_siemens_ix.colors against the compiled iX tokens."""
+
+import dataclasses
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import panel_siemens_ix.colors as colors_module
+
+COLORS_DIR = Path(__file__).parents[1] / "colors"
+sys.path.insert(0, str(COLORS_DIR))
+
+from extract_colors import check_palettes, palette_token  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    "group, key, token",
+    [
+        ("primary", "main", "theme-color-primary"),
+        ("primary", "hover", "theme-color-primary--hover"),
+        ("error", "contrast", "theme-color-alarm--contrast"),
+        ("text", "secondary", "theme-color-soft-text"),
+        ("background", "paper", "theme-color-2"),
+        ("border", "x-weak", "theme-color-x-weak-bdr"),
+        ("component", "3", "theme-color-component-3"),
+        ("chart", "4-40", "theme-chart-4-40"),
+    ],
+)
+def test_palette_token(group, key, token):
+    assert palette_token(group, key) == token
+
+
+def test_palettes_match_tokens():
+    assert check_palettes() == []
+
+
+def test_check_reports_drift(monkeypatch):
+    original = colors_module.get_colors
+
+    def drifted(mode="light"):
+        palette = original(mode)
+        primary = dict(palette.primary, hover="#123456")
+        return dataclasses.replace(palette, primary=primary)
+
+    monkeypatch.setattr(colors_module, "get_colors", drifted)
+    problems = check_palettes()
+    assert [problem.split(",")[0] for problem in problems] == [
+        "light: primary.hover is #123456",
+        "dark: primary.hover is #123456",
+    ]
+
+
+def test_check_reports_outdated_tokens(tmp_path):
+    json_path = tmp_path / "ix_tokens.json"
+    compiled = (COLORS_DIR / "ix_tokens.json").read_text()
+    json_path.write_text(compiled.replace('"compiler": "', '"compiler": "0'))
+    assert check_palettes(json_path=json_path) == ["ix_tokens.json is outdated"]
+    assert check_palettes(json_path=tmp_path / "missing.json") == ["missing.json is missing"]
+
+
+def test_check_cli():
+    result = subprocess.run(
+        [sys.executable, str(COLORS_DIR / "extract_colors.py"), "--check"],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
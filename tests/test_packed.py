@@ -0,0 +1,120 @@
+"""PackedPalette round trips and read-only arrays."""
+
+import numpy as np
+import pytest
+
+from panel_siemens_ix.colors import get_colors, get_packed_colors
+from panel_siemens_ix.conversion import parse_color, to_hex
+from panel_siemens_ix.packed import PackedGroup, PackedPalette
+
+MODES = ["light", "dark"]
+
+
+def _expected(mode):
+    """The palette of a mode with colors normalized to lowercase hex."""
+    return {
+        group: {name: to_hex(color) for name, color in colors.items()}
+        for group, colors in get_colors(mode).to_dict().items()
+    }
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_from_palette_round_trip(mode):
+    palette = get_colors(mode)
+    packed = PackedPalette.from_palette(palette, mode=mode)
+    expected = _expected(mode)
+
+    assert packed.mode == mode
+    assert packed.to_dict() == expected
+    assert list(packed.groups) == list(expected)
+    assert len(packed) == sum(len(colors) for colors in expected.values())
+    assert packed.nbytes == len(packed) * 4
+    for group, colors in expected.items():
+        view = getattr(packed, group)
+        assert isinstance(view, PackedGroup)
+        assert list(view) == list(colors) and len(view) == len(colors)
+        for name, color in colors.items():
+            assert view[name] == color
+            assert packed[group, name] == color
+            row = packed.rgba[packed.index[group, name]]
+            r, g, b, alpha = parse_color(getattr(palette, group)[name])
+            assert row.tolist() == [r, g, b, round(alpha * 255)]
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_from_mapping_and_shared_instance(mode):
+    expected = _expected(mode)
+    assert PackedPalette.from_palette(get_colors(mode).to_dict()).to_dict() == expected
+    assert get_packed_colors(mode).to_dict() == expected
+    assert get_packed_colors(mode) is get_packed_colors(mode)
+
+
+def test_hex_normalization():
+    packed = PackedPalette.from_palette(
+        {"a": {"upper": "#1491EB", "short": "#fff", "rgba": "rgba(255,255,255,0.45)"}}
+    )
+    assert packed.to_dict() == {"a": {"upper": "#1491eb", "short": "#ffffff", "rgba": "#ffffff73"}}
+    assert packed.hex() is packed.hex()
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_arrays_are_read_only(mode):
+    packed = PackedPalette.from_palette(get_colors(mode), mode=mode)
+    assert not packed.rgba.flags.writeable
+    with pytest.raises(ValueError):
+        packed.rgba[0, 0] = 1
+    for view in packed.groups.values():
+        assert not view.rgba.flags.writeable
+        with pytest.raises(ValueError):
+            view.rgba[...] = 0
+    for derived in (packed.with_alpha(0.5), packed.mix("#000000", 0.5)):
+        assert not derived.rgba.flags.writeable
+    assert not get_packed_colors(mode).rgba.flags.writeable
+
+    # Groups and the index cannot be replaced either
+    with pytest.raises(TypeError):
+        packed.groups["primary"] = packed.primary
+    with pytest.raises(TypeError):
+        packed.index["primary", "main"] = 0
+    with pytest.raises(TypeError):
+        packed.primary["main"] = "#ff0000"
+    assert packed.to_dict() == _expected(mode)
+
+
+def test_group_rgba_view_and_gather():
+    packed = PackedPalette.from_palette(
+        {"a": {"x": "#010203", "y": "#040506"}, "b": {"z": "#070809"}}
+    )
+    # Contiguous groups are views into the palette array
+    assert np.shares_memory(packed.a.rgba, packed.rgba)
+    assert packed.a.rgba.tolist() == [[1, 2, 3, 255], [4, 5, 6, 255]]
+
+    keys = [("a", "x"), ("b", "z"), ("a", "y")]
+    shuffled = PackedPalette(packed.rows(keys), keys)
+    assert shuffled.a.rgba.tolist() == [[1, 2, 3, 255], [4, 5, 6, 255]]
+    assert not shuffled.a.rgba.flags.writeable
+    assert shuffled.to_dict() == {"a": {"x": "#010203", "y": "#040506"}, "b": {"z": "#070809"}}
+
+
+def test_writable_input_is_copied():
+    rgba = np.array([[1, 2, 3, 255], [4, 5, 6, 128]], dtype=np.uint8)
+    packed = PackedPalette(rgba, [("a", "x"), ("a", "y")])
+    rgba[0, 0] = 99
+    assert packed["a", "x"] == "#010203"
+    assert packed["a", "y"] == "#04050680"
+    assert not packed.rgba.flags.writeable and rgba.flags.writeable
+
+
+def test_invalid_shape():
+    with pytest.raises(ValueError):
+        PackedPalette(np.zeros((2, 3)), [("a", "x"), ("a", "y")])
+    with pytest.raises(ValueError):
+        PackedPalette(np.zeros((2, 4)), [("a", "x")])
+
+
+def test_missing_group():
+    packed = get_packed_colors("light")
+    with pytest.raises(AttributeError):
+        packed.nonexistent
+    with pytest.raises(KeyError):
+        packed.primary["nonexistent"]
@@ -0,0 +1,29 @@
+"""The shipped binary palette file must match the palettes and gradients."""
+
+import numpy as np
+
+from panel_siemens_ix.colors import _continuous_cmap_stops, get_colors
+from panel_siemens_ix.gradients import three_part_gradient
+from panel_siemens_ix.packed import PackedPalette
+from panel_siemens_ix.palette_file import check_palette_file, load_palette_file
+
+
+def test_palette_file_is_current():
+    # Rebuild with `python -m panel_siemens_ix.palette_file` if this fails
+    assert check_palette_file() == []
+
+
+def test_palette_file_is_loaded():
+    # None means the loader ignores the file and computes everything
+    assert load_palette_file() is not None
+
+
+def test_palette_file_contents():
+    palette_file = load_palette_file()
+    for mode in ("light", "dark"):
+        expected = PackedPalette.from_palette(get_colors(mode), mode=mode)
+        np.testing.assert_array_equal(palette_file.palette(mode).rgba, expected.rgba)
+    lut = palette_file.lut(True, 256, "srgb")
+    np.testing.assert_array_equal(
+        lut, three_part_gradient(_continuous_cmap_stops(True), 256, "srgb")
+    )
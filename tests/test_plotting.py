@@ -0,0 +1,18 @@
+"""configure(plotting=True) registers the plotting defaults of the chosen mode."""
+
+import pytest
+
+from panel_siemens_ix import configure
+from panel_siemens_ix.plotting import _style
+
+
+@pytest.mark.parametrize("mode", ["dark", "light"])
+def test_plotting_mode_sets_holoviews_cycle(mode):
+    hv = pytest.importorskip("holoviews")
+    configure(plotting=True, plotting_mode=mode)
+    assert hv.Cycle.default_cycles["default_colors"] == list(_style(mode)["palette"])
+
+
+def test_plotting_mode_validated():
+    with pytest.raises(ValueError):
+        configure(plotting=True, plotting_mode="sepia")
@@ -0,0 +1,120 @@
+"""Memoized, immutable themes and the patches between them."""
+
+import pytest
+
+from panel_siemens_ix import create_theme, merge_theme, theme_diff
+from panel_siemens_ix.frozen import FrozenDict, thaw
+
+
+@pytest.mark.parametrize("mode", ["light", "dark"])
+def test_create_theme_is_frozen_and_shared(mode):
+    theme = create_theme(mode)
+    assert isinstance(theme, FrozenDict)
+    assert create_theme(mode) is theme
+    with pytest.raises(TypeError):
+        theme["palette"]["primary"]["main"] = "#ff0000"
+
+
+def test_overrides_and_thaw():
+    theme = create_theme("dark", overrides={"palette": {"primary": {"main": "#ff9000"}}})
+    assert theme["palette"]["primary"]["main"] == "#ff9000"
+    assert theme["typography"] is create_theme("dark")["typography"]
+    editable = thaw(theme)
+    editable["palette"]["primary"]["main"] = "#ff0000"
+    assert theme["palette"]["primary"]["main"] == "#ff9000"
+
+
+BASE = {
+    "palette": {"mode": "light", "primary": {"main": "#007993", "contrastText": "#ffffff"}},
+    "typography": {"fontSize": 14, "h1": {"fontWeight": 600}},
+    "shape": {"borderRadius": 4},
+}
+
+
+def test_merge_shares_unchanged_subtrees():
+    base = merge_theme({}, BASE)
+    merged = merge_theme(base, {"palette": {"primary": {"main": "#ff9000"}}})
+    assert merged["palette"]["primary"]["main"] == "#ff9000"
+    assert merged["palette"]["primary"]["contrastText"] == "#ffffff"
+    # Only the dicts along the changed path are copied
+    assert merged is not base
+    assert merged["palette"] is not base["palette"]
+    assert merged["typography"] is base["typography"]
+    assert merged["shape"] is base["shape"]
+    assert merged["palette"]["mode"] is base["palette"]["mode"]
+    assert isinstance(merged["palette"]["primary"], FrozenDict)
+    assert base["palette"]["primary"]["main"] == "#007993"
+
+
+def test_merge_none_removes_key():
+    base = merge_theme({}, BASE)
+    merged = merge_theme(base, {"shape": None, "typography": {"h1": None}})
+    assert "shape" not in merged
+    assert merged["typography"] == {"fontSize": 14}
+    assert merged["palette"] is base["palette"]
+    # Removing a missing key is a no-op
+    assert merge_theme(base, {"spacing": None, "typography": {"h2": None}}) is base
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {},
+        {"palette": {}},
+        {"palette": {"mode": "light"}},
+        {"typography": {"fontSize": 14, "h1": {"fontWeight": 600}}},
+    ],
+)
+def test_merge_without_changes_returns_base(overrides):
+    base = merge_theme({}, BASE)
+    assert merge_theme(base, overrides) is base
+
+
+def test_merge_distinguishes_equal_values_of_other_types():
+    base = merge_theme({}, BASE)
+    merged = merge_theme(base, {"typography": {"fontSize": 14.0}})
+    assert merged is not base
+    assert type(merged["typography"]["fontSize"]) is float
+
+
+def test_merge_accepts_plain_dicts():
+    merged = merge_theme(BASE, {"shape": {"borderRadius": 0}})
+    assert isinstance(merged, FrozenDict) and isinstance(merged["palette"], FrozenDict)
+    assert merged["shape"] == {"borderRadius": 0}
+    assert BASE["shape"] == {"borderRadius": 4}
+
+
+def test_diff_is_minimal():
+    a = merge_theme({}, BASE)
+    b = merge_theme(a, {"palette": {"primary": {"main": "#ff9000"}}, "shape": None, "zIndex": 3})
+    patch = theme_diff(a, b)
+    assert patch == {"palette": {"primary": {"main": "#ff9000"}}, "shape": None, "zIndex": 3}
+    assert isinstance(patch, FrozenDict)
+    assert theme_diff(a, a) == {}
+    assert theme_diff(a, merge_theme({}, BASE)) == {}
+
+
+@pytest.mark.parametrize(
+    "a, b",
+    [
+        (create_theme("light"), create_theme("dark")),
+        (create_theme("dark"), create_theme("light")),
+        (
+            create_theme("light"),
+            create_theme("light", {"palette": {"primary": {"main": "#ff9000"}}}),
+        ),
+        (BASE, {"palette": {"mode": "dark"}, "shape": {"borderRadius": 0, "extra": 1}}),
+        (BASE, {}),
+        ({}, BASE),
+    ],
+)
+def test_merge_applies_diff(a, b):
+    patch = theme_diff(a, b)
+    assert merge_theme(a, patch) == b
+    assert theme_diff(merge_theme(a, patch), b) == {}
+
+
+def test_empty_patch_returns_base():
+    theme = create_theme("dark")
+    assert merge_theme(theme, theme_diff(theme, theme)) is theme
+    assert merge_theme(theme, {}) is theme
@@ -0,0 +1,398 @@
+"""Building blocks of the time series dashboard example."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parents[1] / "examples" / "advanced"))
+
+from timeseries_engine import (  # noqa: E402
+    AGGREGATIONS,
+    FREQUENCIES,
+    RingBuffer,
+    RollingStats,
+    RollupStore,
+    _frequency_span,
+    compact_frame,
+    downsample,
+    load_frame,
+    lttb_indices,
+    minmax_indices,
+    save_frame,
+)
+
+
+@pytest.fixture(scope="module")
+def sensor_frame():
+    rng = np.random.default_rng(0)
+    times = pd.date_range("2024-01-03 05:17", periods=20 * 144, freq="10min")
+    values = rng.normal(20, 5, (len(times), 2))
+    values[100, 0] = np.nan
+    frame = pd.DataFrame(values, columns=["temperature", "humidity"])
+    frame.insert(0, "timestamp", times)
+    return frame
+
+
+@pytest.fixture(scope="module")
+def store(sensor_frame):
+    return RollupStore(sensor_frame)
+
+
+@pytest.mark.parametrize(
+    "frequency, span",
+    [("10s", "10s"), ("min", "1min"), ("h", "1h"), ("6h", "6h"), ("D", "1D"),
+     ("W", "7D"), ("W-MON", "7D"), ("2W", "14D")],
+)
+def test_frequency_span(frequency, span):
+    assert _frequency_span(frequency) == pd.Timedelta(span)
+
+
+def test_rollups_of_every_frequency(store):
+    # All frequencies are coarser than the 10 minute sampling interval
+    assert store.interval == pd.Timedelta("10min")
+    assert set(store._rollup_times) == set(FREQUENCIES)
+
+
+WINDOWS = [
+    (None, None),
+    ("2024-01-04 13:31", "2024-01-09 02:00"),
+    ("2024-01-08 00:00", "2024-01-15 23:59"),
+    ("2023-12-01", "2024-01-05"),
+    ("2024-01-20", None),
+]
+
+
+@pytest.mark.parametrize("start, end", WINDOWS)
+def test_raw_window(store, sensor_frame, start, end):
+    times = sensor_frame["timestamp"]
+    mask = np.ones(len(times), dtype=bool)
+    if start is not None:
+        mask &= times >= pd.Timestamp(start)
+    if end is not None:
+        mask &= times <= pd.Timestamp(end)
+    pd.testing.assert_frame_equal(store.window(start, end), sensor_frame[mask])
+
+
+@pytest.mark.parametrize("start, end", WINDOWS)
+@pytest.mark.parametrize("frequency", FREQUENCIES)
+@pytest.mark.parametrize("aggregation", AGGREGATIONS)
+def test_rollup_window_matches_resample(store, sensor_frame, start, end, frequency, aggregation):
+    expected = sensor_frame.set_index("timestamp").resample(frequency).agg(aggregation)
+    labels = expected.index
+    if start is not None:
+        # The period that start falls into, which begins at or before it
+        before = labels[labels <= pd.Timestamp(start)]
+        expected = expected.loc[before.max() if len(before) else labels[0]:]
+    if end is not None:
+        expected = expected.loc[:pd.Timestamp(end)]
+    result = store.window(start, end, frequency=frequency, aggregation=aggregation)
+    pd.testing.assert_frame_equal(
+        result.set_index("timestamp"), expected, check_freq=False
+    )
+
+
+def test_last(store, sensor_frame):
+    window = store.last(pd.Timedelta(days=2), frequency="D", aggregation="max")
+    assert window["timestamp"].iloc[0] <= store.end - pd.Timedelta(days=2)
+    assert window["timestamp"].iloc[-1] == store.end.floor("D")
+    raw = store.last(pd.Timedelta(hours=1))
+    assert len(raw) == 7
+    assert raw["timestamp"].iloc[-1] == sensor_frame["timestamp"].iloc[-1]
+
+
+def test_unknown_frequency_and_aggregation(store):
+    with pytest.raises(ValueError):
+        store.window(frequency="3h")
+    with pytest.raises(ValueError):
+        store.window(frequency="h", aggregation="sum")
+
+
+def _random_walk(n, seed=1):
+    rng = np.random.default_rng(seed)
+    x = np.cumsum(rng.uniform(0.5, 1.5, n))
+    y = np.cumsum(rng.normal(0, 1, n))
+    return x, y
+
+
+def _reference_lttb(x, y, n_out):
+    """Textbook LTTB, one bucket at a time."""
+    n = len(x)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    selected = [0]
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            nxt = slice(edges[i + 1], edges[i + 2])
+            cx, cy = x[nxt].mean(), y[nxt].mean()
+        else:
+            cx, cy = x[-1], y[-1]
+        ax, ay = x[selected[-1]], y[selected[-1]]
+        area = np.abs((ax - cx) * (y[lo:hi] - ay) - (ax - x[lo:hi]) * (cy - ay))
+        selected.append(lo + int(np.argmax(area)))
+    return np.array(selected + [n - 1])
+
+
+def _buckets(x, n_buckets):
+    edges = np.linspace(x[0], x[-1], n_buckets + 1)[1:-1]
+    return np.searchsorted(edges, x, "right")
+
+
+@pytest.mark.parametrize("n, n_out", [(1000, 100), (5000, 300), (100_000, 500)])
+def test_lttb_selects_n_out_sorted_points(n, n_out):
+    x, y = _random_walk(n)
+    idx = lttb_indices(x, y, n_out)
+    assert len(idx) == n_out
+    assert idx[0] == 0 and idx[-1] == n - 1
+    assert (np.diff(idx) > 0).all()
+
+
+def test_lttb_matches_reference():
+    # Small enough to skip the min-max preselection
+    x, y = _random_walk(2000)
+    np.testing.assert_array_equal(lttb_indices(x, y, 400), _reference_lttb(x, y, 400))
+
+
+@pytest.mark.parametrize("n_out", [0, 1, 2, 50, 51])
+def test_lttb_keeps_everything_when_not_reducing(n_out):
+    x, y = _random_walk(50)
+    np.testing.assert_array_equal(lttb_indices(x, y, n_out), np.arange(50))
+
+
+@pytest.mark.parametrize("n, n_buckets", [(1000, 20), (100_000, 300)])
+def test_minmax_keeps_bucket_extrema(n, n_buckets):
+    x, y = _random_walk(n)
+    idx = minmax_indices(x, y, n_buckets)
+    assert (np.diff(idx) > 0).all()
+    assert idx[0] == 0 and idx[-1] == n - 1
+    assert len(idx) <= 2 * n_buckets + 2
+    buckets = _buckets(x, n_buckets)
+    for bucket in np.unique(buckets):
+        kept = y[idx[buckets[idx] == bucket]]
+        in_bucket = y[buckets == bucket]
+        assert in_bucket.min() in kept and in_bucket.max() in kept
+
+
+@pytest.mark.parametrize("n_buckets", [0, 25, 100])
+def test_minmax_keeps_everything_when_not_reducing(n_buckets):
+    x, y = _random_walk(50)
+    np.testing.assert_array_equal(minmax_indices(x, y, n_buckets), np.arange(50))
+
+
+def test_nan_values():
+    x, y = _random_walk(10_000)
+    y[::7] = np.nan
+    y[5000:5400] = np.nan  # whole buckets without values
+    idx = minmax_indices(x, y, 100)
+    buckets = _buckets(x, 100)
+    for bucket in np.unique(buckets):
+        kept = y[idx[buckets[idx] == bucket]]
+        in_bucket = y[buckets == bucket]
+        if np.isfinite(in_bucket).any():
+            assert np.nanmin(in_bucket) in kept and np.nanmax(in_bucket) in kept
+        else:
+            assert len(kept) >= 1
+
+    idx = lttb_indices(x, y, 200)
+    assert len(idx) == 200 and (np.diff(idx) > 0).all()
+    outside_gap = (idx < 5000) | (idx >= 5400)
+    assert np.isfinite(y[idx[outside_gap][1:-1]]).all()
+
+
+@pytest.mark.parametrize("method", ["lttb", "minmax", "none"])
+def test_datetime_x(method):
+    x, y = _random_walk(20_000)
+    times = pd.Timestamp("2024-01-01").to_datetime64() + (x * 1e9).astype("timedelta64[ns]")
+    np.testing.assert_array_equal(
+        downsample(times, y, 300, method),
+        downsample(times.view(np.int64), y, 300, method),
+    )
+
+
+def test_downsample_methods():
+    x, y = _random_walk(10_000)
+    np.testing.assert_array_equal(downsample(x, y, 300, "lttb"), lttb_indices(x, y, 300))
+    np.testing.assert_array_equal(downsample(x, y, 300, "minmax"), minmax_indices(x, y, 300))
+    np.testing.assert_array_equal(downsample(x, y, 300, "none"), np.arange(10_000))
+    with pytest.raises(ValueError):
+        downsample(x, y, 300, "average")
+
+
+def _rows(start, n):
+    return pd.DataFrame({
+        "timestamp": pd.date_range("2024-01-01", periods=start + n, freq="min", unit="ns")[start:],
+        "value": np.arange(start, start + n, dtype=np.float32),
+    })
+
+
+def _ring_buffer(capacity):
+    return RingBuffer({"timestamp": np.dtype("datetime64[ns]"), "value": np.float32}, capacity)
+
+
+@pytest.mark.parametrize("batches", [[3, 4, 5, 2], [9, 1, 1, 9], [1] * 25, [10, 10], [4, 13, 2]])
+def test_ring_buffer_keeps_latest_rows(batches):
+    buffer = _ring_buffer(10)
+    start = 0
+    for n in batches:
+        buffer.append(_rows(start, n))
+        start += n
+        expected = _rows(0, start).iloc[-10:].reset_index(drop=True)
+        assert len(buffer) == len(expected)
+        assert buffer.total == start
+        pd.testing.assert_frame_equal(buffer.to_frame(), expected)
+        assert buffer.last("value") == start - 1
+
+
+def test_ring_buffer_overfill_in_one_append():
+    buffer = _ring_buffer(10)
+    buffer.append(_rows(0, 3))
+    buffer.append(_rows(3, 25))
+    assert buffer.total == 28
+    np.testing.assert_array_equal(buffer.column("value"), np.arange(18, 28))
+
+
+def test_ring_buffer_views_and_copies():
+    buffer = _ring_buffer(10)
+    buffer.append(_rows(0, 6))
+    # Not wrapped: a view of the storage
+    assert np.shares_memory(buffer.column("value"), buffer.columns["value"])
+    buffer.append(_rows(6, 7))
+    # Wrapped: a copy, oldest first
+    column = buffer.column("value")
+    assert not np.shares_memory(column, buffer.columns["value"])
+    np.testing.assert_array_equal(column, np.arange(3, 13))
+    frame = buffer.to_frame()
+    buffer.append(_rows(13, 10))
+    np.testing.assert_array_equal(frame["value"], np.arange(3, 13))
+
+
+def test_ring_buffer_empty_and_invalid():
+    buffer = _ring_buffer(4)
+    assert len(buffer) == 0 and len(buffer.to_frame()) == 0
+    with pytest.raises(IndexError):
+        buffer.last("value")
+    with pytest.raises(ValueError):
+        _ring_buffer(0)
+
+
+def _expected_rolling(series, window):
+    # The stats keep samples at exactly ``window`` before the newest one
+    rolling = series.rolling(window, closed="both") if window else series.expanding()
+    return rolling.agg(["min", "max", "mean", "std"])
+
+
+def _stream(stats, series, batches):
+    """Feed ``series`` in batches, yielding the position after each one."""
+    times = series.index.to_numpy()
+    values = series.to_numpy()
+    position = 0
+    for n in batches:
+        stats.extend(times[position : position + n], values[position : position + n])
+        position += n
+        yield position - 1
+
+
+@pytest.mark.parametrize("window", ["30min", "2h", None])
+@pytest.mark.parametrize("nan", [False, True])
+def test_rolling_stats_match_pandas(window, nan):
+    rng = np.random.default_rng(2)
+    n = 2000
+    times = pd.Timestamp("2024-01-01") + pd.to_timedelta(
+        np.cumsum(rng.integers(1, 120, n)), unit="s"
+    )
+    values = rng.normal(0, 10, n)
+    if nan:
+        values[rng.random(n) < 0.1] = np.nan
+    series = pd.Series(values, index=times.as_unit("ns"))
+    expected = _expected_rolling(series, window)
+    batches = rng.integers(1, 60, n)
+
+    stats = RollingStats(window)
+    for position in _stream(stats, series, batches):
+        if position >= n:
+            break
+        row = expected.iloc[position]
+        snapshot = stats.snapshot()
+        for name in ("min", "max", "mean", "std"):
+            np.testing.assert_allclose(snapshot[name], row[name], rtol=1e-9, atol=1e-9)
+        last_finite = series.iloc[: position + 1].dropna()
+        if len(last_finite):
+            assert snapshot["current"] == last_finite.iloc[-1]
+
+
+def test_rolling_stats_evict_whole_window():
+    stats = RollingStats("10min")
+    start = np.datetime64("2024-01-01T00:00", "ns")
+    stats.extend(start + np.arange(5) * np.timedelta64(1, "m"), np.arange(5.0))
+    assert (stats.min, stats.max, stats.count) == (0.0, 4.0, 5)
+    # Everything before is older than the window now
+    stats.append(start + np.timedelta64(1, "h"), 100.0)
+    assert (stats.min, stats.max, stats.mean, stats.count) == (100.0, 100.0, 100.0, 1)
+    assert np.isnan(stats.std)
+
+
+def test_rolling_stats_constant_input():
+    stats = RollingStats("1h")
+    times = np.datetime64("2024-01-01", "ns") + np.arange(500) * np.timedelta64(30, "s")
+    for batch in np.array_split(np.arange(500), 37):
+        stats.extend(times[batch], np.full(len(batch), 3.7))
+        assert stats.min == stats.max == 3.7
+        assert stats.mean == pytest.approx(3.7)
+        assert stats.std == pytest.approx(0.0, abs=1e-12) or stats.count == 1
+
+
+@pytest.fixture
+def compact(sensor_frame):
+    times = sensor_frame["timestamp"].to_numpy().astype("datetime64[ns]").view(np.int64)
+    values = np.asfortranarray(sensor_frame[["temperature", "humidity"]].to_numpy(np.float32))
+    return compact_frame(times, values, ["temperature", "humidity"])
+
+
+def _is_memory_mapped(array):
+    while array is not None:
+        if isinstance(array, np.memmap):
+            return True
+        array = array.base
+    return False
+
+
+def _assert_compact(frame, reference):
+    assert list(frame.columns) == ["timestamp", "temperature", "humidity"]
+    assert frame["timestamp"].dtype == np.dtype("datetime64[ns]")
+    assert (frame.dtypes.iloc[1:] == np.float32).all()
+    pd.testing.assert_series_equal(
+        frame["timestamp"], reference["timestamp"].astype("datetime64[ns]")
+    )
+    np.testing.assert_array_equal(
+        frame[["temperature", "humidity"]].to_numpy(),
+        reference[["temperature", "humidity"]].to_numpy(np.float32),
+    )
+
+
+def test_compact_frame_wraps_without_copying(sensor_frame):
+    times = sensor_frame["timestamp"].to_numpy().astype("datetime64[ns]").view(np.int64)
+    values = np.asfortranarray(sensor_frame[["temperature", "humidity"]].to_numpy(np.float32))
+    frame = compact_frame(times, values, ["temperature", "humidity"])
+    _assert_compact(frame, sensor_frame)
+    assert np.shares_memory(frame["temperature"].to_numpy(), values)
+    assert np.shares_memory(frame["timestamp"].to_numpy(), times)
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_save_and_load_frame(tmp_path, sensor_frame, compact, mmap):
+    save_frame(compact, tmp_path)
+    assert np.load(tmp_path / "timestamps.npy").dtype == np.int64
+    assert np.load(tmp_path / "values.npy").dtype == np.float32
+    loaded = load_frame(tmp_path, mmap=mmap)
+    _assert_compact(loaded, sensor_frame)
+    pd.testing.assert_frame_equal(loaded, compact)
+    for column in ("timestamp", "humidity"):
+        assert _is_memory_mapped(loaded[column].to_numpy()) == mmap
+
+
+def test_save_float64_frame(tmp_path, sensor_frame):
+    # Frames in the original float64 layout are stored compact as well
+    save_frame(sensor_frame, tmp_path / "frame")
+    _assert_compact(load_frame(tmp_path / "frame"), sensor_frame)